@@ -12,7 +12,7 @@ from .core.types import (
 )
 from .core.abstractions import Algorithm, Backend, RateLimiter as RateLimiterABC
 from .algorithms.token_bucket import TokenBucketAlgorithm
-from .algorithms.sliding_window import SlidingWindowAlgorithm
+from .algorithms.sliding_window import SlidingWindowAlgorithm, SlidingWindowCounterAlgorithm
 from .algorithms.leaky_bucket import LeakyBucketAlgorithm
 from .algorithms.fixed_window import FixedWindowAlgorithm
 from .algorithms.gcra import GCRAAlgorithm
@@ -81,6 +81,7 @@ __all__ = [
     "RateLimiterABC",
     "TokenBucketAlgorithm",
     "SlidingWindowAlgorithm",
+    "SlidingWindowCounterAlgorithm",
     "LeakyBucketAlgorithm",
     "FixedWindowAlgorithm",
     "GCRAAlgorithm",
@@ -1,15 +1,105 @@
 import time
+import weakref
 try:
     import psutil
     PSUTIL_AVAILABLE = True
 except ImportError:
     PSUTIL_AVAILABLE = False
-from typing import Dict, Optional, Any, Callable, Union
-from threading import RLock
+from typing import Dict, Optional, Any, Callable, List, Tuple, Union
+from threading import Event, Lock, RLock, Thread, current_thread, local
 from collections import deque
 from .rate_limiter import RateLimiter
 from .core.types import RateLimitState
 
+class _ThreadCounter:
+    # Each thread only ever writes its own cell, so increments need no lock;
+    # readers sum the cells and subtract the baseline taken at the last reset.
+    # Cells of finished threads are folded into _retired so the list tracks live threads.
+    def __init__(self) -> None:
+        self._local = local()
+        self._cells: List[Tuple[Thread, List[int]]] = []
+        self._cells_lock = Lock()
+        self._retired = 0
+        self._baseline = 0
+
+    def add(self, n: int = 1) -> None:
+        cell = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = self._local.cell = [0]
+            with self._cells_lock:
+                self._prune()
+                self._cells.append((current_thread(), cell))
+        cell[0] += n
+
+    def _prune(self) -> None:
+        live = []
+        for thread, cell in self._cells:
+            if thread.is_alive():
+                live.append((thread, cell))
+            else:
+                self._retired += cell[0]
+        self._cells = live
+
+    def _total(self) -> int:
+        with self._cells_lock:
+            self._prune()
+            return self._retired + sum(cell[0] for _, cell in self._cells)
+
+    @property
+    def value(self) -> int:
+        return self._total() - self._baseline
+
+    def reset(self) -> None:
+        self._baseline = self._total()
+
+class _Adjuster:
+    # One daemon thread drives every live AdaptiveRateLimiter. Limiters are held weakly,
+    # and the thread exits once none remain; the next registration starts a new one.
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._limiters: "weakref.WeakSet[AdaptiveRateLimiter]" = weakref.WeakSet()
+        self._wake = Event()
+        self._thread: Optional[Thread] = None
+
+    def register(self, limiter: "AdaptiveRateLimiter") -> None:
+        with self._lock:
+            self._limiters.add(limiter)
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name="ratelink-adaptive", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def unregister(self, limiter: "AdaptiveRateLimiter") -> None:
+        with self._lock:
+            self._limiters.discard(limiter)
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                limiters = list(self._limiters)
+                if not limiters:
+                    self._thread = None
+                    return
+                self._wake.clear()
+            timeout = None
+            for limiter in limiters:
+                now = time.monotonic()
+                if limiter._next_adjust <= now:
+                    try:
+                        limiter._adjust()
+                    except Exception:
+                        pass
+                    now = time.monotonic()
+                    limiter._next_adjust = now + limiter.check_interval
+                wait = limiter._next_adjust - now
+                timeout = wait if timeout is None else min(timeout, wait)
+            # Drop the strong references before sleeping so unclosed limiters can be collected.
+            del limiters, limiter
+            self._wake.wait(timeout)
+
+_ADJUSTER = _Adjuster()
+
 class AdaptiveRateLimiter:
     def __init__(
         self,
@@ -40,9 +130,15 @@ class AdaptiveRateLimiter:
         self.check_interval = check_interval
         self.window_size = window_size
         self._request_results: deque = deque(maxlen=window_size)
-        self._request_latencies: deque = deque(maxlen=window_size)
-        self._last_check = time.time()
+        # Latency is an EWMA in integer microseconds with a Q16 smoothing factor; alpha = 2/(N+1)
+        # gives it roughly the centre of mass of an N-sample moving average.
+        self._alpha_q16 = max(1, (2 << 16) // (window_size + 1))
+        self._avg_latency_us = 0
+        self._latency_samples = 0
         self._lock = RLock()
+        # Guards the sample window and EWMA only, so recorders never wait on the psutil
+        # sample that adaptation takes under _lock.
+        self._samples_lock = Lock()
         self._limiter = RateLimiter(
             algorithm=algorithm,
             backend=backend,
@@ -50,34 +146,66 @@ class AdaptiveRateLimiter:
             limit=self.current_limit,
             window=window,
         )
-        self._total_requests = 0
-        self._total_errors = 0
+        self._total_requests = _ThreadCounter()
+        self._total_errors = _ThreadCounter()
         self._adaptations = 0
+        # Adaptation (including the blocking psutil sample) runs on the shared adjuster thread,
+        # so the request path only records samples and bumps thread-local counters.
+        self._next_adjust = time.monotonic() + check_interval
+        _ADJUSTER.register(self)
 
     def allow(self, key: str, weight: int = 1) -> bool:
-        with self._lock:
-            self._maybe_adapt()
-            self._total_requests += 1
-            return self._limiter.allow(key, weight=weight)
+        self._total_requests.add()
+        return self._limiter.allow(key, weight=weight)
 
     def record_success(self, latency: Optional[float] = None) -> None:
-        with self._lock:
+        with self._samples_lock:
             self._request_results.append(True)
             if latency is not None:
-                self._request_latencies.append(latency)
+                self._record_latency(latency)
 
     def record_error(self, latency: Optional[float] = None) -> None:
-        with self._lock:
+        self._total_errors.add()
+        with self._samples_lock:
             self._request_results.append(False)
-            self._total_errors += 1
             if latency is not None:
-                self._request_latencies.append(latency)
+                self._record_latency(latency)
+
+    def _record_latency(self, latency: float) -> None:
+        latency_us = int(latency * 1_000_000)
+        if self._latency_samples == 0:
+            self._avg_latency_us = latency_us
+        else:
+            self._avg_latency_us += ((latency_us - self._avg_latency_us) * self._alpha_q16) >> 16
+        if self._latency_samples < self.window_size:
+            self._latency_samples += 1
+
+    def _avg_latency(self) -> float:
+        return self._avg_latency_us / 1_000_000
+
+    def _sample_stats(self) -> Tuple[int, int, int, float]:
+        with self._samples_lock:
+            return (
+                len(self._request_results),
+                self._request_results.count(False),
+                self._latency_samples,
+                self._avg_latency(),
+            )
+
+    def close(self) -> None:
+        _ADJUSTER.unregister(self)
+
+    def __enter__(self) -> "AdaptiveRateLimiter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _adjust(self) -> None:
+        with self._lock:
+            self._maybe_adapt()
 
     def _maybe_adapt(self) -> None:
-        current_time = time.time()
-        if current_time - self._last_check < self.check_interval:
-            return
-        self._last_check = current_time
         should_reduce = False
         should_increase = False
         reason = []
@@ -96,16 +224,15 @@ class AdaptiveRateLimiter:
                     reason.append(f"Memory={memory.percent:.1f}%")
             except Exception:
                 pass
-        if len(self._request_results) >= 10:
-            error_count = sum(1 for r in self._request_results if not r)
-            error_rate = error_count / len(self._request_results)
+        samples, errors, latency_samples, avg_latency = self._sample_stats()
+        if samples >= 10:
+            error_rate = errors / samples
             if error_rate > self.error_threshold:
                 should_reduce = True
                 reason.append(f"ErrorRate={error_rate*100:.1f}%")
             elif error_rate < self.error_threshold / 2:
                 should_increase = True
-        if len(self._request_latencies) >= 10:
-            avg_latency = sum(self._request_latencies) / len(self._request_latencies)
+        if latency_samples >= 10:
             if avg_latency > self.latency_threshold:
                 should_reduce = True
                 reason.append(f"Latency={avg_latency:.2f}s")
@@ -144,22 +271,20 @@ class AdaptiveRateLimiter:
             self._limiter.reset(key)
 
             if key is None:
-                self._request_results.clear()
-                self._request_latencies.clear()
+                with self._samples_lock:
+                    self._request_results.clear()
+                    self._avg_latency_us = 0
+                    self._latency_samples = 0
                 self.current_limit = self.base_limit
-                self._total_requests = 0
-                self._total_errors = 0
+                self._total_requests.reset()
+                self._total_errors.reset()
 
     def get_metrics(self) -> Dict[str, Any]:
         with self._lock:
             error_rate = 0.0
-            if len(self._request_results) > 0:
-                error_count = sum(1 for r in self._request_results if not r)
-                error_rate = error_count / len(self._request_results)
-
-            avg_latency = 0.0
-            if len(self._request_latencies) > 0:
-                avg_latency = sum(self._request_latencies) / len(self._request_latencies)
+            samples, errors, _, avg_latency = self._sample_stats()
+            if samples > 0:
+                error_rate = errors / samples
 
             cpu_percent = 0.0
             memory_percent = 0.0
@@ -173,14 +298,14 @@ class AdaptiveRateLimiter:
             return {
                 "base_limit": self.base_limit,
                 "current_limit": self.current_limit,
-                "total_requests": self._total_requests,
-                "total_errors": self._total_errors,
+                "total_requests": self._total_requests.value,
+                "total_errors": self._total_errors.value,
                 "error_rate": error_rate,
                 "avg_latency": avg_latency,
                 "cpu_percent": cpu_percent,
                 "memory_percent": memory_percent,
                 "adaptations": self._adaptations,
-                "window_samples": len(self._request_results),
+                "window_samples": samples,
             }
 
     def set_thresholds(
@@ -1,5 +1,5 @@
 from .token_bucket import TokenBucketAlgorithm
-from .sliding_window import SlidingWindowAlgorithm
+from .sliding_window import SlidingWindowAlgorithm, SlidingWindowCounterAlgorithm
 from .leaky_bucket import LeakyBucketAlgorithm
 from .fixed_window import FixedWindowAlgorithm
 from .gcra import GCRAAlgorithm
@@ -8,6 +8,7 @@ from .hierarchical import HierarchicalTokenBucket, FairQueueingAlgorithm
 __all__ = [
     "TokenBucketAlgorithm",
     "SlidingWindowAlgorithm",
+    "SlidingWindowCounterAlgorithm",
     "LeakyBucketAlgorithm",
     "FixedWindowAlgorithm",
     "GCRAAlgorithm",
@@ -1,11 +1,19 @@
 import time
 from datetime import datetime, timedelta
 from threading import RLock
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from ..core.abstractions import Algorithm
 from ..core.types import RateLimitState
+from ..core.clock import (
+    NS_PER_SECOND, WALL_OFFSET_NS, seconds_to_ns, monotonic_to_datetime, monotonic_to_timestamp,
+)
+
+# Current window plus the previous one; older windows are dropped as the wheel turns.
+WHEEL_SIZE = 2
 
 class FixedWindowAlgorithm(Algorithm):
+    acquire_is_allow = True
+
     def __init__(self, limit: int, window_seconds: float) -> None:
         if limit <= 0:
             raise ValueError("limit must be positive")
@@ -13,79 +21,92 @@ class FixedWindowAlgorithm(Algorithm):
             raise ValueError("window_seconds must be positive")
         self.limit = limit
         self.window_seconds = window_seconds
-        self._windows: Dict[str, Tuple[int, float]] = {}
+        self._window_ns = seconds_to_ns(window_seconds)
+        self._wheel: List[Dict[str, int]] = [{} for _ in range(WHEEL_SIZE)]
+        self._window_id = -1
         self._lock = RLock()
 
-    def _get_window_start(self, current_time: float) -> float:
-        return (current_time // self.window_seconds) * self.window_seconds
+    def _advance_wheel(self, window_id: int) -> Dict[str, int]:
+        if window_id > self._window_id:
+            first = max(self._window_id + 1, window_id - WHEEL_SIZE + 1)
+            for stale_id in range(first, window_id + 1):
+                self._wheel[stale_id % WHEEL_SIZE].clear()
+            self._window_id = window_id
+        return self._wheel[self._window_id % WHEEL_SIZE]
+
+    def _window_of(self, now_ns: int) -> int:
+        # Windows are cut on wall-clock time (a 60 s window resets on the minute), then
+        # mapped back onto the monotonic clock through the offset.
+        return (now_ns + WALL_OFFSET_NS) // self._window_ns
 
-    def _get_current_window(self, key: str, current_time: float) -> Tuple[int, float]:
-        window_start = self._get_window_start(current_time)
-        if key not in self._windows:
-            return (0, window_start)
-        count, last_window_start = self._windows[key]
-        if window_start > last_window_start:
-            return (0, window_start)
+    def _window_start_ns(self, window_id: int) -> int:
+        return window_id * self._window_ns - WALL_OFFSET_NS
 
-        return (count, window_start)
+    def _get_current_window(self, key: str, now_ns: int) -> Tuple[int, int]:
+        window_id = self._window_of(now_ns)
+        counts = self._advance_wheel(window_id)
+        return (counts.get(key, 0), self._window_start_ns(window_id))
 
     def allow(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
         if weight <= 0:
             raise ValueError("weight must be positive")
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
+        window_id = (now_ns + WALL_OFFSET_NS) // self._window_ns
         with self._lock:
-            count, window_start = self._get_current_window(key, current_time)
-            if count + weight <= self.limit:
-                new_count = count + weight
-                self._windows[key] = (new_count, window_start)
-                remaining = self.limit - new_count
-                window_end = window_start + self.window_seconds
-                reset_at = datetime.fromtimestamp(window_end)
-                state = RateLimitState(
-                    limit=self.limit,
-                    remaining=remaining,
-                    reset_at=reset_at,
-                    retry_after=0.0,
-                    violated=False,
-                    metadata={
-                        "algorithm": "fixed_window",
-                        "window_seconds": self.window_seconds,
-                        "window_start": window_start,
-                        "current_count": new_count,
-                    },
-                )
-                return (True, state)
+            if window_id == self._window_id:
+                counts = self._wheel[window_id % WHEEL_SIZE]
             else:
-                window_end = window_start + self.window_seconds
-                retry_after = window_end - current_time
-                reset_at = datetime.fromtimestamp(window_end)
-
-                state = RateLimitState(
-                    limit=self.limit,
-                    remaining=0,
-                    reset_at=reset_at,
-                    retry_after=retry_after,
-                    violated=True,
-                    metadata={
-                        "algorithm": "fixed_window",
-                        "window_seconds": self.window_seconds,
-                        "window_start": window_start,
-                        "current_count": count,
-                    },
-                )
-                return (False, state)
+                counts = self._advance_wheel(window_id)
+            count = counts.get(key, 0)
+            allowed = count + weight <= self.limit
+            if allowed:
+                count += weight
+                counts[key] = count
+        window_start_ns = window_id * self._window_ns - WALL_OFFSET_NS
+        window_end_ns = window_start_ns + self._window_ns
+        if allowed:
+            state = RateLimitState(
+                limit=self.limit,
+                remaining=self.limit - count,
+                reset_at=None,
+                reset_at_ns=window_end_ns,
+                retry_after=0.0,
+                violated=False,
+                metadata_fn=lambda: {
+                    "algorithm": "fixed_window",
+                    "window_seconds": self.window_seconds,
+                    "window_start": monotonic_to_timestamp(window_start_ns),
+                    "current_count": count,
+                },
+            )
+            return (True, state)
+        state = RateLimitState(
+            limit=self.limit,
+            remaining=0,
+            reset_at=None,
+            reset_at_ns=window_end_ns,
+            retry_after=(window_end_ns - now_ns) / NS_PER_SECOND,
+            violated=True,
+            metadata_fn=lambda: {
+                "algorithm": "fixed_window",
+                "window_seconds": self.window_seconds,
+                "window_start": monotonic_to_timestamp(window_start_ns),
+                "current_count": count,
+            },
+        )
+        return (False, state)
 
     async def acquire_async(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
         return self.allow(key, weight)
 
     def check(self, key: str) -> RateLimitState:
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
         with self._lock:
-            count, window_start = self._get_current_window(key, current_time)
+            count, window_start_ns = self._get_current_window(key, now_ns)
             remaining = max(0, self.limit - count)
-            window_end = window_start + self.window_seconds
-            reset_at = datetime.fromtimestamp(window_end)
-            retry_after = 0.0 if remaining > 0 else window_end - current_time
+            window_end_ns = window_start_ns + self._window_ns
+            reset_at = monotonic_to_datetime(window_end_ns)
+            retry_after = 0.0 if remaining > 0 else (window_end_ns - now_ns) / NS_PER_SECOND
 
             return RateLimitState(
                 limit=self.limit,
@@ -101,7 +122,8 @@ class FixedWindowAlgorithm(Algorithm):
 
     def reset(self, key: Optional[str] = None) -> None:
         with self._lock:
-            if key is None:
-                self._windows.clear()
-            elif key in self._windows:
-                del self._windows[key]
\ No newline at end of file
+            for counts in self._wheel:
+                if key is None:
+                    counts.clear()
+                else:
+                    counts.pop(key, None)
\ No newline at end of file
@@ -1,12 +1,22 @@
+import threading
 import time
 from datetime import datetime, timedelta
-from threading import RLock
-from typing import Dict, Tuple, Optional
+from typing import Dict, Hashable, Tuple, Optional
 from ..core.abstractions import Algorithm
 from ..core.types import RateLimitState
+from ..core.locks import StripedLock
+from ..core.clock import NS_PER_SECOND, seconds_to_ns, monotonic_to_datetime, monotonic_to_timestamp
 
 class GCRAAlgorithm(Algorithm):
-    def __init__(self, limit: int, period_seconds: float, burst: Optional[int] = None) -> None:
+    acquire_is_allow = True
+
+    def __init__(
+        self,
+        limit: int,
+        period_seconds: float,
+        burst: Optional[int] = None,
+        shards: int = 1,
+    ) -> None:
         if limit <= 0:
             raise ValueError("limit must be positive")
         if period_seconds <= 0:
@@ -14,89 +24,168 @@ class GCRAAlgorithm(Algorithm):
         self.limit = limit
         self.period_seconds = period_seconds
         self.burst = burst if burst is not None else limit
+        if shards <= 0 or shards > self.burst:
+            raise ValueError("shards must be between 1 and burst")
+        self.shards = shards
         self.emission_interval = period_seconds / limit
         self.burst_allowance = self.emission_interval * self.burst
-        self._tats: Dict[str, float] = {}
-        self._lock = RLock()
+        self._emission_ns = seconds_to_ns(self.emission_interval)
+        self._burst_ns = self._emission_ns * self.burst
+        # With shards > 1 each key's capacity is split across independent TATs,
+        # each draining at 1/shards of the rate, so threads hammering one hot key
+        # mostly land on different locks. The burst is spread as evenly as possible
+        # (the first burst % shards shards take one extra slot), and a request whose
+        # home shard is exhausted borrows from the others, so a single thread still
+        # sees the whole burst. This only approximates the configured limit: a weight
+        # larger than any one shard's share is denied even if the shards together
+        # could cover it, and concurrent callers may see slightly stale remaining counts.
+        self._shard_emission_ns = self._emission_ns * shards
+        base, extra = divmod(self.burst, shards)
+        self._shard_bursts = [base + (shard < extra) for shard in range(shards)]
+        self._shard_burst_ns = [burst * self._shard_emission_ns for burst in self._shard_bursts]
+        self._tats: Dict[Hashable, int] = {}
+        self._locks = StripedLock()
 
-    def allow(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
-        if weight <= 0:
-            raise ValueError("weight must be positive")
-        current_time = time.time()
-        with self._lock:
-            tat = self._tats.get(key, current_time)
-            new_tat = max(tat, current_time) + (self.emission_interval * weight)
-            allow_at = new_tat - self.burst_allowance
-            if current_time >= allow_at:
-                self._tats[key] = new_tat
-                time_since_tat = current_time - tat
-                if time_since_tat > 0:
-                    tokens_recovered = time_since_tat / self.emission_interval
-                    remaining = min(self.burst, int(tokens_recovered))
-                else:
-                    remaining = 0
-                reset_at = datetime.fromtimestamp(new_tat)
-                state = RateLimitState(
-                    limit=self.limit,
-                    remaining=max(0, remaining),
-                    reset_at=reset_at,
-                    retry_after=0.0,
-                    violated=False,
-                    metadata={
-                        "algorithm": "gcra",
-                        "tat": new_tat,
-                        "emission_interval": self.emission_interval,
-                    },
-                )
-                return (True, state)
+    def _sharded_remaining(self, key: str, now_ns: int) -> int:
+        remaining = 0
+        for shard, shard_burst in enumerate(self._shard_bursts):
+            tat = self._tats.get((key, shard), now_ns)
+            if tat <= now_ns:
+                remaining += shard_burst
             else:
-                retry_after = allow_at - current_time
-                reset_at = datetime.fromtimestamp(allow_at)
-                state = RateLimitState(
-                    limit=self.limit,
-                    remaining=0,
-                    reset_at=reset_at,
-                    retry_after=retry_after,
-                    violated=True,
-                    metadata={
-                        "algorithm": "gcra",
-                        "tat": tat,
-                        "emission_interval": self.emission_interval,
-                    },
-                )
-                return (False, state)
+                remaining += max(0, shard_burst + (now_ns - tat) // self._shard_emission_ns)
+        return remaining
 
-    async def acquire_async(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
-        return self.allow(key, weight)
+    def _allow_sharded(self, key: str, weight: int, now_ns: int) -> Tuple[bool, int, int, int]:
+        increment = self._shard_emission_ns * weight
+        home = (threading.get_ident() >> 4) % self.shards
+        earliest: Optional[Tuple[int, int, int]] = None
+        for offset in range(self.shards):
+            shard = (home + offset) % self.shards
+            tat_key = (key, shard)
+            with self._locks.for_key(tat_key):
+                tat = self._tats.get(tat_key, now_ns)
+                new_tat = (tat if tat > now_ns else now_ns) + increment
+                allow_at = new_tat - self._shard_burst_ns[shard]
+                if now_ns >= allow_at:
+                    self._tats[tat_key] = new_tat
+                    return True, tat, new_tat, allow_at
+            if earliest is None or allow_at < earliest[2]:
+                earliest = (tat, new_tat, allow_at)
+        # shards > 1, so the loop ran and recorded at least one denial.
+        assert earliest is not None
+        tat, new_tat, allow_at = earliest
+        return False, tat, new_tat, allow_at
 
-    def check(self, key: str) -> RateLimitState:
-        current_time = time.time()
-        with self._lock:
-            tat = self._tats.get(key, current_time)
-            if current_time >= tat:
-                remaining = self.burst
-                retry_after = 0.0
+    def allow(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        now_ns = time.monotonic_ns()
+        if self.shards > 1:
+            allowed, tat, new_tat, allow_at = self._allow_sharded(key, weight, now_ns)
+        else:
+            increment = self._emission_ns * weight
+            with self._locks.for_key(key):
+                tat = self._tats.get(key, now_ns)
+                new_tat = (tat if tat > now_ns else now_ns) + increment
+                allow_at = new_tat - self._burst_ns
+                allowed = now_ns >= allow_at
+                if allowed:
+                    self._tats[key] = new_tat
+        if allowed:
+            if self.shards > 1:
+                remaining = self._sharded_remaining(key, now_ns)
+            elif now_ns > tat:
+                remaining = min(self.burst, (now_ns - tat) // self._emission_ns)
             else:
-                time_until_tat = tat - current_time
-                slots_used = int(time_until_tat / self.emission_interval)
-                remaining = max(0, self.burst - slots_used)
-                retry_after = time_until_tat if remaining == 0 else 0.0
-            reset_at = datetime.fromtimestamp(max(tat, current_time))
-            return RateLimitState(
+                remaining = 0
+            state = RateLimitState(
                 limit=self.limit,
                 remaining=remaining,
-                reset_at=reset_at,
-                retry_after=retry_after,
-                violated=remaining == 0,
-                metadata={
+                reset_at=None,
+                reset_at_ns=new_tat,
+                retry_after=0.0,
+                violated=False,
+                metadata_fn=lambda: {
                     "algorithm": "gcra",
-                    "tat": tat,
+                    "tat": monotonic_to_timestamp(new_tat),
+                    "emission_interval": self.emission_interval,
                 },
             )
+            return (True, state)
+        state = RateLimitState(
+            limit=self.limit,
+            remaining=0,
+            reset_at=None,
+            reset_at_ns=allow_at,
+            retry_after=(allow_at - now_ns) / NS_PER_SECOND,
+            violated=True,
+            metadata_fn=lambda: {
+                "algorithm": "gcra",
+                "tat": monotonic_to_timestamp(tat),
+                "emission_interval": self.emission_interval,
+            },
+        )
+        return (False, state)
+
+    async def acquire_async(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
+        return self.allow(key, weight)
+
+    def check(self, key: str) -> RateLimitState:
+        now_ns = time.monotonic_ns()
+        if self.shards > 1:
+            return self._check_sharded(key, now_ns)
+        with self._locks.for_key(key):
+            tat = self._tats.get(key, now_ns)
+        if now_ns >= tat:
+            remaining = self.burst
+            retry_after = 0.0
+        else:
+            time_until_tat = tat - now_ns
+            slots_used = time_until_tat // self._emission_ns
+            remaining = max(0, self.burst - slots_used)
+            retry_after = time_until_tat / NS_PER_SECOND if remaining == 0 else 0.0
+        return RateLimitState(
+            limit=self.limit,
+            remaining=remaining,
+            reset_at=monotonic_to_datetime(tat if tat > now_ns else now_ns),
+            retry_after=retry_after,
+            violated=remaining == 0,
+            metadata={
+                "algorithm": "gcra",
+                "tat": monotonic_to_timestamp(tat),
+            },
+        )
+
+    def _check_sharded(self, key: str, now_ns: int) -> RateLimitState:
+        tats = [self._tats.get((key, shard), now_ns) for shard in range(self.shards)]
+        remaining = self._sharded_remaining(key, now_ns)
+        next_tat = min(tats)
+        if remaining == 0:
+            retry_after = (next_tat - now_ns) / NS_PER_SECOND
+        else:
+            retry_after = 0.0
+        return RateLimitState(
+            limit=self.limit,
+            remaining=remaining,
+            reset_at=monotonic_to_datetime(max(next_tat, now_ns)),
+            retry_after=retry_after,
+            violated=remaining == 0,
+            metadata={
+                "algorithm": "gcra",
+                "tat": monotonic_to_timestamp(max(tats)),
+            },
+        )
 
     def reset(self, key: Optional[str] = None) -> None:
-        with self._lock:
-            if key is None:
+        if key is None:
+            with self._locks.all():
                 self._tats.clear()
-            elif key in self._tats:
-                del self._tats[key]
\ No newline at end of file
+        elif self.shards == 1:
+            with self._locks.for_key(key):
+                self._tats.pop(key, None)
+        else:
+            for shard in range(self.shards):
+                tat_key = (key, shard)
+                with self._locks.for_key(tat_key):
+                    self._tats.pop(tat_key, None)
\ No newline at end of file
@@ -1,11 +1,59 @@
+import sys
 import time
-from typing import Dict, Tuple, Optional, List
+from collections import deque
+from fractions import Fraction
+from typing import Deque, Dict, Tuple, Optional, List
 from threading import RLock
 from datetime import datetime, timedelta
 from ..core.abstractions import Algorithm
 from ..core.types import RateLimitState
+from ..core.clock import seconds_to_ns, monotonic_to_datetime, monotonic_to_timestamp
+
+_ALLOWED = 0
+_DENIED_GLOBAL = 1
+_DENIED_TENANT = 2
+_DENIED_USER = 3
+
+def _consume_three_levels(
+    now_ns: int,
+    rate: int,
+    need: int,
+    has_tenant: bool,
+    global_tokens: int,
+    global_last: int,
+    global_cap: int,
+    tenant_tokens: int,
+    tenant_last: int,
+    tenant_cap: int,
+    user_tokens: int,
+    user_last: int,
+    user_cap: int,
+) -> Tuple[int, int, int, int]:
+    # Refill and check all levels in one frame with plain locals; callers own every state write.
+    # Token counts are scaled so that rate is a whole number of units per ns, keeping the
+    # refill exact integer arithmetic.
+    elapsed = now_ns - global_last
+    if elapsed > 0:
+        global_tokens = min(global_cap, global_tokens + elapsed * rate)
+    if global_tokens < need:
+        return _DENIED_GLOBAL, global_tokens, tenant_tokens, user_tokens
+    if has_tenant:
+        elapsed = now_ns - tenant_last
+        if elapsed > 0:
+            tenant_tokens = min(tenant_cap, tenant_tokens + elapsed * rate)
+        if tenant_tokens < need:
+            return _DENIED_TENANT, global_tokens, tenant_tokens, user_tokens
+        tenant_tokens -= need
+    elapsed = now_ns - user_last
+    if elapsed > 0:
+        user_tokens = min(user_cap, user_tokens + elapsed * rate)
+    if user_tokens < need:
+        return _DENIED_USER, global_tokens, tenant_tokens, user_tokens
+    return _ALLOWED, global_tokens - need, tenant_tokens, user_tokens - need
 
 class HierarchicalTokenBucket(Algorithm):
+    acquire_is_allow = True
+
     def __init__(
         self,
         global_limit: int,
@@ -23,22 +71,31 @@ class HierarchicalTokenBucket(Algorithm):
         self.user_limit = user_limit
         self.refill_rate = refill_rate
         self.refill_period = refill_period
-        self._global_bucket: Tuple[float, float] = (global_limit, time.time())
-        self._tenant_buckets: Dict[str, Tuple[float, float]] = {}
-        self._user_buckets: Dict[str, Tuple[float, float]] = {}
+        self._tokens_per_second = refill_rate / refill_period
+        self._seconds_to_full = user_limit / refill_rate
+        # Buckets hold tokens * _unit, with _unit the refill period in ns times the denominator
+        # of refill_rate, so refilling adds the integer numerator per ns.
+        rate = Fraction(refill_rate).limit_denominator(1_000_000)
+        self._refill_per_ns = rate.numerator
+        self._unit = seconds_to_ns(refill_period) * rate.denominator
+        self._global_cap = global_limit * self._unit
+        self._tenant_cap = tenant_limit * self._unit
+        self._user_cap = user_limit * self._unit
+        self._global_bucket: Tuple[int, int] = (self._global_cap, time.monotonic_ns())
+        self._tenant_buckets: Dict[str, Tuple[int, int]] = {}
+        self._user_buckets: Dict[str, Tuple[int, int]] = {}
         self._lock = RLock()
 
     def _refill_bucket(
         self,
-        current_tokens: float,
-        last_refill: float,
+        current_tokens: int,
+        last_refill: int,
         capacity: int,
-        current_time: float
-    ) -> float:
-        time_passed = current_time - last_refill
-        if time_passed > 0:
-            tokens_to_add = (time_passed / self.refill_period) * self.refill_rate
-            current_tokens = min(capacity, current_tokens + tokens_to_add)
+        now_ns: int
+    ) -> int:
+        elapsed = now_ns - last_refill
+        if elapsed > 0:
+            current_tokens = min(capacity, current_tokens + elapsed * self._refill_per_ns)
         return current_tokens
 
     def allow(
@@ -49,60 +106,61 @@ class HierarchicalTokenBucket(Algorithm):
     ) -> Tuple[bool, RateLimitState]:
         if weight <= 0:
             raise ValueError("weight must be positive")
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
+        unit = self._unit
         with self._lock:
             global_tokens, global_last = self._global_bucket
-            global_tokens = self._refill_bucket(
-                global_tokens, global_last, self.global_limit, current_time
+            if tenant:
+                tenant_tokens, tenant_last = self._tenant_buckets.get(
+                    tenant, (self._tenant_cap, now_ns)
+                )
+            else:
+                tenant_tokens, tenant_last = 0, now_ns
+            user_tokens, user_last = self._user_buckets.get(
+                key, (self._user_cap, now_ns)
+            )
+            denied, global_tokens, tenant_tokens, user_tokens = _consume_three_levels(
+                now_ns, self._refill_per_ns, weight * unit, bool(tenant),
+                global_tokens, global_last, self._global_cap,
+                tenant_tokens, tenant_last, self._tenant_cap,
+                user_tokens, user_last, self._user_cap,
             )
-            if global_tokens < weight:
+            if denied == _DENIED_GLOBAL:
                 return self._create_denial_response(
-                    "global", self.global_limit, global_tokens, current_time
+                    "global", self.global_limit, global_tokens / unit, now_ns
                 )
-            if tenant:
-                if tenant not in self._tenant_buckets:
-                    self._tenant_buckets[tenant] = (self.tenant_limit, current_time)
-
-                tenant_tokens, tenant_last = self._tenant_buckets[tenant]
-                tenant_tokens = self._refill_bucket(
-                    tenant_tokens, tenant_last, self.tenant_limit, current_time
+            if tenant and tenant not in self._tenant_buckets:
+                self._tenant_buckets[tenant] = (self._tenant_cap, now_ns)
+            if denied == _DENIED_TENANT:
+                return self._create_denial_response(
+                    f"tenant:{tenant}", self.tenant_limit, tenant_tokens / unit, now_ns
                 )
-                if tenant_tokens < weight:
-                    return self._create_denial_response(
-                        f"tenant:{tenant}", self.tenant_limit, tenant_tokens, current_time
-                    )
             if key not in self._user_buckets:
-                self._user_buckets[key] = (self.user_limit, current_time)
-            user_tokens, user_last = self._user_buckets[key]
-            user_tokens = self._refill_bucket(
-                user_tokens, user_last, self.user_limit, current_time
-            )
-            if user_tokens < weight:
+                self._user_buckets[key] = (self._user_cap, now_ns)
+            if denied == _DENIED_USER:
                 return self._create_denial_response(
-                    f"user:{key}", self.user_limit, user_tokens, current_time
+                    f"user:{key}", self.user_limit, user_tokens / unit, now_ns
                 )
-            global_tokens -= weight
-            user_tokens -= weight
-            self._global_bucket = (global_tokens, current_time)
-            self._user_buckets[key] = (user_tokens, current_time)
+            self._global_bucket = (global_tokens, now_ns)
+            self._user_buckets[key] = (user_tokens, now_ns)
             if tenant:
-                tenant_tokens -= weight
-                self._tenant_buckets[tenant] = (tenant_tokens, current_time)
+                self._tenant_buckets[tenant] = (tenant_tokens, now_ns)
 
             reset_at = datetime.fromtimestamp(
-                current_time + (self.user_limit / self.refill_rate)
+                monotonic_to_timestamp(now_ns) + self._seconds_to_full
             )
+            user_remaining = int(user_tokens // unit)
             state = RateLimitState(
                 limit=self.user_limit,
-                remaining=int(user_tokens),
+                remaining=user_remaining,
                 reset_at=reset_at,
                 retry_after=0.0,
                 violated=False,
-                metadata={
+                metadata_fn=lambda: {
                     "algorithm": "hierarchical_token_bucket",
-                    "global_remaining": int(global_tokens),
-                    "tenant_remaining": int(tenant_tokens) if tenant else None,
-                    "user_remaining": int(user_tokens),
+                    "global_remaining": int(global_tokens // unit),
+                    "tenant_remaining": int(tenant_tokens // unit) if tenant else None,
+                    "user_remaining": user_remaining,
                 },
             )
             return (True, state)
@@ -112,11 +170,11 @@ class HierarchicalTokenBucket(Algorithm):
         level: str,
         limit: int,
         remaining: float,
-        current_time: float
+        now_ns: int
     ) -> Tuple[bool, RateLimitState]:
         tokens_needed = 1 - remaining
-        retry_after = (tokens_needed / self.refill_rate) * self.refill_period
-        reset_at = datetime.fromtimestamp(current_time + retry_after)
+        retry_after = tokens_needed / self._tokens_per_second
+        reset_at = datetime.fromtimestamp(monotonic_to_timestamp(now_ns) + retry_after)
 
         state = RateLimitState(
             limit=limit,
@@ -124,7 +182,7 @@ class HierarchicalTokenBucket(Algorithm):
             reset_at=reset_at,
             retry_after=retry_after,
             violated=True,
-            metadata={
+            metadata_fn=lambda: {
                 "algorithm": "hierarchical_token_bucket",
                 "denied_at_level": level,
             },
@@ -136,43 +194,43 @@ class HierarchicalTokenBucket(Algorithm):
         return self.allow(key, weight)
 
     def check(self, key: str) -> RateLimitState:
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
+        unit = self._unit
 
         with self._lock:
             if key not in self._user_buckets:
-                self._user_buckets[key] = (self.user_limit, current_time)
+                self._user_buckets[key] = (self._user_cap, now_ns)
 
             user_tokens, user_last = self._user_buckets[key]
             user_tokens = self._refill_bucket(
-                user_tokens, user_last, self.user_limit, current_time
+                user_tokens, user_last, self._user_cap, now_ns
             )
 
             global_tokens, global_last = self._global_bucket
             global_tokens = self._refill_bucket(
-                global_tokens, global_last, self.global_limit, current_time
+                global_tokens, global_last, self._global_cap, now_ns
             )
 
             reset_at = datetime.fromtimestamp(
-                current_time + (self.user_limit / self.refill_rate)
+                monotonic_to_timestamp(now_ns) + self._seconds_to_full
             )
 
             return RateLimitState(
                 limit=self.user_limit,
-                remaining=int(user_tokens),
+                remaining=int(user_tokens // unit),
                 reset_at=reset_at,
                 retry_after=0.0,
                 violated=False,
-                metadata={
+                metadata_fn=lambda: {
                     "algorithm": "hierarchical_token_bucket",
-                    "global_remaining": int(global_tokens),
+                    "global_remaining": int(global_tokens // unit),
                 },
             )
 
     def reset(self, key: Optional[str] = None) -> None:
         with self._lock:
             if key is None:
-                current_time = time.time()
-                self._global_bucket = (self.global_limit, current_time)
+                self._global_bucket = (self._global_cap, time.monotonic_ns())
                 self._tenant_buckets.clear()
                 self._user_buckets.clear()
             else:
@@ -180,6 +238,8 @@ class HierarchicalTokenBucket(Algorithm):
 
 
 class FairQueueingAlgorithm(Algorithm):
+    acquire_is_allow = True
+
     def __init__(
         self,
         global_limit: int,
@@ -195,17 +255,31 @@ class FairQueueingAlgorithm(Algorithm):
         self.window_seconds = window_seconds
         self.weights = weights or {}
         self.max_per_key = max_per_key
-        self._key_counts: Dict[str, List[float]] = {}
+        # Resolved once: allow() without a weight_class never touches the weights dict.
+        self._weight_map = {sys.intern(name): w for name, w in self.weights.items()}
+        self._default_weight = self._weight_map.get("default", 1.0)
+        # Running totals instead of per-call rescans: _key_counts holds in-window usage for
+        # active keys only, and _timeline is a FIFO of (timestamp, key, weight, usage) grants
+        # that _expire pops from the front. An entry only counts while its key still maps to
+        # the same usage cell, so grants orphaned by reset(key) expire without side effects.
+        self._key_counts: Dict[str, List[int]] = {}
+        self._timeline: Deque[Tuple[int, str, int, List[int]]] = deque()
+        self._window_ns = seconds_to_ns(window_seconds)
+        self._global_used = 0
         self._lock = RLock()
 
-    def _cleanup_old_requests(self, key: str, current_time: float) -> List[float]:
-        cutoff_time = current_time - self.window_seconds
-        if key not in self._key_counts:
-            return []
-        self._key_counts[key] = [
-            ts for ts in self._key_counts[key] if ts > cutoff_time
-        ]
-        return self._key_counts[key]
+    def _expire(self, now_ns: int) -> None:
+        cutoff_ns = now_ns - self._window_ns
+        timeline = self._timeline
+        key_counts = self._key_counts
+        while timeline and timeline[0][0] <= cutoff_ns:
+            _, key, weight, usage = timeline.popleft()
+            if key_counts.get(key) is not usage:
+                continue
+            usage[0] -= weight
+            self._global_used -= weight
+            if usage[0] <= 0:
+                del key_counts[key]
 
     def allow(
         self,
@@ -215,42 +289,41 @@ class FairQueueingAlgorithm(Algorithm):
     ) -> Tuple[bool, RateLimitState]:
         if weight <= 0:
             raise ValueError("weight must be positive")
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
         with self._lock:
-            requests = self._cleanup_old_requests(key, current_time)
-            total_requests = sum(
-                len(self._cleanup_old_requests(k, current_time))
-                for k in self._key_counts
-            )
-            if total_requests >= self.global_limit:
+            self._expire(now_ns)
+            usage = self._key_counts.get(key)
+            used = usage[0] if usage is not None else 0
+            if self._global_used >= self.global_limit:
                 return self._create_denial_response(
-                    "global_limit", current_time
+                    "global_limit", now_ns
                 )
-            if self.max_per_key and len(requests) >= self.max_per_key:
+            if self.max_per_key and used >= self.max_per_key:
                 return self._create_denial_response(
-                    "per_key_limit", current_time
+                    "per_key_limit", now_ns
                 )
-            num_active_keys = len([k for k in self._key_counts if self._key_counts[k]])
-            fair_share = self.global_limit / max(1, num_active_keys)
-            weight_multiplier = self.weights.get(weight_class or "default", 1.0)
+            fair_share = self.global_limit / max(1, len(self._key_counts))
+            weight_multiplier = (
+                self._weight_map.get(weight_class, 1.0) if weight_class else self._default_weight
+            )
             adjusted_fair_share = fair_share * weight_multiplier
-            if len(requests) >= adjusted_fair_share:
+            if used >= adjusted_fair_share:
                 return self._create_denial_response(
-                    "fair_share_exceeded", current_time
+                    "fair_share_exceeded", now_ns
                 )
-            if key not in self._key_counts:
-                self._key_counts[key] = []
-
-            for _ in range(weight):
-                self._key_counts[key].append(current_time)
+            if usage is None:
+                usage = self._key_counts[key] = [0]
+            usage[0] += weight
+            self._global_used += weight
+            self._timeline.append((now_ns, key, weight, usage))
 
-            remaining = int(adjusted_fair_share - len(self._key_counts[key]))
-            reset_at = datetime.fromtimestamp(current_time + self.window_seconds)
+            remaining = int(adjusted_fair_share - usage[0])
 
             state = RateLimitState(
                 limit=int(adjusted_fair_share),
                 remaining=max(0, remaining),
-                reset_at=reset_at,
+                reset_at=None,
+                reset_at_ns=now_ns + self._window_ns,
                 retry_after=0.0,
                 violated=False,
                 metadata={
@@ -265,15 +338,14 @@ class FairQueueingAlgorithm(Algorithm):
     def _create_denial_response(
         self,
         reason: str,
-        current_time: float
+        now_ns: int
     ) -> Tuple[bool, RateLimitState]:
         """Create denial response."""
-        reset_at = datetime.fromtimestamp(current_time + self.window_seconds)
-
         state = RateLimitState(
             limit=self.global_limit,
             remaining=0,
-            reset_at=reset_at,
+            reset_at=None,
+            reset_at_ns=now_ns + self._window_ns,
             retry_after=self.window_seconds,
             violated=True,
             metadata={
@@ -288,16 +360,16 @@ class FairQueueingAlgorithm(Algorithm):
         return self.allow(key, weight)
 
     def check(self, key: str) -> RateLimitState:
-        current_time = time.time()
+        now_ns = time.monotonic_ns()
 
         with self._lock:
-            requests = self._cleanup_old_requests(key, current_time)
+            self._expire(now_ns)
+            usage = self._key_counts.get(key)
 
-            num_active_keys = len([k for k in self._key_counts if self._key_counts[k]])
-            fair_share = self.global_limit / max(1, num_active_keys)
+            fair_share = self.global_limit / max(1, len(self._key_counts))
 
-            remaining = int(fair_share - len(requests))
-            reset_at = datetime.fromtimestamp(current_time + self.window_seconds)
+            remaining = int(fair_share - (usage[0] if usage is not None else 0))
+            reset_at = monotonic_to_datetime(now_ns + self._window_ns)
 
             return RateLimitState(
                 limit=int(fair_share),
@@ -312,5 +384,9 @@ class FairQueueingAlgorithm(Algorithm):
         with self._lock:
             if key is None:
                 self._key_counts.clear()
+                self._timeline.clear()
+                self._global_used = 0
             else:
-                self._key_counts.pop(key, None)
\ No newline at end of file
+                usage = self._key_counts.pop(key, None)
+                if usage is not None:
+                    self._global_used -= usage[0]
\ No newline at end of file
@@ -1,12 +1,22 @@
 import time
 from datetime import datetime, timedelta
-from threading import RLock
 from typing import Dict, Tuple, Optional
-from collections import deque
 from ..core.abstractions import Algorithm
 from ..core.types import RateLimitState
+from ..core.locks import StripedLock
+from ..core.clock import NS_PER_SECOND, seconds_to_ns, monotonic_to_datetime
+
+class _Bucket:
+    __slots__ = ("level", "last_leak")
+
+    def __init__(self, last_leak: int) -> None:
+        self.level = 0
+        self.last_leak = last_leak
+
 
 class LeakyBucketAlgorithm(Algorithm):
+    acquire_is_allow = True
+
     def __init__(self, capacity: int, leak_rate: float, leak_period: float = 1.0) -> None:
         if capacity <= 0:
             raise ValueError("capacity must be positive")
@@ -17,90 +27,86 @@ class LeakyBucketAlgorithm(Algorithm):
         self.capacity = capacity
         self.leak_rate = leak_rate
         self.leak_period = leak_period
-        self._buckets: Dict[str, Tuple[deque, float]] = {}
-        self._lock = RLock()
+        self._ns_per_leak = seconds_to_ns(leak_period) / leak_rate
+        self._buckets: Dict[str, _Bucket] = {}
+        self._locks = StripedLock()
 
-    def _leak_bucket(self, key: str, current_time: float) -> deque:
-        if key not in self._buckets:
-            return deque()
-        queue, last_leak = self._buckets[key]
-        time_passed = current_time - last_leak
-        if time_passed > 0:
-            leaks = int((time_passed / self.leak_period) * self.leak_rate)
-            for _ in range(min(leaks, len(queue))):
-                queue.popleft()
-            self._buckets[key] = (queue, current_time)
-
-        return queue
+    def _leak_bucket(self, bucket: _Bucket, now_ns: int) -> int:
+        # Only whole leaks are taken, and last_leak advances by exactly that
+        # many intervals so partial progress carries over to the next call.
+        if bucket.level == 0:
+            bucket.last_leak = now_ns
+            return 0
+        leaked = int((now_ns - bucket.last_leak) // self._ns_per_leak)
+        if leaked >= bucket.level:
+            bucket.level = 0
+            bucket.last_leak = now_ns
+        elif leaked > 0:
+            bucket.level -= leaked
+            bucket.last_leak += int(leaked * self._ns_per_leak)
+        return bucket.level
 
     def allow(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
         if weight <= 0:
             raise ValueError("weight must be positive")
-        current_time = time.time()
-        with self._lock:
-            queue = self._leak_bucket(key, current_time)
-            current_size = len(queue)
-            if current_size + weight <= self.capacity:
-                if key not in self._buckets:
-                    self._buckets[key] = (deque(), current_time)
-
-                queue, _ = self._buckets[key]
-                for _ in range(weight):
-                    queue.append(current_time)
-
-                self._buckets[key] = (queue, current_time)
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _Bucket(now_ns)
+            current_size = self._leak_bucket(bucket, now_ns)
+            allowed = current_size + weight <= self.capacity
+            if allowed:
+                queue_size = bucket.level = current_size + weight
+        if allowed:
+            remaining = self.capacity - (current_size + weight)
 
-                remaining = self.capacity - (current_size + weight)
+            # Calculate when bucket will be empty
+            reset_at = monotonic_to_datetime(now_ns + int(queue_size * self._ns_per_leak))
 
-                # Calculate when bucket will be empty
-                time_to_empty = (len(queue) / self.leak_rate) * self.leak_period
-                reset_at = datetime.fromtimestamp(current_time + time_to_empty)
-
-                state = RateLimitState(
-                    limit=self.capacity,
-                    remaining=remaining,
-                    reset_at=reset_at,
-                    retry_after=0.0,
-                    violated=False,
-                    metadata={
-                        "algorithm": "leaky_bucket",
-                        "leak_rate": self.leak_rate,
-                        "queue_size": len(queue),
-                    },
-                )
-                return (True, state)
-            else:
-                items_to_leak = (current_size + weight) - self.capacity
-                retry_after = (items_to_leak / self.leak_rate) * self.leak_period
-                reset_at = datetime.fromtimestamp(current_time + retry_after)
-                state = RateLimitState(
-                    limit=self.capacity,
-                    remaining=0,
-                    reset_at=reset_at,
-                    retry_after=retry_after,
-                    violated=True,
-                    metadata={
-                        "algorithm": "leaky_bucket",
-                        "leak_rate": self.leak_rate,
-                        "queue_size": current_size,
-                    },
-                )
-                return (False, state)
+            state = RateLimitState(
+                limit=self.capacity,
+                remaining=remaining,
+                reset_at=reset_at,
+                retry_after=0.0,
+                violated=False,
+                metadata_fn=lambda: {
+                    "algorithm": "leaky_bucket",
+                    "leak_rate": self.leak_rate,
+                    "queue_size": queue_size,
+                },
+            )
+            return (True, state)
+        items_to_leak = (current_size + weight) - self.capacity
+        wait_ns = int(items_to_leak * self._ns_per_leak)
+        retry_after = wait_ns / NS_PER_SECOND
+        reset_at = monotonic_to_datetime(now_ns + wait_ns)
+        state = RateLimitState(
+            limit=self.capacity,
+            remaining=0,
+            reset_at=reset_at,
+            retry_after=retry_after,
+            violated=True,
+            metadata_fn=lambda: {
+                "algorithm": "leaky_bucket",
+                "leak_rate": self.leak_rate,
+                "queue_size": current_size,
+            },
+        )
+        return (False, state)
 
     async def acquire_async(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
         return self.allow(key, weight)
 
     def check(self, key: str) -> RateLimitState:
-        current_time = time.time()
-        with self._lock:
-            queue = self._leak_bucket(key, current_time)
-            current_size = len(queue)
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            bucket = self._buckets.get(key)
+            current_size = 0 if bucket is None else self._leak_bucket(bucket, now_ns)
             remaining = max(0, self.capacity - current_size)
-            if current_size > 0:
-                time_to_empty = (current_size / self.leak_rate) * self.leak_period
-            else:
-                time_to_empty = 0.0
-            reset_at = datetime.fromtimestamp(current_time + time_to_empty)
+            empty_ns = int(current_size * self._ns_per_leak)
+            time_to_empty = empty_ns / NS_PER_SECOND
+            reset_at = monotonic_to_datetime(now_ns + empty_ns)
             return RateLimitState(
                 limit=self.capacity,
                 remaining=remaining,
@@ -114,8 +120,9 @@ class LeakyBucketAlgorithm(Algorithm):
             )
 
     def reset(self, key: Optional[str] = None) -> None:
-        with self._lock:
-            if key is None:
+        if key is None:
+            with self._locks.all():
                 self._buckets.clear()
-            elif key in self._buckets:
-                del self._buckets[key]
\ No newline at end of file
+        else:
+            with self._locks.for_key(key):
+                self._buckets.pop(key, None)
\ No newline at end of file
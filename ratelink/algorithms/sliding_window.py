@@ -1,11 +1,16 @@
 import time
 from datetime import datetime, timedelta
-from threading import RLock
-from typing import Dict, List, Tuple, Optional
+from typing import Deque, Dict, Tuple, Optional
+from collections import deque
+from itertools import repeat
 from ..core.abstractions import Algorithm
 from ..core.types import RateLimitState
+from ..core.locks import StripedLock
+from ..core.clock import NS_PER_SECOND, seconds_to_ns
 
 class SlidingWindowAlgorithm(Algorithm):
+    acquire_is_allow = True
+
     def __init__(self, limit: int, window_seconds: float) -> None:
         if limit <= 0:
             raise ValueError("limit must be positive")
@@ -13,37 +18,44 @@ class SlidingWindowAlgorithm(Algorithm):
             raise ValueError("window_seconds must be positive")
         self.limit = limit
         self.window_seconds = window_seconds
-        self._requests: Dict[str, List[float]] = {}
-        self._lock = RLock()
+        self._window_ns = seconds_to_ns(window_seconds)
+        # Per-key ring buffer of timestamps, oldest first; a key can never hold
+        # more than `limit` live entries, so the buffer is capped at that size.
+        self._requests: Dict[str, Deque[int]] = {}
+        self._locks = StripedLock()
 
-    def _cleanup_old_requests(self, key: str, current_time: float) -> List[float]:
-        cutoff_time = current_time - self.window_seconds
-        if key not in self._requests:
-            return []
-        self._requests[key] = [ts for ts in self._requests[key] if ts > cutoff_time]
-        return self._requests[key]
+    def _cleanup_old_requests(self, key: str, now_ns: int) -> Deque[int]:
+        requests = self._requests.get(key)
+        if requests is None:
+            return deque()
+        cutoff_ns = now_ns - self._window_ns
+        while requests and requests[0] <= cutoff_ns:
+            requests.popleft()
+        return requests
 
     def allow(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
         if weight <= 0:
             raise ValueError("weight must be positive")
-        current_time = time.time()
-        with self._lock:
-            requests = self._cleanup_old_requests(key, current_time)
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            requests = self._cleanup_old_requests(key, now_ns)
             current_count = len(requests)
             if current_count + weight <= self.limit:
-                if key not in self._requests:
-                    self._requests[key] = []
-                for _ in range(weight):
-                    self._requests[key].append(current_time)
+                if not current_count:
+                    stored = self._requests.get(key)
+                    if stored is None:
+                        stored = self._requests[key] = deque(maxlen=self.limit)
+                    requests = stored
+                requests.extend(repeat(now_ns, weight))
                 remaining = self.limit - (current_count + weight)
-                reset_at = datetime.fromtimestamp(current_time + self.window_seconds)
                 state = RateLimitState(
                     limit=self.limit,
                     remaining=remaining,
-                    reset_at=reset_at,
+                    reset_at=None,
+                    reset_at_ns=now_ns + self._window_ns,
                     retry_after=0.0,
                     violated=False,
-                    metadata={
+                    metadata_fn=lambda: {
                         "algorithm": "sliding_window",
                         "window_seconds": self.window_seconds,
                         "current_count": current_count + weight,
@@ -52,18 +64,18 @@ class SlidingWindowAlgorithm(Algorithm):
                 return (True, state)
             else:
                 if requests:
-                    oldest_request = min(requests)
-                    retry_after = max(0.0, oldest_request + self.window_seconds - current_time)
+                    wait_ns = max(0, requests[0] + self._window_ns - now_ns)
                 else:
-                    retry_after = 0.0
-                reset_at = datetime.fromtimestamp(current_time + retry_after)
+                    wait_ns = 0
+                retry_after = wait_ns / NS_PER_SECOND
                 state = RateLimitState(
                     limit=self.limit,
                     remaining=0,
-                    reset_at=reset_at,
+                    reset_at=None,
+                    reset_at_ns=now_ns + wait_ns,
                     retry_after=retry_after,
                     violated=True,
-                    metadata={
+                    metadata_fn=lambda: {
                         "algorithm": "sliding_window",
                         "window_seconds": self.window_seconds,
                         "current_count": current_count,
@@ -75,21 +87,21 @@ class SlidingWindowAlgorithm(Algorithm):
         return self.allow(key, weight)
 
     def check(self, key: str) -> RateLimitState:
-        current_time = time.time()
-        with self._lock:
-            requests = self._cleanup_old_requests(key, current_time)
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            requests = self._cleanup_old_requests(key, now_ns)
             current_count = len(requests)
             remaining = max(0, self.limit - current_count)
             if requests:
-                oldest_request = min(requests)
-                seconds_until_reset = oldest_request + self.window_seconds - current_time
+                wait_ns = requests[0] + self._window_ns - now_ns
             else:
-                seconds_until_reset = self.window_seconds
-            reset_at = datetime.fromtimestamp(current_time + max(0, seconds_until_reset))
+                wait_ns = self._window_ns
+            seconds_until_reset = wait_ns / NS_PER_SECOND
             return RateLimitState(
                 limit=self.limit,
                 remaining=remaining,
-                reset_at=reset_at,
+                reset_at=None,
+                reset_at_ns=now_ns + max(0, wait_ns),
                 retry_after=0.0 if remaining > 0 else seconds_until_reset,
                 violated=remaining == 0,
                 metadata={
@@ -99,8 +111,136 @@ class SlidingWindowAlgorithm(Algorithm):
             )
 
     def reset(self, key: Optional[str] = None) -> None:
-        with self._lock:
-            if key is None:
+        if key is None:
+            with self._locks.all():
                 self._requests.clear()
-            elif key in self._requests:
-                del self._requests[key]
\ No newline at end of file
+        else:
+            with self._locks.for_key(key):
+                self._requests.pop(key, None)
+
+class _Counter:
+    __slots__ = ("prev", "cur", "window_start")
+
+    def __init__(self, window_start: int) -> None:
+        self.prev = 0
+        self.cur = 0
+        self.window_start = window_start
+
+
+class SlidingWindowCounterAlgorithm(Algorithm):
+    acquire_is_allow = True
+
+    # Approximate sliding window: two fixed-window counts per key, with the previous
+    # window weighted by how much of it still overlaps the sliding window.
+    def __init__(self, limit: int, window_seconds: float) -> None:
+        if limit <= 0:
+            raise ValueError("limit must be positive")
+        if window_seconds <= 0:
+            raise ValueError("window_seconds must be positive")
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self._window_ns = seconds_to_ns(window_seconds)
+        self._counters: Dict[str, _Counter] = {}
+        self._locks = StripedLock()
+
+    def _roll(self, counter: _Counter, now_ns: int) -> Tuple[int, int, int]:
+        elapsed_ns = now_ns - counter.window_start
+        if elapsed_ns < self._window_ns:
+            return counter.prev, counter.cur, counter.window_start
+        windows = elapsed_ns // self._window_ns
+        prev = counter.cur if windows == 1 else 0
+        return prev, 0, counter.window_start + windows * self._window_ns
+
+    def _estimate(self, prev: int, cur: int, window_start: int, now_ns: int) -> float:
+        overlap_ns = self._window_ns - (now_ns - window_start)
+        return prev * overlap_ns / self._window_ns + cur
+
+    def _wait_ns(self, prev: int, cur: int, window_start: int, now_ns: int, weight: int) -> int:
+        window_end = window_start + self._window_ns
+        room = self.limit - weight - cur
+        if room < 0 or prev == 0:
+            return max(0, window_end - now_ns)
+        # Time until the previous window's weighted share has decayed to fit `weight`.
+        ready_at = window_end - int(self._window_ns * room / prev)
+        return max(0, ready_at - now_ns)
+
+    def allow(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = self._counters[key] = _Counter(now_ns)
+            prev, cur, window_start = self._roll(counter, now_ns)
+            counter.prev, counter.cur, counter.window_start = prev, cur, window_start
+            estimate = self._estimate(prev, cur, window_start, now_ns)
+            if estimate + weight <= self.limit:
+                counter.cur = cur = cur + weight
+                return (True, RateLimitState(
+                    limit=self.limit,
+                    remaining=int(self.limit - estimate - weight),
+                    reset_at=None,
+                    reset_at_ns=window_start + self._window_ns,
+                    retry_after=0.0,
+                    violated=False,
+                    metadata_fn=lambda: {
+                        "algorithm": "sliding_window_counter",
+                        "window_seconds": self.window_seconds,
+                        "current_count": cur,
+                        "previous_count": prev,
+                    },
+                ))
+            wait_ns = self._wait_ns(prev, cur, window_start, now_ns, weight)
+            return (False, RateLimitState(
+                limit=self.limit,
+                remaining=max(0, int(self.limit - estimate)),
+                reset_at=None,
+                reset_at_ns=now_ns + wait_ns,
+                retry_after=wait_ns / NS_PER_SECOND,
+                violated=True,
+                metadata_fn=lambda: {
+                    "algorithm": "sliding_window_counter",
+                    "window_seconds": self.window_seconds,
+                    "current_count": cur,
+                    "previous_count": prev,
+                },
+            ))
+
+    async def acquire_async(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
+        return self.allow(key, weight)
+
+    def check(self, key: str) -> RateLimitState:
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            counter = self._counters.get(key)
+            if counter is None:
+                prev, cur, window_start = 0, 0, now_ns
+            else:
+                prev, cur, window_start = self._roll(counter, now_ns)
+            estimate = self._estimate(prev, cur, window_start, now_ns)
+            remaining = max(0, int(self.limit - estimate))
+            retry_after = 0.0
+            if remaining == 0:
+                retry_after = self._wait_ns(prev, cur, window_start, now_ns, 1) / NS_PER_SECOND
+            return RateLimitState(
+                limit=self.limit,
+                remaining=remaining,
+                reset_at=None,
+                reset_at_ns=window_start + self._window_ns,
+                retry_after=retry_after,
+                violated=remaining == 0,
+                metadata={
+                    "algorithm": "sliding_window_counter",
+                    "current_count": cur,
+                    "previous_count": prev,
+                },
+            )
+
+    def reset(self, key: Optional[str] = None) -> None:
+        if key is None:
+            with self._locks.all():
+                self._counters.clear()
+        else:
+            with self._locks.for_key(key):
+                self._counters.pop(key, None)
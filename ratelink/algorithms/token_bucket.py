@@ -1,11 +1,43 @@
 import time
 from datetime import datetime, timedelta
-from threading import RLock
-from typing import Dict, Tuple, Optional
+from typing import Any, Callable, Dict, List, Tuple, Optional
 from ..core.abstractions import Algorithm
 from ..core.types import RateLimitState
+from ..core.locks import StripedLock
+from ..core.clock import NS_PER_SECOND, seconds_to_ns, monotonic_to_datetime
+
+class _Bucket:
+    __slots__ = ("tokens", "last_refill")
+
+    def __init__(self, tokens: float, last_refill: int) -> None:
+        self.tokens = tokens
+        self.last_refill = last_refill
+
+
+def _make_consume(capacity: int, tokens_per_ns: float) -> Callable[[_Bucket, int, int], Tuple[bool, float]]:
+    # Configuration is fixed at construction, so the hot step closes over it
+    # instead of loading attributes off the algorithm on every call.
+    def consume(bucket: _Bucket, weight: int, now_ns: int) -> Tuple[bool, float]:
+        # Caller holds the key's stripe lock; keep this to bare arithmetic.
+        tokens = bucket.tokens
+        elapsed_ns = now_ns - bucket.last_refill
+        if elapsed_ns > 0:
+            tokens += elapsed_ns * tokens_per_ns
+            if tokens > capacity:
+                tokens = capacity
+        allowed = tokens >= weight
+        if allowed:
+            tokens -= weight
+        bucket.tokens = tokens
+        bucket.last_refill = now_ns
+        return (allowed, tokens)
+
+    return consume
+
 
 class TokenBucketAlgorithm(Algorithm):
+    acquire_is_allow = True
+
     def __init__(
         self,
         capacity: int,
@@ -22,65 +54,119 @@ class TokenBucketAlgorithm(Algorithm):
         self.refill_rate = refill_rate
         self.refill_period = refill_period
         self.initial_tokens = initial_tokens if initial_tokens is not None else capacity
-        self._buckets: Dict[str, Tuple[float, float]] = {}
-        self._lock = RLock()
-
-    def _refill_tokens(self, key: str, current_time: float) -> Tuple[float, float]:
-        if key not in self._buckets:
-            return (self.initial_tokens, current_time)
-        tokens, last_refill = self._buckets[key]
-        time_passed = current_time - last_refill
-        if time_passed > 0:
-            tokens_to_add = (time_passed / self.refill_period) * self.refill_rate
-            tokens = min(self.capacity, tokens + tokens_to_add)
-        return (tokens, current_time)
+        self._ns_per_token = seconds_to_ns(refill_period) / refill_rate
+        self._tokens_per_ns = 1 / self._ns_per_token
+        self._consume = _make_consume(capacity, self._tokens_per_ns)
+        self._buckets: Dict[str, _Bucket] = {}
+        self._locks = StripedLock()
+
+    def _refill_tokens(self, bucket: _Bucket, now_ns: int) -> float:
+        tokens = bucket.tokens
+        elapsed_ns = now_ns - bucket.last_refill
+        if elapsed_ns > 0:
+            tokens = min(self.capacity, tokens + elapsed_ns * self._tokens_per_ns)
+        return tokens
+
+    def _bucket(self, key: str, now_ns: int) -> _Bucket:
+        # Caller holds the key's stripe lock, so a concurrent reset(key) cannot leave it
+        # consuming from a record that is no longer in the table.
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.initial_tokens, now_ns)
+        return bucket
+
+    def _state_metadata(self) -> Dict[str, Any]:
+        return {"algorithm": "token_bucket", "refill_rate": self.refill_rate}
+
+    def _build_state(self, allowed: bool, tokens: float, weight: int, now_ns: int) -> RateLimitState:
+        if allowed:
+            tokens_needed = self.capacity - tokens
+            return RateLimitState(
+                limit=self.capacity,
+                remaining=int(tokens),
+                reset_at=None,
+                reset_at_ns=now_ns + int(tokens_needed * self._ns_per_token),
+                retry_after=0.0,
+                violated=False,
+                metadata_fn=self._state_metadata,
+            )
+        wait_ns = int((weight - tokens) * self._ns_per_token)
+        return RateLimitState(
+            limit=self.capacity,
+            remaining=int(tokens),
+            reset_at=None,
+            reset_at_ns=now_ns + wait_ns,
+            retry_after=wait_ns / NS_PER_SECOND,
+            violated=True,
+            metadata_fn=self._state_metadata,
+        )
 
     def allow(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
         if weight <= 0:
             raise ValueError("weight must be positive")
-        current_time = time.time()
-        with self._lock:
-            tokens, last_refill = self._refill_tokens(key, current_time)
-            if tokens >= weight:
-                tokens -= weight
-                self._buckets[key] = (tokens, current_time)
-                tokens_needed = self.capacity - tokens
-                seconds_to_full = (tokens_needed / self.refill_rate) * self.refill_period
-                reset_at = datetime.fromtimestamp(current_time + seconds_to_full)
-                state = RateLimitState(
-                    limit=self.capacity,
-                    remaining=int(tokens),
-                    reset_at=reset_at,
-                    retry_after=0.0,
-                    violated=False,
-                    metadata={"algorithm": "token_bucket", "refill_rate": self.refill_rate},
-                )
-                return (True, state)
-            else:
-                self._buckets[key] = (tokens, current_time)
-                tokens_needed = weight - tokens
-                retry_after = (tokens_needed / self.refill_rate) * self.refill_period
-                reset_at = datetime.fromtimestamp(current_time + retry_after)
-                state = RateLimitState(
-                    limit=self.capacity,
-                    remaining=int(tokens),
-                    reset_at=reset_at,
-                    retry_after=retry_after,
-                    violated=True,
-                    metadata={"algorithm": "token_bucket", "refill_rate": self.refill_rate},
-                )
-                return (False, state)
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            allowed, tokens = self._consume(self._bucket(key, now_ns), weight, now_ns)
+        return (allowed, self._build_state(allowed, tokens, weight, now_ns))
+
+    def allow_many(self, requests: List[Tuple[str, int]]) -> List[Tuple[bool, RateLimitState]]:
+        for _, weight in requests:
+            if weight <= 0:
+                raise ValueError("weight must be positive")
+        now_ns = time.monotonic_ns()
+        consume = self._consume
+        bucket = self._bucket
+        with self._locks.for_keys(key for key, _ in requests):
+            outcomes = [consume(bucket(key, now_ns), weight, now_ns) for key, weight in requests]
+        return [
+            (allowed, self._build_state(allowed, tokens, weight, now_ns))
+            for (allowed, tokens), (_, weight) in zip(outcomes, requests)
+        ]
+
+    def allow_batch(self, key: str, n: int) -> int:
+        if n <= 0:
+            raise ValueError("n must be positive")
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            bucket = self._bucket(key, now_ns)
+            tokens = self._refill_tokens(bucket, now_ns)
+            granted = min(n, int(tokens))
+            bucket.tokens = tokens - granted
+            bucket.last_refill = now_ns
+        return granted
 
     async def acquire_async(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
         return self.allow(key, weight)
 
+    def fast_deny(self, key: str, weight: int = 1) -> Optional[RateLimitState]:
+        # Relaxed, lock-free read for callers that only want to shed obvious denials early;
+        # allow()/check() remain authoritative.
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return None
+        # Writers store tokens before last_refill, so reading last_refill first means a racing
+        # update can only overstate the refill: any error lets the request through to allow().
+        last_refill = bucket.last_refill
+        tokens = bucket.tokens
+        now_ns = time.monotonic_ns()
+        elapsed_ns = now_ns - last_refill
+        if elapsed_ns > 0:
+            tokens = min(self.capacity, tokens + elapsed_ns * self._tokens_per_ns)
+        if tokens >= weight:
+            return None
+        return self._build_state(False, tokens, weight, now_ns)
+
     def check(self, key: str) -> RateLimitState:
-        current_time = time.time()
-        with self._lock:
-            tokens, _ = self._refill_tokens(key, current_time)
+        now_ns = time.monotonic_ns()
+        with self._locks.for_key(key):
+            bucket = self._buckets.get(key)
+            tokens: float
+            if bucket is None:
+                tokens = self.initial_tokens
+            else:
+                tokens = self._refill_tokens(bucket, now_ns)
             tokens_needed = self.capacity - tokens
-            seconds_to_full = (tokens_needed / self.refill_rate) * self.refill_period
-            reset_at = datetime.fromtimestamp(current_time + seconds_to_full)
+            reset_at = monotonic_to_datetime(now_ns + int(tokens_needed * self._ns_per_token))
             return RateLimitState(
                 limit=self.capacity,
                 remaining=int(tokens),
@@ -91,8 +177,9 @@ class TokenBucketAlgorithm(Algorithm):
             )
 
     def reset(self, key: Optional[str] = None) -> None:
-        with self._lock:
-            if key is None:
+        if key is None:
+            with self._locks.all():
                 self._buckets.clear()
-            elif key in self._buckets:
-                del self._buckets[key]
\ No newline at end of file
+        else:
+            with self._locks.for_key(key):
+                self._buckets.pop(key, None)
\ No newline at end of file
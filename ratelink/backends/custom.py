@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from typing import Optional
-from ..core.types import RateLimitState
+from ..core.types import RateLimitState, join_key
 
 class CustomBackendInterface(ABC):
     @abstractmethod
@@ -51,7 +51,7 @@ class MemcachedBackend(CustomBackendInterface):
 
     def check(self, key: str) -> RateLimitState:
         from datetime import datetime
-        value = self.client.get(f"ratelimit:{key}")
+        value = self.client.get(f"ratelimit:{join_key(key)}")
         if value is None:
             return RateLimitState(
                 limit=0,
@@ -82,7 +82,7 @@ class MemcachedBackend(CustomBackendInterface):
         
         from datetime import datetime, timedelta
 
-        memkey = f"ratelimit:{key}"
+        memkey = f"ratelimit:{join_key(key)}"
 
         remaining = self.client.decr(memkey, weight)
 
@@ -109,7 +109,7 @@ class MemcachedBackend(CustomBackendInterface):
         if key is None:
             self.client.flush_all()
         else:
-            self.client.delete(f"ratelimit:{key}")
+            self.client.delete(f"ratelimit:{join_key(key)}")
 
     async def check_async(self, key: str) -> RateLimitState:
         return self.check(key)
@@ -1,6 +1,6 @@
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Sequence
 from ..core.abstractions import Backend
 from ..core.types import RateLimitState, BackendError
 
@@ -11,6 +11,17 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 
+DEFAULT_LIMIT = 10000
+# DynamoDB caps BatchGetItem at 100 keys per call.
+BATCH_GET_SIZE = 100
+MAX_BATCH_RETRIES = 5
+
+
+def _chunked(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
 class DynamoDBBackend(Backend):
     def __init__(
         self,
@@ -132,7 +143,6 @@ class DynamoDBBackend(Backend):
         try:
             current_time = time.time()
             reset_timestamp = current_time + 3600
-            ttl = int(reset_timestamp) + 86400
             try:
                 response = self.table.update_item(
                     Key={"key": key},
@@ -161,28 +171,8 @@ class DynamoDBBackend(Backend):
                 if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
                     state = self.check(key)
                     if state.limit == 0:
-                        limit_value = 10000
-                        remaining = limit_value - weight
-                        self.table.put_item(
-                            Item={
-                                "key": key,
-                                "limit_value": limit_value,
-                                "remaining": remaining,
-                                "reset_at": reset_timestamp,
-                                "created_at": current_time,
-                                "updated_at": current_time,
-                                self.ttl_attribute: ttl,
-                                "metadata": {"backend": "dynamodb"},
-                            }
-                        )
-                        return RateLimitState(
-                            limit=limit_value,
-                            remaining=remaining,
-                            reset_at=datetime.fromtimestamp(reset_timestamp),
-                            retry_after=0.0,
-                            violated=False,
-                            metadata={"backend": "dynamodb"},
-                        )
+                        self.table.put_item(Item=self._new_item(key, weight, current_time))
+                        return self._new_state(weight, reset_timestamp)
                     else:
                         return RateLimitState(
                             limit=state.limit,
@@ -198,6 +188,96 @@ class DynamoDBBackend(Backend):
         except Exception as e:
             raise BackendError(f"DynamoDB consume failed: {e}")
 
+    def _new_item(self, key: str, weight: int, current_time: float) -> Dict[str, Any]:
+        reset_timestamp = current_time + 3600
+        return {
+            "key": key,
+            "limit_value": DEFAULT_LIMIT,
+            "remaining": DEFAULT_LIMIT - weight,
+            "reset_at": reset_timestamp,
+            "created_at": current_time,
+            "updated_at": current_time,
+            self.ttl_attribute: int(reset_timestamp) + 86400,
+            "metadata": {"backend": "dynamodb"},
+        }
+
+    def _new_state(self, weight: int, reset_timestamp: float) -> RateLimitState:
+        return RateLimitState(
+            limit=DEFAULT_LIMIT,
+            remaining=DEFAULT_LIMIT - weight,
+            reset_at=datetime.fromtimestamp(reset_timestamp),
+            retry_after=0.0,
+            violated=False,
+            metadata={"backend": "dynamodb"},
+        )
+
+    def _existing_keys(self, keys: Sequence[str], current_time: float) -> set:
+        existing = set()
+        for chunk in _chunked(keys, BATCH_GET_SIZE):
+            request = {
+                self.table_name: {
+                    "Keys": [{"key": key} for key in chunk],
+                    "ProjectionExpression": "#k, #ttl",
+                    "ExpressionAttributeNames": {"#k": "key", "#ttl": self.ttl_attribute},
+                    "ConsistentRead": self.consistent_reads,
+                }
+            }
+            for attempt in range(MAX_BATCH_RETRIES + 1):
+                response = self.dynamodb.batch_get_item(RequestItems=request)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    ttl = item.get(self.ttl_attribute, 0)
+                    if not (ttl > 0 and ttl < current_time):
+                        existing.add(item["key"])
+                request = response.get("UnprocessedKeys") or {}
+                if not request:
+                    break
+                if attempt < MAX_BATCH_RETRIES:
+                    time.sleep(0.05 * (2 ** attempt))
+            else:
+                raise BackendError("DynamoDB batch read left unprocessed keys")
+        return existing
+
+    def _put_new(self, key: str, weight: int, current_time: float) -> bool:
+        try:
+            self.table.put_item(
+                Item=self._new_item(key, weight, current_time),
+                ConditionExpression="attribute_not_exists(#k) OR #ttl < :now",
+                ExpressionAttributeNames={"#k": "key", "#ttl": self.ttl_attribute},
+                ExpressionAttributeValues={":now": current_time},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+        return True
+
+    def consume_many(self, keys: Sequence[str], weight: int) -> List[RateLimitState]:
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        # One BatchGetItem pass finds the keys that already hold a counter; those need a
+        # conditional update each. First-seen keys are created with a conditional put, so a
+        # counter another caller created since the read is consumed instead of overwritten.
+        try:
+            current_time = time.time()
+            existing = self._existing_keys(list(dict.fromkeys(keys)), current_time)
+        except BackendError:
+            raise
+        except Exception as e:
+            raise BackendError(f"DynamoDB batch consume failed: {e}")
+        states = []
+        for key in keys:
+            if key not in existing:
+                existing.add(key)
+                try:
+                    created = self._put_new(key, weight, current_time)
+                except Exception as e:
+                    raise BackendError(f"DynamoDB batch consume failed: {e}")
+                if created:
+                    states.append(self._new_state(weight, current_time + 3600))
+                    continue
+            states.append(self.consume(key, weight))
+        return states
+
     def peek(self, key: str) -> RateLimitState:
         return self.check(key)
 
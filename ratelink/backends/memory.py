@@ -1,44 +1,84 @@
 import time
 from datetime import datetime, timedelta
 from threading import RLock
-from typing import Dict, Optional, Any
+from typing import Callable, Dict, Optional, Any
 from ..core.abstractions import Backend
 from ..core.types import RateLimitState
 
 
+class _Entry:
+    # Slotted record per key: far smaller than the dict it replaces and read by attribute.
+    __slots__ = ("limit", "remaining", "reset_at", "retry_after", "violated", "timestamp", "metadata")
+
+    def __init__(
+        self,
+        limit: int,
+        remaining: int,
+        reset_at: datetime,
+        retry_after: float,
+        violated: bool,
+        timestamp: float,
+        metadata: Dict[str, Any],
+    ) -> None:
+        self.limit = limit
+        self.remaining = remaining
+        self.reset_at = reset_at
+        self.retry_after = retry_after
+        self.violated = violated
+        self.timestamp = timestamp
+        self.metadata = metadata
+
+    def to_state(self) -> RateLimitState:
+        return RateLimitState(
+            limit=self.limit,
+            remaining=self.remaining,
+            reset_at=self.reset_at,
+            retry_after=self.retry_after,
+            violated=self.violated,
+            metadata=self.metadata,
+        )
+
+
 class MemoryBackend(Backend):
-    def __init__(self, ttl_seconds: Optional[float] = None, cleanup_interval: float = 60.0) -> None:
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        cleanup_interval: float = 60.0,
+        time_source: Callable[[], float] = time.monotonic,
+    ) -> None:
         if ttl_seconds is not None and ttl_seconds <= 0:
             raise ValueError("ttl_seconds must be positive")
         if cleanup_interval <= 0:
             raise ValueError("cleanup_interval must be positive")
         self.ttl_seconds = ttl_seconds
         self.cleanup_interval = cleanup_interval
-        self._store: Dict[str, Dict[str, Any]] = {}
-        self._last_cleanup = time.time()
+        # TTL ages and cleanup scheduling run on this clock; reset_at stays wall-clock.
+        self._now = time_source
+        self._store: Dict[str, _Entry] = {}
+        self._last_cleanup = time_source()
         self._lock = RLock()
 
     def _cleanup_expired(self) -> None:
         if self.ttl_seconds is None:
             return
-        current_time = time.time()
+        current_time = self._now()
         if current_time - self._last_cleanup < self.cleanup_interval:
             return
         expired_keys = []
         for key, data in self._store.items():
-            if current_time - data["timestamp"] > self.ttl_seconds:
+            if current_time - data.timestamp > self.ttl_seconds:
                 expired_keys.append(key)
         for key in expired_keys:
             del self._store[key]
         self._last_cleanup = current_time
 
-    def _get_data(self, key: str) -> Optional[Dict[str, Any]]:
-        if key not in self._store:
+    def _get_data(self, key: str) -> Optional[_Entry]:
+        data = self._store.get(key)
+        if data is None:
             return None
-        data = self._store[key]
         if self.ttl_seconds is not None:
-            current_time = time.time()
-            if current_time - data["timestamp"] > self.ttl_seconds:
+            current_time = self._now()
+            if current_time - data.timestamp > self.ttl_seconds:
                 del self._store[key]
                 return None
         return data
@@ -57,44 +97,23 @@ class MemoryBackend(Backend):
                     violated=False,
                     metadata={},
                 )
-            return RateLimitState(
-                limit=data["limit"],
-                remaining=data["remaining"],
-                reset_at=data["reset_at"],
-                retry_after=data["retry_after"],
-                violated=data["violated"],
-                metadata=data.get("metadata", {}),
-            )
+            return data.to_state()
 
     def consume(self, key: str, weight: int) -> RateLimitState:
         if weight <= 0:
             raise ValueError("weight must be positive")
-        current_time = time.time()
+        current_time = self._now()
         with self._lock:
             self._cleanup_expired()
             data = self._get_data(key)
             if data is None:
-                data = {
-                    "limit": weight,
-                    "remaining": 0,
-                    "reset_at": datetime.fromtimestamp(current_time + 60),
-                    "retry_after": 0.0,
-                    "violated": False,
-                    "timestamp": current_time,
-                    "metadata": {},
-                }
+                data = self._store[key] = _Entry(
+                    weight, 0, datetime.now() + timedelta(seconds=60), 0.0, False, current_time, {}
+                )
             else:
-                data["remaining"] = max(0, data["remaining"] - weight)
-                data["timestamp"] = current_time
-            self._store[key] = data
-            return RateLimitState(
-                limit=data["limit"],
-                remaining=data["remaining"],
-                reset_at=data["reset_at"],
-                retry_after=data["retry_after"],
-                violated=data["violated"],
-                metadata=data.get("metadata", {}),
-            )
+                data.remaining = max(0, data.remaining - weight)
+                data.timestamp = current_time
+            return data.to_state()
 
     def peek(self, key: str) -> RateLimitState:
         return self.check(key)
@@ -129,15 +148,28 @@ class MemoryBackend(Backend):
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         with self._lock:
-            self._store[key] = {
-                "limit": limit,
-                "remaining": remaining,
-                "reset_at": reset_at,
-                "retry_after": retry_after,
-                "violated": violated,
-                "timestamp": time.time(),
-                "metadata": metadata or {},
-            }
+            self._store[key] = _Entry(
+                limit, remaining, reset_at, retry_after, violated, self._now(), metadata or {}
+            )
+
+    def set_state_many(self, items: Dict[str, Dict[str, Any]]) -> None:
+        with self._lock:
+            timestamp = self._now()
+            self._store.update(
+                (
+                    key,
+                    _Entry(
+                        state["limit"],
+                        state["remaining"],
+                        state["reset_at"],
+                        state.get("retry_after", 0.0),
+                        state.get("violated", False),
+                        timestamp,
+                        state.get("metadata") or {},
+                    ),
+                )
+                for key, state in items.items()
+            )
 
     def get_stats(self) -> Dict[str, Any]:
         with self._lock:
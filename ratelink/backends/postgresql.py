@@ -1,8 +1,10 @@
 # File: src/universal_rate_limiter/backends/postgresql.py
+import asyncio
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, List, Sequence, TypeVar
 from ..core.abstractions import Backend
 from ..core.types import RateLimitState
 from ..core.types import BackendError
@@ -21,6 +23,8 @@ try:
 except ImportError:
     ASYNCPG_AVAILABLE = False
 
+_T = TypeVar("_T")
+
 class PostgreSQLBackend(Backend):
     def __init__(
         self,
@@ -68,6 +72,11 @@ class PostgreSQLBackend(Backend):
             raise BackendError(f"PostgreSQL health check failed: {e}")
         finally:
             self.pool.putconn(conn)
+        # One worker per pooled connection so concurrent async calls never exhaust the pool.
+        self._executor = ThreadPoolExecutor(max_workers=pool_size + max_overflow)
+
+    def _run_async(self, func: Callable[..., _T], *args: Any) -> "asyncio.Future[_T]":
+        return asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
 
     def _create_table(self) -> None:
         conn = self.pool.getconn()
@@ -246,6 +255,90 @@ class PostgreSQLBackend(Backend):
         finally:
             self.pool.putconn(conn)
 
+    def consume_many(self, keys: Sequence[str], weight: int) -> List[RateLimitState]:
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        self._cleanup_expired()
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return []
+        limit_value = 10000
+        reset_at = datetime.now() + timedelta(seconds=3600)
+        metadata = json.dumps({"backend": "postgresql"})
+        conn = self.pool.getconn()
+        try:
+            cursor = conn.cursor(cursor_factory=extras.RealDictCursor)
+            # One upsert for the whole batch: missing or expired keys start a fresh
+            # window, live keys are decremented only if they can afford the weight.
+            cursor.execute(
+                f"""
+                INSERT INTO {self.table_name} AS t
+                (key, limit_value, remaining, reset_at, metadata)
+                SELECT k, %s, %s, %s, %s::jsonb FROM unnest(%s::text[]) AS k
+                ON CONFLICT (key) DO UPDATE SET
+                    limit_value = CASE WHEN t.reset_at <= CURRENT_TIMESTAMP
+                        THEN EXCLUDED.limit_value ELSE t.limit_value END,
+                    remaining = CASE WHEN t.reset_at <= CURRENT_TIMESTAMP
+                        THEN EXCLUDED.remaining ELSE t.remaining - %s END,
+                    reset_at = CASE WHEN t.reset_at <= CURRENT_TIMESTAMP
+                        THEN EXCLUDED.reset_at ELSE t.reset_at END,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE t.reset_at <= CURRENT_TIMESTAMP OR t.remaining >= %s
+                RETURNING key, limit_value, remaining, reset_at, metadata
+                """,
+                (limit_value, limit_value - weight, reset_at, metadata, unique, weight, weight),
+            )
+            rows = cursor.fetchall()
+            granted = {row["key"]: row for row in rows}
+            denied: Dict[str, Any] = {}
+            rejected = [key for key in unique if key not in granted]
+            if rejected:
+                cursor.execute(
+                    f"""
+                    SELECT key, limit_value, remaining, reset_at, metadata
+                    FROM {self.table_name}
+                    WHERE key = ANY(%s)
+                    """,
+                    (rejected,),
+                )
+                denied = {row["key"]: row for row in cursor.fetchall()}
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            raise BackendError(f"PostgreSQL batch consume failed: {e}")
+        finally:
+            self.pool.putconn(conn)
+        now = datetime.now()
+        states = []
+        pending = set(unique)
+        for key in keys:
+            if key not in pending:
+                # Repeats within one batch cannot share a single upsert row.
+                states.append(self.consume(key, weight))
+                continue
+            pending.discard(key)
+            row = granted.get(key)
+            if row is not None:
+                states.append(RateLimitState(
+                    limit=row["limit_value"],
+                    remaining=row["remaining"],
+                    reset_at=row["reset_at"],
+                    retry_after=0.0,
+                    violated=False,
+                    metadata=row["metadata"] or {"backend": "postgresql"},
+                ))
+                continue
+            row = denied[key]
+            states.append(RateLimitState(
+                limit=row["limit_value"],
+                remaining=row["remaining"],
+                reset_at=row["reset_at"],
+                retry_after=max(0.0, (row["reset_at"] - now).total_seconds()),
+                violated=True,
+                metadata=row["metadata"] or {"backend": "postgresql"},
+            ))
+        return states
+
     def peek(self, key: str) -> RateLimitState:
         return self.check(key)
 
@@ -266,18 +359,19 @@ class PostgreSQLBackend(Backend):
             self.pool.putconn(conn)
 
     async def check_async(self, key: str) -> RateLimitState:
-        return self.check(key)
+        return await self._run_async(self.check, key)
 
     async def consume_async(self, key: str, weight: int) -> RateLimitState:
-        return self.consume(key, weight)
+        return await self._run_async(self.consume, key, weight)
 
     async def peek_async(self, key: str) -> RateLimitState:
-        return self.peek(key)
+        return await self._run_async(self.peek, key)
 
     async def reset_async(self, key: Optional[str] = None) -> None:
-        self.reset(key)
+        await self._run_async(self.reset, key)
 
     def close(self) -> None:
+        self._executor.shutdown(wait=False)
         try:
             self.pool.closeall()
         except Exception:
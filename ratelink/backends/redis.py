@@ -2,7 +2,7 @@ import time
 from datetime import datetime, timedelta
 from typing import Optional, Dict, Any, List
 from ..core.abstractions import Backend
-from ..core.types import RateLimitState, BackendError
+from ..core.types import RateLimitKey, RateLimitState, BackendError, join_key
 
 try:
     import redis
@@ -102,8 +102,8 @@ class RedisBackend(Backend):
         except Exception as e:
             raise BackendError(f"Failed to connect to Redis: {e}")
 
-    def _build_key(self, key: str) -> str:
-        return f"ratelimit:{key}"
+    def _build_key(self, key: RateLimitKey) -> str:
+        return f"ratelimit:{join_key(key)}"
 
     def check(self, key: str) -> RateLimitState:
         try:
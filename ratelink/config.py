@@ -1,11 +1,22 @@
 import os
+import re
 try:
     import yaml
     YAML_AVAILABLE = True
+    # CSafeLoader only exists when PyYAML was built against libyaml.
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 except ImportError:
     YAML_AVAILABLE = False
 import json
-from typing import Dict, Any, Optional, Union, Callable, List
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+from collections import OrderedDict
+from threading import Lock
+from types import MappingProxyType
+from typing import IO, Dict, Any, Optional, Union, Callable, Hashable, List, Mapping, Tuple, cast
 from pathlib import Path
 from datetime import time as datetime_time
 
@@ -17,6 +28,13 @@ except ImportError:
     class BaseModel:
         pass
 from .core.types import ConfigError
+from .core.clock import WINDOW_SECONDS
+
+# HH:MM with a 0-23 hour and 0-59 minute; single-digit parts are accepted as before.
+_TIME_RE = re.compile(r"([01]?\d|2[0-3]):([0-5]?\d)")
+
+# Marks a user-tier field left out of the config; the caller's default applies.
+_INHERIT = object()
 
 if PYDANTIC_AVAILABLE:
     class BackendConfig(BaseModel):
@@ -35,14 +53,9 @@ if PYDANTIC_AVAILABLE:
 
         @validator("start", "end")
         def validate_time_format(cls, v: str) -> str:
-            try:
-                hours, minutes = v.split(":")
-                h, m = int(hours), int(minutes)
-                if not (0 <= h < 24 and 0 <= m < 60):
-                    raise ValueError
-                return v
-            except (ValueError, AttributeError):
+            if not isinstance(v, str) or _TIME_RE.fullmatch(v) is None:
                 raise ValueError(f"Invalid time format: {v}. Expected HH:MM")
+            return v
 
     class EndpointConfig(BaseModel):
         algorithm: Optional[str] = None
@@ -77,44 +90,132 @@ if PYDANTIC_AVAILABLE:
         rate_limiting: RateLimitingConfig
 
 
+def freeze_config(config: Any) -> Any:
+    if isinstance(config, Mapping):
+        return MappingProxyType({key: freeze_config(value) for key, value in config.items()})
+    if isinstance(config, list):
+        return tuple(freeze_config(value) for value in config)
+    return config
+
+def _canonical_key(config: Any) -> Hashable:
+    # Leaves keep their type so values that compare equal across types (1, 1.0, True) stay distinct.
+    if isinstance(config, Mapping):
+        return (dict, tuple([(key, _canonical_key(value)) for key, value in config.items()]))
+    if isinstance(config, (list, tuple)):
+        return (list, tuple([_canonical_key(value) for value in config]))
+    return (type(config), config)
+
+def thaw_config(config: Any) -> Any:
+    if isinstance(config, Mapping):
+        return {key: thaw_config(value) for key, value in config.items()}
+    if isinstance(config, tuple):
+        return [thaw_config(value) for value in config]
+    return config
+
+
+# RATELINK_<NAME> -> (default config field, converter); BACKEND_* keys become backend options.
+_ENV_FIELDS: Dict[str, Tuple[str, Callable[[str], Any]]] = {
+    "ALGORITHM": ("algorithm", str),
+    "BACKEND": ("backend", str),
+    "LIMIT": ("limit", int),
+    "WINDOW": ("window", str),
+}
+
+
 class ConfigLoader:
+    # Shared across loaders: RateLimiter.from_config builds a fresh loader per call.
+    # One entry per resolved path, invalidated by (mtime_ns, size).
+    _file_cache: Dict[str, Tuple[Tuple[int, int], Mapping[str, Any]]] = {}
+    _file_cache_lock = Lock()
+    # prefix -> (matching environ items, frozen validated config); a changed value re-parses.
+    _env_cache: Dict[str, Tuple[Tuple[Tuple[str, str], ...], Mapping[str, Any]]] = {}
+    # Canonical form of a config dict -> frozen validated config, least recently used evicted first.
+    _dict_cache: "OrderedDict[Hashable, Mapping[str, Any]]" = OrderedDict()
+    _dict_cache_size = 64
+
     def __init__(self) -> None:
         self._watchers: Dict[str, Callable] = {}
 
-    def load(self, source: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
+    def load(self, source: Union[str, Path, Dict[str, Any], IO]) -> Dict[str, Any]:
         if isinstance(source, dict):
             return self._validate_config(source)
+        if hasattr(source, "read"):
+            return self.loads(source.read(), Path(getattr(source, "name", "")).suffix)
+        return cast(Dict[str, Any], thaw_config(self._load_file(source)))
+
+    def loads(self, content: Union[str, bytes], fmt: str) -> Dict[str, Any]:
+        return self._parser_for(fmt)(content)
+
+    def load_frozen(self, source: Union[str, Path, Dict[str, Any]]) -> Mapping[str, Any]:
+        # Read-only view; file configs are shared by reference with the cache instead of copied.
+        if isinstance(source, dict):
+            return self._load_dict(source)
+        return self._load_file(source)
+
+    def _load_dict(self, source: Dict[str, Any]) -> Mapping[str, Any]:
+        try:
+            cache_key = _canonical_key(source)
+            hash(cache_key)
+        except TypeError:
+            return cast(Mapping[str, Any], freeze_config(self._validate_config(source)))
+        with self._file_cache_lock:
+            cached = self._dict_cache.get(cache_key)
+            if cached is not None:
+                self._dict_cache.move_to_end(cache_key)
+                return cached
+        frozen = cast(Mapping[str, Any], freeze_config(self._validate_config(source)))
+        with self._file_cache_lock:
+            self._dict_cache[cache_key] = frozen
+            if len(self._dict_cache) > self._dict_cache_size:
+                self._dict_cache.popitem(last=False)
+        return frozen
+
+    def _parser_for(self, fmt: str) -> Callable[[Union[str, bytes]], Dict[str, Any]]:
+        normalized = fmt.lower().lstrip(".")
+        if normalized in ("yaml", "yml"):
+            return self._load_yaml
+        if normalized == "json":
+            return self._load_json
+        raise ConfigError(f"Unsupported config format: {fmt}")
+
+    def _load_file(self, source: Union[str, Path]) -> Mapping[str, Any]:
         source_path = Path(source)
         
         if not source_path.exists():
             raise ConfigError(f"Config file not found: {source}")
 
-        if source_path.suffix in [".yaml", ".yml"]:
-            return self._load_yaml(source_path)
-        elif source_path.suffix == ".json":
-            return self._load_json(source_path)
-        else:
-            raise ConfigError(f"Unsupported config format: {source_path.suffix}")
-
-    def _load_yaml(self, path: Path) -> Dict[str, Any]:
+        parse = self._parser_for(source_path.suffix)
+        stat = source_path.stat()
+        cache_key = str(source_path.resolve())
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_cache.get(cache_key)
+        if cached is None or cached[0] != version:
+            try:
+                data = source_path.read_bytes()
+            except OSError as e:
+                raise ConfigError(f"Failed to read config file: {e}")
+            cached = (version, freeze_config(parse(data)))
+            with self._file_cache_lock:
+                self._file_cache[cache_key] = cached
+        return cached[1]
+
+    def _load_yaml(self, content: Union[str, bytes]) -> Dict[str, Any]:
         if not YAML_AVAILABLE:
             raise ConfigError(
                 "PyYAML is required to load YAML config files. "
                 "Install with: pip install pyyaml"
             )
         try:
-            with open(path, "r") as f:
-                config = yaml.safe_load(f)
+            config = yaml.load(content, Loader=_YAML_LOADER)
             return self._validate_config(config)
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML: {e}")
         except Exception as e:
             raise ConfigError(f"Failed to load YAML: {e}")
 
-    def _load_json(self, path: Path) -> Dict[str, Any]:
+    def _load_json(self, content: Union[str, bytes]) -> Dict[str, Any]:
         try:
-            with open(path, "r") as f:
-                config = json.load(f)
+            config = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
             return self._validate_config(config)
         except json.JSONDecodeError as e:
             raise ConfigError(f"Invalid JSON: {e}")
@@ -122,6 +223,11 @@ class ConfigLoader:
             raise ConfigError(f"Failed to load JSON: {e}")
 
     def load_from_env(self, prefix: str = "RATELINK_") -> Dict[str, Any]:
+        items = tuple([(key, value) for key, value in os.environ.items() if key.startswith(prefix)])
+        cached = self._env_cache.get(prefix)
+        if cached is not None and cached[0] == items:
+            return cast(Dict[str, Any], thaw_config(cached[1]))
+
         config: Dict[str, Any] = {
             "rate_limiting": {
                 "default": {},
@@ -131,27 +237,23 @@ class ConfigLoader:
         }
 
         default = config["rate_limiting"]["default"]
-        if f"{prefix}ALGORITHM" in os.environ:
-            default["algorithm"] = os.environ[f"{prefix}ALGORITHM"]
-
-        if f"{prefix}BACKEND" in os.environ:
-            default["backend"] = os.environ[f"{prefix}BACKEND"]
-
-        if f"{prefix}LIMIT" in os.environ:
-            default["limit"] = int(os.environ[f"{prefix}LIMIT"])
-
-        if f"{prefix}WINDOW" in os.environ:
-            default["window"] = os.environ[f"{prefix}WINDOW"]
         backend_options = {}
-        for key, value in os.environ.items():
-            if key.startswith(f"{prefix}BACKEND_"):
-                option_name = key[len(f"{prefix}BACKEND_"):].lower()
-                backend_options[option_name] = value
+        prefix_len = len(prefix)
+        for key, value in items:
+            name = key[prefix_len:]
+            field = _ENV_FIELDS.get(name)
+            if field is not None:
+                default[field[0]] = field[1](value)
+            elif name.startswith("BACKEND_"):
+                backend_options[name[len("BACKEND_"):].lower()] = value
 
         if backend_options:
             default["backend_options"] = backend_options
 
-        return self._validate_config(config)
+        validated = self._validate_config(config)
+        with self._file_cache_lock:
+            self._env_cache[prefix] = (items, freeze_config(validated))
+        return validated
 
     def _validate_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         if not PYDANTIC_AVAILABLE:
@@ -183,59 +285,116 @@ class ConfigLoader:
         self._watchers[str(path)] = observer
 
 
+class CompiledRule:
+    __slots__ = ("limit", "window", "window_seconds")
+
+    def __init__(self, limit: Any, window: Any) -> None:
+        self.limit = limit
+        self.window = window
+        self.window_seconds = _window_seconds(window)
+
+
+def _window_seconds(window: Any) -> Optional[int]:
+    if isinstance(window, int):
+        return window
+    if isinstance(window, str):
+        return WINDOW_SECONDS.get(window.lower(), 3600)
+    return None
+
+def _time_of_day_us(value: datetime_time) -> int:
+    return ((value.hour * 60 + value.minute) * 60 + value.second) * 1_000_000 + value.microsecond
+
+
 class RuleEngine:
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Mapping[str, Any]) -> None:
         self.config = config
         self.rate_limiting = config.get("rate_limiting", {})
+        self._endpoints = self.rate_limiting.get("endpoints", {})
+        self._users = self.rate_limiting.get("users", {})
+        # Flat path -> CompiledRule and tier -> CompiledRule tables, plus
+        # endpoint -> [(start_us, end_us, wraps_midnight, CompiledRule)], all built once here.
+        self._endpoint_rules: Dict[str, CompiledRule] = {}
+        self._user_rules: Dict[str, CompiledRule] = {}
+        self._time_idx: Dict[str, List[tuple]] = {}
+        for endpoint, endpoint_config in self._endpoints.items():
+            self._endpoint_rules[endpoint] = CompiledRule(
+                endpoint_config["limit"], endpoint_config["window"]
+            )
+            time_ranges = endpoint_config.get("time_ranges")
+            if time_ranges:
+                self._time_idx[endpoint] = self._compile_time_ranges(time_ranges)
+        for tier, user_config in self._users.items():
+            self._user_rules[tier] = CompiledRule(
+                user_config.get("limit", _INHERIT), user_config.get("window", _INHERIT)
+            )
+        default = self.rate_limiting.get("default")
+        self._default_rule = (
+            CompiledRule(default.get("limit", 1000), default.get("window", "hour")) if default else None
+        )
+
+    def get_rule(self, key: str) -> Optional[CompiledRule]:
+        kind, _, name = key.partition(":")
+        if kind == "endpoint":
+            return self._endpoint_rules.get(name)
+        if kind == "user":
+            return self._user_rules.get(name)
+        return None
+
+    def resolve_endpoint(self, endpoint: str) -> Optional[CompiledRule]:
+        return self._endpoint_rules.get(endpoint, self._default_rule)
 
     def get_limit_for_endpoint(
         self, endpoint: str, default_limit: int, default_window: Union[int, str]
     ) -> tuple[int, Union[int, str]]:
-        endpoints = self.rate_limiting.get("endpoints", {})
-
-        if endpoint in endpoints:
-            endpoint_config = endpoints[endpoint]
-            return endpoint_config["limit"], endpoint_config["window"]
+        rule = self._endpoint_rules.get(endpoint)
+        if rule is not None:
+            return rule.limit, rule.window
 
         return default_limit, default_window
 
     def get_limit_for_user(
         self, user_tier: str, default_limit: int, default_window: Union[int, str]
     ) -> tuple[Optional[int], Union[int, str]]:
-        users = self.rate_limiting.get("users", {})
-        if user_tier in users:
-            user_config = users[user_tier]
-            limit = user_config.get("limit", default_limit)
-            window = user_config.get("window", default_window)
+        rule = self._user_rules.get(user_tier)
+        if rule is not None:
+            limit = default_limit if rule.limit is _INHERIT else rule.limit
+            window = default_window if rule.window is _INHERIT else rule.window
             return limit, window
         return default_limit, default_window
 
     def get_limit_for_time(
         self, endpoint: str, current_time: Optional[datetime_time] = None
     ) -> Optional[tuple[int, Union[int, str]]]:
-        from datetime import datetime
+        ranges = self._time_idx.get(endpoint)
+        if ranges is None:
+            return None
         if current_time is None:
+            from datetime import datetime
             current_time = datetime.now().time()
-        endpoints = self.rate_limiting.get("endpoints", {})
-        if endpoint not in endpoints:
-            return None
-        endpoint_config = endpoints[endpoint]
-        time_ranges = endpoint_config.get("time_ranges", [])
-        for time_range in time_ranges:
-            start = self._parse_time(time_range["start"])
-            end = self._parse_time(time_range["end"])
-            if self._time_in_range(current_time, start, end):
-                return time_range["limit"], time_range["window"]
+        now_us = _time_of_day_us(current_time)
+        for start, end, wraps, rule in ranges:
+            if wraps:
+                if now_us >= start or now_us <= end:
+                    return rule.limit, rule.window
+            elif start <= now_us <= end:
+                return rule.limit, rule.window
         return None
 
+    def _compile_time_ranges(self, time_ranges: List[Mapping[str, Any]]) -> List[tuple]:
+        # Kept in config order: the first matching range wins, so overlaps must not be re-sorted.
+        compiled = []
+        for time_range in time_ranges:
+            start = _time_of_day_us(self._parse_time(time_range["start"]))
+            end = _time_of_day_us(self._parse_time(time_range["end"]))
+            rule = CompiledRule(time_range["limit"], time_range["window"])
+            compiled.append((start, end, start > end, rule))
+        return compiled
+
     def _parse_time(self, time_str: str) -> datetime_time:
+        match = _TIME_RE.fullmatch(time_str)
+        if match is not None:
+            return datetime_time(int(match[1]), int(match[2]))
+
         from datetime import datetime
 
         return datetime.strptime(time_str, "%H:%M").time()
-
-    def _time_in_range(
-        self, current: datetime_time, start: datetime_time, end: datetime_time) -> bool:
-        if start <= end:
-            return start <= current <= end
-        else:
-            return current >= start or current <= end
\ No newline at end of file
@@ -1,8 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Tuple, Optional, Awaitable
+from typing import Any, Tuple, Optional, Awaitable
 from .types import RateLimitState
 
 class Algorithm(ABC):
+    # allow() is the primary, purely synchronous decision path; acquire_async()
+    # delegates to it, never the other way round, so sync callers never touch
+    # the event loop or copy a contextvars.Context.
+    # Set when acquire_async() only returns allow(); RateLimiter.acquire then calls allow()
+    # itself instead of creating and awaiting the extra coroutine.
+    acquire_is_allow: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # A subclass that overrides acquire_async() without restating the flag must be awaited,
+        # even when its base set acquire_is_allow.
+        if "acquire_async" in cls.__dict__ and "acquire_is_allow" not in cls.__dict__:
+            cls.acquire_is_allow = False
+
     @abstractmethod
     def allow(self, key: str, weight: int = 1) -> Tuple[bool, RateLimitState]:
         pass
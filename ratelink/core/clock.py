@@ -0,0 +1,34 @@
+import time
+from datetime import datetime
+
+NS_PER_SECOND = 1_000_000_000
+
+WINDOW_SECONDS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+    "week": 604800,
+}
+
+# Captured once so monotonic readings can be reported as wall-clock values
+# without a second clock call per request. It is not refreshed: after the system
+# clock is stepped (e.g. by NTP), reported reset times stay offset from wall time
+# by the step until the process restarts. Limits themselves are unaffected.
+WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def seconds_to_ns(seconds: float) -> int:
+    return round(seconds * NS_PER_SECOND)
+
+
+def ns_to_seconds(ns: int) -> float:
+    return ns / NS_PER_SECOND
+
+
+def monotonic_to_timestamp(ns: int) -> float:
+    return (ns + WALL_OFFSET_NS) / NS_PER_SECOND
+
+
+def monotonic_to_datetime(ns: int) -> datetime:
+    return datetime.fromtimestamp((ns + WALL_OFFSET_NS) / NS_PER_SECOND)
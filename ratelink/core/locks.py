@@ -0,0 +1,41 @@
+from contextlib import contextmanager
+from threading import Lock
+from typing import Hashable, Iterable, Iterator
+
+SHARD_COUNT = 64
+
+
+class StripedLock:
+    __slots__ = ("_shards", "_mask")
+
+    def __init__(self, shards: int = SHARD_COUNT) -> None:
+        if shards <= 0 or shards & (shards - 1):
+            raise ValueError("shards must be a positive power of two")
+        self._shards = [Lock() for _ in range(shards)]
+        self._mask = shards - 1
+
+    def for_key(self, key: Hashable) -> Lock:
+        return self._shards[hash(key) & self._mask]
+
+    @contextmanager
+    def for_keys(self, keys: Iterable[Hashable]) -> Iterator[None]:
+        # Shards are always taken in index order so overlapping batches cannot deadlock.
+        mask = self._mask
+        locks = [self._shards[i] for i in sorted({hash(key) & mask for key in keys})]
+        for lock in locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    @contextmanager
+    def all(self) -> Iterator[None]:
+        for lock in self._shards:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._shards):
+                lock.release()
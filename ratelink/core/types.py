@@ -1,12 +1,28 @@
+import math
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Any, Callable, Dict, Optional, Tuple, Union, cast
+from .clock import monotonic_to_datetime, monotonic_to_timestamp
+
+# dataclass(slots=True) needs 3.10; older interpreters keep the __dict__-backed layout.
+_DATACLASS_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Rate-limit keys are strings, or the string parts of a composite key (see composite_key_parts).
+RateLimitKey = Union[str, Tuple[str, ...]]
+
+
+def join_key(key: RateLimitKey) -> str:
+    # String-keyed stores see a tuple key as the same string composite_key builds from its parts.
+    return key if type(key) is str else ":".join(key)
 
 
 class AlgorithmType(Enum):
     TOKEN_BUCKET = "token_bucket"
     SLIDING_WINDOW = "sliding_window"
+    SLIDING_WINDOW_COUNTER = "sliding_window_counter"
     LEAKY_BUCKET = "leaky_bucket"
     FIXED_WINDOW = "fixed_window"
     GCRA = "gcra"
@@ -27,23 +43,99 @@ class WindowType(Enum):
     DAY = "day"
 
 
-@dataclass
 class RateLimitState:
-    limit: int
-    remaining: int
-    reset_at: datetime
-    retry_after: float
-    violated: bool
-    metadata: Dict[str, Any] = field(default_factory=dict)
-
-    def __post_init__(self) -> None:
-        if self.limit < 0:
+    __slots__ = (
+        "limit", "remaining", "_reset_at", "_reset_at_ns", "retry_after", "violated",
+        "_metadata", "_metadata_fn",
+    )
+
+    def __init__(
+        self,
+        limit: int,
+        remaining: int,
+        reset_at: Optional[datetime],
+        retry_after: float,
+        violated: bool,
+        metadata: Optional[Dict[str, Any]] = None,
+        metadata_fn: Optional[Callable[[], Dict[str, Any]]] = None,
+        reset_at_ns: Optional[int] = None,
+    ) -> None:
+        if limit < 0:
             raise ValueError("limit must be non-negative")
-        if self.remaining < 0:
-            self.remaining = 0
-
-
-@dataclass
+        if reset_at is None and reset_at_ns is None:
+            raise ValueError("reset_at or reset_at_ns is required")
+        self.limit = limit
+        self.remaining = remaining if remaining > 0 else 0
+        # Like metadata_fn: algorithms on the monotonic clock may pass reset_at=None with a
+        # reset_at_ns reading, and the datetime is only built if .reset_at is read.
+        self._reset_at = reset_at
+        self._reset_at_ns = reset_at_ns
+        self.retry_after = retry_after
+        self.violated = violated
+        # Algorithms may hand over a factory instead of a dict; it only runs if
+        # someone actually reads .metadata.
+        if metadata is None and metadata_fn is None:
+            metadata = {}
+        self._metadata = metadata
+        self._metadata_fn = metadata_fn
+
+    @property
+    def reset_at(self) -> datetime:
+        reset_at = self._reset_at
+        if reset_at is None:
+            # __init__ guarantees the monotonic reading is present whenever reset_at is not.
+            reset_at = self._reset_at = monotonic_to_datetime(cast(int, self._reset_at_ns))
+            self._reset_at_ns = None
+        return reset_at
+
+    @reset_at.setter
+    def reset_at(self, value: datetime) -> None:
+        self._reset_at = value
+        self._reset_at_ns = None
+
+    @property
+    def reset_epoch(self) -> int:
+        # Whole epoch seconds for reset headers, rounded up; skips building the datetime when
+        # the state still holds the monotonic reading.
+        if self._reset_at is None and self._reset_at_ns is not None:
+            return math.ceil(monotonic_to_timestamp(self._reset_at_ns))
+        return math.ceil(self.reset_at.timestamp())
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        metadata = self._metadata
+        if metadata is None:
+            metadata_fn = self._metadata_fn
+            metadata = self._metadata = metadata_fn() if metadata_fn is not None else {}
+            self._metadata_fn = None
+        return metadata
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
+        self._metadata_fn = None
+
+    def __repr__(self) -> str:
+        return (
+            f"RateLimitState(limit={self.limit!r}, remaining={self.remaining!r}, "
+            f"reset_at={self.reset_at!r}, retry_after={self.retry_after!r}, "
+            f"violated={self.violated!r}, metadata={self.metadata!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (
+            self.limit == other.limit
+            and self.remaining == other.remaining
+            and self.reset_at == other.reset_at
+            and self.retry_after == other.retry_after
+            and self.violated == other.violated
+            and self.metadata == other.metadata
+        )
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class RateLimitResult:
     allowed: bool
     state: RateLimitState
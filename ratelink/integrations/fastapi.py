@@ -1,57 +1,108 @@
 import functools
+import json
 from typing import Any, Callable, Optional
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from ratelink.utils.key_generators import KeyGeneratorFunc, by_ip
 
-class FastAPIRateLimitMiddleware(BaseHTTPMiddleware):    
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_dumps(value: Any) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+_dumps: Callable[[Any], bytes] = orjson.dumps if ORJSON_AVAILABLE else _json_dumps
+
+# The 429 body only varies in limit and retry_after; everything around them is serialized once.
+_DENY_BODY_HEAD = b'{"error":"Rate limit exceeded","limit":'
+_DENY_BODY_MID = b',"remaining":0,"retry_after":'
+_JSON_CONTENT_TYPE = (b"content-type", b"application/json")
+_REMAINING_ZERO = (b"x-ratelimit-remaining", b"0")
+_RATE_HEADER_NAMES = frozenset((b"x-ratelimit-limit", b"x-ratelimit-remaining", b"x-ratelimit-reset"))
+
+@functools.lru_cache(maxsize=1024)
+def _header_value(n: int) -> bytes:
+    return str(n).encode("latin-1")
+
+class FastAPIRateLimitMiddleware:
+    # Plain ASGI rather than BaseHTTPMiddleware: no per-request task group or body streaming wrapper.
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         limiter: Any,
         key_generator: Optional[KeyGeneratorFunc] = None,
         skip_paths: Optional[list] = None
     ):
-        super().__init__(app)
+        self.app = app
         self.limiter = limiter
         self.key_generator = key_generator or by_ip()
-        self.skip_paths = set(skip_paths or [])
+        # The default by_ip() key is built inline in __call__, saving a call frame per request.
+        self._inline_ip = key_generator is None
+        self._scope_key = getattr(self.key_generator, "scope_key", None)
+        self._fast_deny = getattr(limiter, "fast_deny", None)
+        self.skip_paths = frozenset(skip_paths or [])
     
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path in self.skip_paths:
-            return await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
         
-        key = self.key_generator(request)
+        if self._inline_ip:
+            client = scope.get("client")
+            key = f"ip:{client[0]}" if client else "ip:unknown"
+        elif self._scope_key is not None:
+            key = self._scope_key(scope)
+        else:
+            key = self.key_generator(Request(scope, receive))
         
-        state = self.limiter.check(key)
+        state = self._fast_deny(key) if self._fast_deny is not None else None
+        if state is None:
+            state = self.limiter.check(key)
         
         if state.violated:
             retry_after = state.retry_after
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "error": "Rate limit exceeded",
-                    "limit": state.limit,
-                    "remaining": 0,
-                    "retry_after": retry_after
-                },
-                headers={
-                    "Retry-After": str(int(retry_after)),
-                    "X-RateLimit-Limit": str(state.limit),
-                    "X-RateLimit-Remaining": "0",
-                    "X-RateLimit-Reset": str(int(retry_after))
-                }
+            retry_after_value = _header_value(int(retry_after))
+            body = b"".join(
+                (_DENY_BODY_HEAD, _dumps(state.limit), _DENY_BODY_MID, _dumps(retry_after), b"}")
             )
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    _JSON_CONTENT_TYPE,
+                    (b"content-length", _header_value(len(body))),
+                    (b"retry-after", retry_after_value),
+                    (b"x-ratelimit-limit", _header_value(state.limit)),
+                    _REMAINING_ZERO,
+                    (b"x-ratelimit-reset", retry_after_value),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
         
-        response = await call_next(request)
-        
-        response.headers["X-RateLimit-Limit"] = str(state.limit)
-        response.headers["X-RateLimit-Remaining"] = str(state.remaining)
+        rate_headers = [
+            (b"x-ratelimit-limit", _header_value(state.limit)),
+            (b"x-ratelimit-remaining", _header_value(state.remaining)),
+        ]
         if state.retry_after:
-            response.headers["X-RateLimit-Reset"] = str(int(state.retry_after))
+            rate_headers.append((b"x-ratelimit-reset", _header_value(int(state.retry_after))))
+        
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Drop any rate headers set downstream (e.g. by @rate_limit) so each appears once.
+                headers = [
+                    header for header in message.get("headers", ())
+                    if header[0].lower() not in _RATE_HEADER_NAMES
+                ]
+                headers.extend(rate_headers)
+                message["headers"] = headers
+            await send(message)
         
-        return response
+        await self.app(scope, receive, send_with_headers)
 
 
 def rate_limit(
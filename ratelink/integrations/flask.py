@@ -1,38 +1,35 @@
 import functools
-from typing import Any, Callable, Optional, Union
-from flask import Flask, jsonify, make_response, request as flask_request
+import re
+from typing import Any, Callable, Optional, Tuple, Union
+from flask import Flask, Response, current_app, g, jsonify, make_response, request as flask_request
+from ratelink.core.types import RateLimitState
 from ratelink.utils.key_generators import KeyGeneratorFunc, by_ip
 
+_RATE_LIMIT_RE = re.compile(r"^\s*(\d+)\s*(?:/|\s+per\s+)\s*([a-z]+)\s*$")
+
+_PERIODS = {
+    'second': 1,
+    'seconds': 1,
+    'minute': 60,
+    'minutes': 60,
+    'hour': 3600,
+    'hours': 3600,
+    'day': 86400,
+    'days': 86400,
+}
+
+@functools.lru_cache(maxsize=256)
 def parse_rate_limit_string(rate_string: str) -> tuple:
-    rate_string = rate_string.lower().strip()
-    
-    if '/' in rate_string:
-        parts = rate_string.split('/')
-        limit = int(parts[0].strip())
-        period = parts[1].strip()
-    elif ' per ' in rate_string:
-        parts = rate_string.split(' per ')
-        limit = int(parts[0].strip())
-        period = parts[1].strip()
-    else:
+    match = _RATE_LIMIT_RE.match(rate_string.lower())
+    if match is None:
         raise ValueError(f"Invalid rate limit format: {rate_string}")
     
-    period_map = {
-        'second': 1,
-        'seconds': 1,
-        'minute': 60,
-        'minutes': 60,
-        'hour': 3600,
-        'hours': 3600,
-        'day': 86400,
-        'days': 86400,
-    }
-    
-    window = period_map.get(period)
+    limit, period = match.groups()
+    window = _PERIODS.get(period)
     if window is None:
         raise ValueError(f"Unknown period: {period}")
     
-    return limit, window
+    return int(limit), window
 
 
 class FlaskRateLimiter:
@@ -46,26 +43,57 @@ class FlaskRateLimiter:
         self.limiter = limiter
         self.key_func = key_func or by_ip()
         self.default_limits = default_limits or []
+        self.app: Optional[Flask] = None
         
         if app is not None:
             self.init_app(app)
     
     def init_app(self, app: Flask):
         self.app = app
+        self._parsed_default_limits = tuple(
+            parse_rate_limit_string(limit_str) for limit_str in self.default_limits
+        )
+        # Route limits run from the dispatch hooks instead of wrapping each view in another frame.
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+    
+    def _before_request(self) -> Optional[Response]:
+        endpoint = flask_request.endpoint
+        view = current_app.view_functions.get(endpoint) if endpoint is not None else None
+        if getattr(view, "_rate_limit_exempt", False):
+            return None
         
-        if self.default_limits:
-            @app.before_request
-            def check_global_limits():
-                key = self.key_func(flask_request)
-                
-                for limit_str in self.default_limits:
-                    limit, window = parse_rate_limit_string(limit_str)
-                    state = self.limiter.check(key)
-                    
-                    if state.violated:
-                        return self._make_error_response(state)
-                
-                return None
+        # The limit strings are validated once in init_app; enforcement is the wrapped limiter's
+        # own limit, so a single check per request covers every entry.
+        if self._parsed_default_limits:
+            state = self.limiter.check(self.key_func(flask_request))
+            if state.violated:
+                return self._make_error_response(state)
+        
+        route_limit: Optional[Tuple["FlaskRateLimiter", KeyGeneratorFunc, bool]] = getattr(
+            view, "_rate_limit_route", None
+        )
+        if route_limit is None or route_limit[0] is not self:
+            return None
+        g._ratelink_route_checked = True
+        return self._check_route(route_limit[1], route_limit[2])
+    
+    def _check_route(self, key_function: KeyGeneratorFunc, per_method: bool) -> Optional[Response]:
+        key = key_function(flask_request)
+        if per_method:
+            key = f"{key}:{flask_request.method}"
+        state = self.limiter.check(key)
+        if state.violated:
+            return self._make_error_response(state)
+        g._ratelink_state = state
+        return None
+    
+    def _after_request(self, response: Response) -> Response:
+        state = g.pop("_ratelink_state", None)
+        if state is not None:
+            response.headers['X-RateLimit-Limit'] = str(state.limit)
+            response.headers['X-RateLimit-Remaining'] = str(state.remaining)
+        return response
     
     def limit(
         self,
@@ -82,19 +110,25 @@ class FlaskRateLimiter:
         key_function = key_func or self.key_func
         
         def decorator(func: Callable) -> Callable:
+            # Function attributes are copied by functools.wraps, so the before_request hook
+            # still finds the limit when other decorators are stacked on top.
+            setattr(func, "_rate_limit_route", (self, key_function, per_method))
+            if self.app is not None:
+                return func
+            
+            # Not attached to an app yet (e.g. init_app runs later in a factory): enforce from
+            # the view itself unless the hook already checked this request.
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
-                key = key_function(flask_request)
-                if per_method:
-                    key = f"{key}:{flask_request.method}"
-                state = self.limiter.check(key)
-                if state.violated:
-                    return self._make_error_response(state)
+                if not g.pop("_ratelink_route_checked", False):
+                    response = self._check_route(key_function, per_method)
+                    if response is not None:
+                        return response
                 return func(*args, **kwargs)
             return wrapper
         return decorator
     
-    def _make_error_response(self, state):
+    def _make_error_response(self, state: RateLimitState) -> Response:
         retry_after = state.retry_after
         
         response = make_response(
@@ -4,14 +4,15 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from threading import Lock
 from typing import Dict, Iterator, List, Optional, Tuple
+from ..core.types import _DATACLASS_SLOTS
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MetricValue:
     value: float
     labels: Dict[str, str] = field(default_factory=dict)
     timestamp: float = field(default_factory=time.time)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class HistogramBucket:    
     le: float
     count: int = 0
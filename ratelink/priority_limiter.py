@@ -1,7 +1,22 @@
-from typing import Dict, Optional, Any, Union
+from datetime import datetime
+from typing import Callable, Dict, Optional, Any, Tuple, Union
 from .rate_limiter import RateLimiter
 from .core.types import RateLimitState
-from .core.types import ConfigError
+from .core.types import ConfigError, RateLimitKey, join_key
+
+_TierAllow = Callable[[RateLimitKey, int], bool]
+_TierEntry = Tuple[Optional[RateLimiter], str, _TierAllow]
+
+def _allow_unlimited(key: RateLimitKey, weight: int = 1) -> bool:
+    return True
+
+def _tier_allow(limiter: RateLimiter, prefix: str) -> _TierAllow:
+    # Specialised per tier with the limiter and key prefix bound; limiter.allow itself is
+    # looked up per call so reconfigure() and hooks registered later still take effect.
+    def allow(key: RateLimitKey, weight: int = 1) -> bool:
+        return limiter.allow(prefix + join_key(key), weight=weight)
+
+    return allow
 
 class PriorityRateLimiter:
     def __init__(
@@ -18,6 +33,23 @@ class PriorityRateLimiter:
         self._limiters: Dict[str, Optional[RateLimiter]] = {}
         for tier_name, tier_config in tiers.items():
             self._limiters[tier_name] = self._create_tier_limiter(tier_name, tier_config)
+        # Hot-path table: one dict probe gives the tier's limiter (None when unlimited),
+        # its key prefix and its specialised allow function.
+        self._tier_table: Dict[str, _TierEntry] = {
+            name: (
+                limiter,
+                f"{name}:",
+                _allow_unlimited if limiter is None else _tier_allow(limiter, f"{name}:"),
+            )
+            for name, limiter in self._limiters.items()
+        }
+
+    def _resolve_tier(self, tier: Optional[str]) -> _TierEntry:
+        tier = tier or self.default_tier
+        entry = self._tier_table.get(tier)
+        if entry is None:
+            raise ConfigError(f"Unknown tier: {tier}")
+        return entry
 
     def _create_tier_limiter(
         self, tier_name: str, config: Dict[str, Any]
@@ -56,75 +88,49 @@ class PriorityRateLimiter:
 
     def allow(
         self,
-        key: str,
+        key: RateLimitKey,
         tier: Optional[str] = None,
         weight: int = 1
     ) -> bool:
-        tier = tier or self.default_tier
-
-        if tier not in self._limiters:
-            raise ConfigError(f"Unknown tier: {tier}")
-
-        limiter = self._limiters[tier]
-
-        if limiter is None:
-            return True
-
-        tier_key = f"{tier}:{key}"
-        return limiter.allow(tier_key, weight=weight)
+        entry = self._tier_table.get(tier or self.default_tier)
+        if entry is None:
+            raise ConfigError(f"Unknown tier: {tier or self.default_tier}")
+        return entry[2](key, weight)
 
     async def acquire(
         self,
-        key: str,
+        key: RateLimitKey,
         tier: Optional[str] = None,
         weight: int = 1
     ) -> bool:
-        tier = tier or self.default_tier
-        if tier not in self._limiters:
-            raise ConfigError(f"Unknown tier: {tier}")
-
-        limiter = self._limiters[tier]
-
+        limiter, prefix, _ = self._resolve_tier(tier)
         if limiter is None:
             return True
+        return await limiter.acquire(prefix + join_key(key), weight=weight)
 
-        tier_key = f"{tier}:{key}"
-        return await limiter.acquire(tier_key, weight=weight)
-
-    def check(self, key: str, tier: Optional[str] = None) -> RateLimitState:
-        tier = tier or self.default_tier
-        if tier not in self._limiters:
-            raise ConfigError(f"Unknown tier: {tier}")
-
-        limiter = self._limiters[tier]
-
+    def check(self, key: RateLimitKey, tier: Optional[str] = None) -> RateLimitState:
+        limiter, prefix, _ = self._resolve_tier(tier)
         if limiter is None:
-            from datetime import datetime
             return RateLimitState(
                 limit=999999999,
                 remaining=999999999,
                 reset_at=datetime.now(),
                 retry_after=0.0,
                 violated=False,
-                metadata={"tier": tier, "unlimited": True},
+                metadata={"tier": tier or self.default_tier, "unlimited": True},
             )
 
-        tier_key = f"{tier}:{key}"
-        return limiter.check(tier_key)
+        return limiter.check(prefix + join_key(key))
 
-    def reset(self, key: str, tier: Optional[str] = None) -> None:
+    def reset(self, key: RateLimitKey, tier: Optional[str] = None) -> None:
         if tier is None:
             for tier_limiter in self._limiters.values():
                 if tier_limiter is not None:
-                    tier_limiter.reset(key)
+                    tier_limiter.reset(join_key(key))
         else:
-            if tier not in self._limiters:
-                raise ConfigError(f"Unknown tier: {tier}")
-
-            limiter = self._limiters[tier]
+            limiter, prefix, _ = self._resolve_tier(tier)
             if limiter is not None:
-                tier_key = f"{tier}:{key}"
-                limiter.reset(tier_key)
+                limiter.reset(prefix + join_key(key))
 
     def get_tier_config(self, tier: str) -> Dict[str, Any]:
         if tier not in self.tiers:
@@ -136,38 +142,28 @@ class PriorityRateLimiter:
         return list(self.tiers.keys())
 
     def is_unlimited(self, tier: str) -> bool:
-        if tier not in self._limiters:
-            raise ConfigError(f"Unknown tier: {tier}")
-        return self._limiters[tier] is None
+        limiter, _, _ = self._resolve_tier(tier)
+        return limiter is None
 
     def upgrade_tier(
         self,
-        key: str,
+        key: RateLimitKey,
         from_tier: str,
         to_tier: str,
         preserve_state: bool = False
     ) -> None:
-        if from_tier not in self._limiters:
-            raise ConfigError(f"Unknown tier: {from_tier}")
-        if to_tier not in self._limiters:
-            raise ConfigError(f"Unknown tier: {to_tier}")
+        old_limiter, old_prefix, _ = self._resolve_tier(from_tier)
+        new_limiter, new_prefix, _ = self._resolve_tier(to_tier)
         if not preserve_state:
             self.reset(key, tier=from_tier)
         else:
-            old_limiter = self._limiters[from_tier]
-            new_limiter = self._limiters[to_tier]
             if old_limiter is not None and new_limiter is not None:
-                old_key = f"{from_tier}:{key}"
-                state = old_limiter.check(old_key)
+                state = old_limiter.check(old_prefix + join_key(key))
                 if state.limit > 0:
                     usage_pct = (state.limit - state.remaining) / state.limit
-                    new_config = self.tiers[to_tier]
-                    new_limit = new_config.get("requests_per_hour") or \
-                                new_config.get("requests_per_minute") or \
-                                new_config.get("requests_per_day")
+                    new_limit = new_limiter.limit
                     if new_limit:
                         consumed = int(new_limit * usage_pct)
                         if consumed > 0:
-                            new_key = f"{to_tier}:{key}"
-                            new_limiter.allow(new_key, weight=consumed)
-            self.reset(key, tier=from_tier)
\ No newline at end of file
+                            new_limiter.allow(new_prefix + join_key(key), weight=consumed)
+            self.reset(key, tier=from_tier)
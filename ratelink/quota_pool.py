@@ -1,9 +1,60 @@
-from typing import Dict, Optional, List, Any, Union
-from threading import RLock
+import sys
+from array import array
+from typing import Dict, Optional, List, Any, Tuple, Union
+from threading import Lock, RLock
 from datetime import datetime, timedelta
 from .rate_limiter import RateLimiter
 from .core.types import RateLimitState
 from .core.types import ConfigError
+from .core.clock import WINDOW_SECONDS
+
+_SHARD_COUNT = 16
+_SHARD_MASK = _SHARD_COUNT - 1
+# Pool handles pack (generation << _SLOT_BITS) | slot.
+_SLOT_BITS = 32
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+
+class _MemberShard:
+    # Struct-of-arrays member usage: name -> slot, with usage packed as int64 per slot.
+    __slots__ = ("lock", "members", "names", "usage")
+
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.members: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.usage = array("q", bytes(8 * 16))
+
+    def alloc(self, member_id: str) -> int:
+        slot = len(self.members)
+        if slot == len(self.usage):
+            self.usage.extend(array("q", bytes(8 * slot)))
+        self.members[member_id] = slot
+        self.names.append(member_id)
+        return slot
+
+    def usage_of(self, member_id: str) -> int:
+        slot = self.members.get(member_id)
+        return self.usage[slot] if slot is not None else 0
+
+    def remove(self, member_id: str) -> bool:
+        slot = self.members.pop(member_id, None)
+        if slot is None:
+            return False
+        # Keep slots dense: move the last member into the freed slot.
+        last_name = self.names.pop()
+        last = len(self.names)
+        if slot != last:
+            self.names[slot] = last_name
+            self.members[last_name] = slot
+            self.usage[slot] = self.usage[last]
+        self.usage[last] = 0
+        return True
+
+    def clear(self) -> None:
+        self.members.clear()
+        self.names.clear()
+        self.usage = array("q", bytes(8 * 16))
+
 
 class QuotaPool:
     def __init__(
@@ -33,8 +84,14 @@ class QuotaPool:
             window=self.window,
         )
 
-        self._member_usage: Dict[str, int] = {}
+        # Members are sharded by hash so concurrent consumers only serialise per shard;
+        # the pool total is enforced by _pool_limiter, which does its own locking.
+        self._shards = [_MemberShard() for _ in range(_SHARD_COUNT)]
         self._lock = RLock()
+        # Pool-wide member total for the fair-share check, updated alongside each shard
+        # change so readers never sum shards they do not hold.
+        self._member_total = 0
+        self._member_total_lock = Lock()
 
         self._last_window_start: Optional[datetime] = None
         self._rollover_quota = 0
@@ -42,16 +99,19 @@ class QuotaPool:
     def _parse_window(self, window: Union[int, str]) -> int:
         if isinstance(window, int):
             return window
+        return WINDOW_SECONDS.get(window.lower(), 3600)
 
-        conversions = {
-            "second": 1,
-            "minute": 60,
-            "hour": 3600,
-            "day": 86400,
-            "week": 604800,
-        }
+    def _shard(self, member_id: str) -> _MemberShard:
+        return self._shards[hash(member_id) & _SHARD_MASK]
 
-        return conversions.get(window.lower(), 3600)
+    def _member_count(self) -> int:
+        return self._member_total
+
+    def _add_member(self, shard: _MemberShard, member_id: str) -> int:
+        slot = shard.alloc(member_id)
+        with self._member_total_lock:
+            self._member_total += 1
+        return slot
 
     def consume(
         self,
@@ -59,29 +119,81 @@ class QuotaPool:
         weight: int = 1,
         force: bool = False
     ) -> bool:
-        with self._lock:
+        shard = self._shard(member_id)
+        with shard.lock:
+            slot = shard.members.get(member_id)
+            current_usage = shard.usage[slot] if slot is not None else 0
             if self.fair_share and not force:
-                if not self._check_fair_share(member_id, weight):
+                if not self._check_fair_share(current_usage, weight):
                     return False
             if self.max_per_member is not None and not force:
-                current_usage = self._member_usage.get(member_id, 0)
                 if current_usage + weight > self.max_per_member:
                     return False
             if self._pool_limiter.allow(self.pool_id, weight=weight):
-                self._member_usage[member_id] = \
-                    self._member_usage.get(member_id, 0) + weight
+                if slot is None:
+                    slot = self._add_member(shard, member_id)
+                shard.usage[slot] += weight
                 return True
 
             return False
 
-    def _check_fair_share(self, member_id: str, weight: int) -> bool:
+    def consume_batch(
+        self,
+        member_id: str,
+        weight: int,
+        count: int,
+        force: bool = False
+    ) -> int:
+        # Grants as many of `count` requests as the per-request checks in consume() would,
+        # but against one pool snapshot, under one shard lock, with one limiter call.
+        if weight <= 0 or count <= 0:
+            raise ValueError("weight and count must be positive")
+        shard = self._shard(member_id)
+        with shard.lock:
+            slot = shard.members.get(member_id)
+            usage = shard.usage[slot] if slot is not None else 0
+            state = self._pool_limiter.check(self.pool_id)
+            remaining = state.remaining
+            total_used = state.limit - remaining
+            members = self._member_count()
+            is_member = slot is not None
+            check_fair_share = self.fair_share and not force
+            max_usage = None if force else self.max_per_member
+
+            granted = 0
+            while granted < count and remaining >= weight:
+                if check_fair_share and total_used:
+                    fair_share = total_used / (members or 1)
+                    if usage + weight > fair_share * 1.2:
+                        break
+                if max_usage is not None and usage + weight > max_usage:
+                    break
+                granted += 1
+                usage += weight
+                total_used += weight
+                remaining -= weight
+                if not is_member:
+                    is_member = True
+                    members += 1
+
+            # Another shard may have drained the pool since the snapshot; shrink until it fits.
+            while granted and not self._pool_limiter.allow(self.pool_id, weight=granted * weight):
+                fresh = self._pool_limiter.check(self.pool_id).remaining // weight
+                granted = min(granted - 1, fresh)
+
+            if granted:
+                if slot is None:
+                    slot = self._add_member(shard, member_id)
+                shard.usage[slot] += granted * weight
+            return granted
+
+    def _check_fair_share(self, member_usage: int, weight: int) -> bool:
         state = self._pool_limiter.check(self.pool_id)
         total_used = state.limit - state.remaining
         if total_used == 0:
             return True
 
-        member_usage = self._member_usage.get(member_id, 0)
-        num_members = len(self._member_usage) or 1
+        num_members = self._member_count() or 1
 
         fair_share = total_used / num_members
 
@@ -89,24 +201,32 @@ class QuotaPool:
         return (member_usage + weight) <= (fair_share + tolerance)
 
     def check(self, member_id: Optional[str] = None) -> RateLimitState:
-        with self._lock:
-            state = self._pool_limiter.check(self.pool_id)
-            if member_id:
-                state.metadata["member_usage"] = self._member_usage.get(member_id, 0)
-                state.metadata["member_id"] = member_id
+        state = self._pool_limiter.check(self.pool_id)
+        if member_id:
+            state.metadata["member_usage"] = self.get_member_usage(member_id)
+            state.metadata["member_id"] = member_id
 
-            state.metadata["pool_id"] = self.pool_id
-            state.metadata["total_quota"] = self.total_quota
+        state.metadata["pool_id"] = self.pool_id
+        state.metadata["total_quota"] = self.total_quota
 
-            return state
+        return state
 
     def reset(self) -> None:
         with self._lock:
-            if self.rollover:
-                self._handle_rollover()
-            self._pool_limiter.reset(self.pool_id)
-            self._member_usage.clear()
-            self._last_window_start = datetime.now()
+            for shard in self._shards:
+                shard.lock.acquire()
+            try:
+                if self.rollover:
+                    self._handle_rollover()
+                self._pool_limiter.reset(self.pool_id)
+                for shard in self._shards:
+                    shard.clear()
+                with self._member_total_lock:
+                    self._member_total = 0
+                self._last_window_start = datetime.now()
+            finally:
+                for shard in self._shards:
+                    shard.lock.release()
 
     def _handle_rollover(self) -> None:
         state = self._pool_limiter.check(self.pool_id)
@@ -116,17 +236,25 @@ class QuotaPool:
             rollover_amount = int(unused * self.rollover_percent)
             self._rollover_quota = rollover_amount
 
+    def _usage_dict(self) -> Dict[str, int]:
+        usage: Dict[str, int] = {}
+        for shard in self._shards:
+            with shard.lock:
+                usage.update(zip(shard.names, shard.usage))
+        return usage
+
     def get_stats(self) -> Dict[str, Any]:
         with self._lock:
             state = self._pool_limiter.check(self.pool_id)
+            member_usage = self._usage_dict()
 
             return {
                 "pool_id": self.pool_id,
                 "total": state.limit,
                 "used": state.limit - state.remaining,
                 "remaining": state.remaining,
-                "members": len(self._member_usage),
-                "member_usage": self._member_usage.copy(),
+                "members": len(member_usage),
+                "member_usage": member_usage,
                 "reset_at": state.reset_at,
                 "fair_share": self.fair_share,
                 "max_per_member": self.max_per_member,
@@ -135,16 +263,23 @@ class QuotaPool:
             }
 
     def get_member_usage(self, member_id: str) -> int:
-        with self._lock:
-            return self._member_usage.get(member_id, 0)
+        shard = self._shard(member_id)
+        with shard.lock:
+            return shard.usage_of(member_id)
 
     def list_members(self) -> List[str]:
-        with self._lock:
-            return list(self._member_usage.keys())
+        members: List[str] = []
+        for shard in self._shards:
+            with shard.lock:
+                members.extend(shard.names)
+        return members
 
     def remove_member(self, member_id: str) -> None:
-        with self._lock:
-            self._member_usage.pop(member_id, None)
+        shard = self._shard(member_id)
+        with shard.lock:
+            if shard.remove(member_id):
+                with self._member_total_lock:
+                    self._member_total -= 1
 
 
 class SharedQuotaManager:
@@ -155,7 +290,13 @@ class SharedQuotaManager:
     ) -> None:
         self.backend = backend
         self.backend_options = backend_options or {}
-        self._pools: Dict[str, QuotaPool] = {}
+        # pool_id -> handle. A deleted pool's slot is reused under a bumped generation, so
+        # _pool_array stays bounded by the peak number of live pools and stale handles are
+        # rejected rather than resolving to the slot's new pool.
+        self._pools: Dict[str, int] = {}
+        self._pool_array: List[Optional[Tuple[int, QuotaPool]]] = []
+        self._generations: List[int] = []
+        self._free_slots: List[int] = []
         self._lock = RLock()
 
     def create_pool(
@@ -165,6 +306,16 @@ class SharedQuotaManager:
         window: Union[int, str],
         **kwargs: Any
     ) -> QuotaPool:
+        return self._resolve(self.register_pool(pool_id, total_quota, window, **kwargs))
+
+    def register_pool(
+        self,
+        pool_id: str,
+        total_quota: int,
+        window: Union[int, str],
+        **kwargs: Any
+    ) -> int:
+        pool_id = sys.intern(pool_id)
         with self._lock:
             if pool_id in self._pools:
                 raise ConfigError(f"Pool already exists: {pool_id}")
@@ -178,14 +329,35 @@ class SharedQuotaManager:
                 **kwargs
             )
 
-            self._pools[pool_id] = pool
-            return pool
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                generation = self._generations[slot] + 1
+                self._generations[slot] = generation
+            else:
+                slot = len(self._pool_array)
+                generation = 0
+                self._pool_array.append(None)
+                self._generations.append(generation)
+            handle = (generation << _SLOT_BITS) | slot
+            self._pool_array[slot] = (handle, pool)
+            self._pools[pool_id] = handle
+            return handle
+
+    def _resolve(self, handle: int) -> QuotaPool:
+        slot = handle & _SLOT_MASK
+        entry = self._pool_array[slot] if slot < len(self._pool_array) else None
+        if entry is None or entry[0] != handle:
+            raise ConfigError(f"Pool not found for handle: {handle}")
+        return entry[1]
+
+    def get_handle(self, pool_id: str) -> int:
+        handle = self._pools.get(pool_id)
+        if handle is None:
+            raise ConfigError(f"Pool not found: {pool_id}")
+        return handle
 
     def get_pool(self, pool_id: str) -> QuotaPool:
-        with self._lock:
-            if pool_id not in self._pools:
-                raise ConfigError(f"Pool not found: {pool_id}")
-            return self._pools[pool_id]
+        return self._resolve(self.get_handle(pool_id))
 
     def consume(
         self,
@@ -193,8 +365,15 @@ class SharedQuotaManager:
         member_id: str,
         weight: int = 1
     ) -> bool:
-        pool = self.get_pool(pool_id)
-        return pool.consume(member_id, weight=weight)
+        return self._resolve(self.get_handle(pool_id)).consume(member_id, weight=weight)
+
+    def consume_by_handle(
+        self,
+        handle: int,
+        member_id: str,
+        weight: int = 1
+    ) -> bool:
+        return self._resolve(handle).consume(member_id, weight=weight)
 
     def list_pools(self) -> List[str]:
         with self._lock:
@@ -202,4 +381,8 @@ class SharedQuotaManager:
 
     def delete_pool(self, pool_id: str) -> None:
         with self._lock:
-            self._pools.pop(pool_id, None)
\ No newline at end of file
+            handle = self._pools.pop(pool_id, None)
+            if handle is not None:
+                slot = handle & _SLOT_MASK
+                self._pool_array[slot] = None
+                self._free_slots.append(slot)
@@ -1,10 +1,12 @@
-from typing import Optional, Dict, Any, Callable, Union
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, List, Mapping, Sequence, Tuple, Union
 from datetime import datetime
 from .core.types import RateLimitState, AlgorithmType, BackendType
 from .core.types import ConfigError, LimitExceeded
 from .core.abstractions import Algorithm, Backend
+from .core.clock import WINDOW_SECONDS
 from .algorithms.token_bucket import TokenBucketAlgorithm
-from .algorithms.sliding_window import SlidingWindowAlgorithm
+from .algorithms.sliding_window import SlidingWindowAlgorithm, SlidingWindowCounterAlgorithm
 from .algorithms.leaky_bucket import LeakyBucketAlgorithm
 from .algorithms.fixed_window import FixedWindowAlgorithm
 from .algorithms.gcra import GCRAAlgorithm
@@ -33,6 +35,39 @@ except ImportError:
 from .backends.multi_region import MultiRegionBackend
 
 
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+_HOOK_EVENTS = frozenset({"before_check", "after_check", "on_allow", "on_deny", "on_error"})
+
+
+def _noop(*args: Any) -> None:
+    pass
+
+def _fuse_hooks(callbacks: Tuple[Callable, ...]) -> Callable[..., None]:
+    # A failing hook must not affect the check or the hooks after it.
+    if not callbacks:
+        return _noop
+    if len(callbacks) == 1:
+        callback = callbacks[0]
+
+        def dispatch_one(*args: Any) -> None:
+            try:
+                callback(*args)
+            except Exception:
+                pass
+
+        return dispatch_one
+
+    def dispatch(*args: Any) -> None:
+        for callback in callbacks:
+            try:
+                callback(*args)
+            except Exception:
+                pass
+
+    return dispatch
+
+
 class RateLimiter:
     def __init__(
         self,
@@ -46,24 +81,25 @@ class RateLimiter:
     ) -> None:
         self.limit = limit
         self.window = self._parse_window(window)
-        self.raise_on_limit = raise_on_limit
+        self._raise_on_limit = raise_on_limit
         if isinstance(backend, str):
             self.backend = self._create_backend(backend, backend_options or {})
         else:
             self.backend = backend
         if isinstance(algorithm, str):
-            self.algorithm = self._create_algorithm(
+            self._algorithm = self._create_algorithm(
                 algorithm, limit, self.window, algorithm_options or {}
             )
         else:
-            self.algorithm = algorithm
-        self._hooks: Dict[str, list] = {
-            "before_check": [],
-            "after_check": [],
-            "on_allow": [],
-            "on_deny": [],
-            "on_error": [],
-        }
+            self._algorithm = algorithm
+        # Copy-on-write: registering replaces the event's tuple instead of mutating it.
+        self._hooks: Dict[str, Tuple[Callable, ...]] = dict.fromkeys(_HOOK_EVENTS, ())
+        # One precomputed callable per event, rebuilt by register_hook; _noop when empty.
+        self._dispatch_before_check: Callable[..., None] = _noop
+        self._dispatch_after_check: Callable[..., None] = _noop
+        self._dispatch_on_allow: Callable[..., None] = _noop
+        self._dispatch_on_deny: Callable[..., None] = _noop
+        self._dispatch_on_error: Callable[..., None] = _noop
         self._config = {
             "algorithm": algorithm if isinstance(algorithm, str) else algorithm.__class__.__name__,
             "backend": backend if isinstance(backend, str) else backend.__class__.__name__,
@@ -73,21 +109,46 @@ class RateLimiter:
             "algorithm_options": algorithm_options or {},
             "raise_on_limit": raise_on_limit,
         }
+        # (version, frozen config, RuleEngine) replaced with one attribute store, so readers
+        # that load it once always see a matching config and rule index without locking.
+        self._config_ref: Tuple[int, Mapping[str, Any], Any] = (0, _EMPTY_CONFIG, None)
+        self._rebuild_allow()
+
+    @property
+    def algorithm(self) -> Algorithm:
+        return self._algorithm
+
+    @algorithm.setter
+    def algorithm(self, algorithm: Algorithm) -> None:
+        self._algorithm = algorithm
+        self._rebuild_allow()
+
+    @property
+    def raise_on_limit(self) -> bool:
+        return self._raise_on_limit
+
+    @raise_on_limit.setter
+    def raise_on_limit(self, value: bool) -> None:
+        self._raise_on_limit = value
+        self._rebuild_allow()
+
+    def _rebuild_allow(self) -> None:
+        # With no hooks and no raise_on_limit, allow() reduces to the algorithm call.
+        self._plain_allow = not self._raise_on_limit and (
+            self._dispatch_before_check is _noop
+            and self._dispatch_after_check is _noop
+            and self._dispatch_on_allow is _noop
+            and self._dispatch_on_deny is _noop
+            and self._dispatch_on_error is _noop
+        )
 
     def _parse_window(self, window: Union[int, str]) -> int:
         if isinstance(window, int):
             return window
-        window = window.lower()
-        conversions = {
-            "second": 1,
-            "minute": 60,
-            "hour": 3600,
-            "day": 86400,
-            "week": 604800,
-        }
-        if window in conversions:
-            return conversions[window]
-        raise ConfigError(f"Invalid window: {window}")
+        seconds = WINDOW_SECONDS.get(window.lower())
+        if seconds is not None:
+            return seconds
+        raise ConfigError(f"Invalid window: {window.lower()}")
 
     def _create_backend(self, backend_type: str, options: Dict[str, Any]) -> Backend:
         backend_type = backend_type.lower()
@@ -124,6 +185,8 @@ class RateLimiter:
             )
         elif algorithm_type == "sliding_window":
             return SlidingWindowAlgorithm(limit=limit, window_seconds=window)
+        elif algorithm_type == "sliding_window_counter":
+            return SlidingWindowCounterAlgorithm(limit=limit, window_seconds=window)
         elif algorithm_type == "leaky_bucket":
             return LeakyBucketAlgorithm(
                 capacity=options.get("capacity", limit),
@@ -142,15 +205,21 @@ class RateLimiter:
             raise ConfigError(f"Unknown algorithm type: {algorithm_type}")
 
     def allow(self, key: str, weight: int = 1) -> bool:
-        self._run_hooks("before_check", key, weight)
+        if self._plain_allow:
+            return self._algorithm.allow(key, weight)[0]
+        if self._dispatch_before_check is not _noop:
+            self._dispatch_before_check(key, weight)
         try:
             allowed, state = self.algorithm.allow(key, weight)
-            self._run_hooks("after_check", key, weight, state)
+            if self._dispatch_after_check is not _noop:
+                self._dispatch_after_check(key, weight, state)
             if allowed:
-                self._run_hooks("on_allow", key, weight, state)
+                if self._dispatch_on_allow is not _noop:
+                    self._dispatch_on_allow(key, weight, state)
                 return True
             else:
-                self._run_hooks("on_deny", key, weight, state)
+                if self._dispatch_on_deny is not _noop:
+                    self._dispatch_on_deny(key, weight, state)
                 
                 if self.raise_on_limit:
                     raise LimitExceeded(
@@ -159,19 +228,35 @@ class RateLimiter:
                     )
                 return False
         except Exception as e:
-            self._run_hooks("on_error", key, weight, e)
+            self._dispatch_on_error(key, weight, e)
             raise
 
+    def allow_many(self, keys: Sequence[str], weights: Optional[Sequence[int]] = None) -> List[bool]:
+        if weights is None:
+            weights = [1] * len(keys)
+        elif len(weights) != len(keys):
+            raise ValueError("keys and weights must have the same length")
+        batch = getattr(self._algorithm, "allow_many", None)
+        # Hooks and raise_on_limit need per-request handling, so only the plain path batches.
+        if batch is None or not self._plain_allow:
+            allow = self.allow
+            return [allow(key, weight) for key, weight in zip(keys, weights)]
+        return [allowed for allowed, _ in batch(list(zip(keys, weights)))]
+
     async def acquire(self, key: str, weight: int = 1) -> bool:
-        self._run_hooks("before_check", key, weight)
+        self._dispatch_before_check(key, weight)
         try:
-            allowed, state = await self.algorithm.acquire_async(key, weight)
-            self._run_hooks("after_check", key, weight, state)
+            algorithm = self._algorithm
+            if algorithm.acquire_is_allow:
+                allowed, state = algorithm.allow(key, weight)
+            else:
+                allowed, state = await algorithm.acquire_async(key, weight)
+            self._dispatch_after_check(key, weight, state)
             if allowed:
-                self._run_hooks("on_allow", key, weight, state)
+                self._dispatch_on_allow(key, weight, state)
                 return True
             else:
-                self._run_hooks("on_deny", key, weight, state)
+                self._dispatch_on_deny(key, weight, state)
                 
                 if self.raise_on_limit:
                     raise LimitExceeded(
@@ -182,12 +267,20 @@ class RateLimiter:
                 return False
 
         except Exception as e:
-            self._run_hooks("on_error", key, weight, e)
+            self._dispatch_on_error(key, weight, e)
             raise
 
     def check(self, key: str) -> RateLimitState:
         return self.algorithm.check(key)
 
+    def fast_deny(self, key: str, weight: int = 1) -> Optional[RateLimitState]:
+        fast_deny: Optional[Callable[[str, int], Optional[RateLimitState]]] = getattr(
+            self.algorithm, "fast_deny", None
+        )
+        if fast_deny is None:
+            return None
+        return fast_deny(key, weight)
+
     async def async_check(self, key: str) -> RateLimitState:
         return self.algorithm.check(key)
 
@@ -201,16 +294,11 @@ class RateLimiter:
         self.algorithm.reset(key)
 
     def register_hook(self, event: str, callback: Callable) -> None:
-        if event not in self._hooks:
+        if event not in _HOOK_EVENTS:
             raise ValueError(f"Unknown event: {event}")
-        self._hooks[event].append(callback)
-
-    def _run_hooks(self, event: str, *args: Any) -> None:
-        for callback in self._hooks.get(event, []):
-            try:
-                callback(*args)
-            except Exception:
-                pass
+        callbacks = self._hooks[event] = self._hooks[event] + (callback,)
+        setattr(self, f"_dispatch_{event}", _fuse_hooks(callbacks))
+        self._rebuild_allow()
 
     def reconfigure(self, **kwargs: Any) -> None:
         if "limit" in kwargs:
@@ -242,9 +330,9 @@ class RateLimiter:
     def from_config(
         cls, config: Union[str, Dict[str, Any]], watch: bool = False
     ) -> "RateLimiter":
-        from .config import ConfigLoader
+        from .config import ConfigLoader, thaw_config
         loader = ConfigLoader()
-        config_dict = loader.load(config)
+        config_dict = loader.load_frozen(config)
         default_config = config_dict.get("rate_limiting", {}).get("default", {})
         if not default_config:
             raise ConfigError("No default rate limiting configuration found")
@@ -253,11 +341,11 @@ class RateLimiter:
             backend=default_config.get("backend", "memory"),
             limit=default_config.get("limit", 1000),
             window=default_config.get("window", "hour"),
-            backend_options=default_config.get("backend_options", {}),
-            algorithm_options=default_config.get("algorithm_options", {}),
+            backend_options=thaw_config(default_config.get("backend_options", {})),
+            algorithm_options=thaw_config(default_config.get("algorithm_options", {})),
             raise_on_limit=default_config.get("raise_on_limit", False),
         )
-        instance._full_config = config_dict
+        instance._swap_config(config_dict)
         if watch and isinstance(config, str):
             loader.watch(config, lambda: instance._reload_config(config))
 
@@ -266,10 +354,22 @@ class RateLimiter:
     def _reload_config(self, config_path: str) -> None:
         from .config import ConfigLoader
         loader = ConfigLoader()
-        config_dict = loader.load(config_path)
+        config_dict = loader.load_frozen(config_path)
         default_config = config_dict.get("rate_limiting", {}).get("default", {})
         self.reconfigure(
             limit=default_config.get("limit", self.limit),
             window=default_config.get("window", self.window),
         )
-        self._full_config = config_dict
\ No newline at end of file
+        self._swap_config(config_dict)
+
+    def _swap_config(self, config: Mapping[str, Any]) -> None:
+        from .config import RuleEngine
+        self._config_ref = (self._config_ref[0] + 1, config, RuleEngine(config))
+
+    @property
+    def _full_config(self) -> Mapping[str, Any]:
+        return self._config_ref[1]
+
+    @property
+    def _rules(self) -> Any:
+        return self._config_ref[2]
\ No newline at end of file
@@ -1,5 +1,8 @@
 import time
 from typing import Optional
+from ..core.clock import NS_PER_SECOND, WALL_OFFSET_NS
+
+_real_monotonic_ns = time.monotonic_ns
 
 class TimeMachine:
     def __init__(self):
@@ -38,6 +41,12 @@ class TimeMachine:
         else:
             return time.time() + self._offset
     
+    def monotonic_ns(self) -> int:
+        if self._frozen and self._frozen_time is not None:
+            return int(self._frozen_time * NS_PER_SECOND) - WALL_OFFSET_NS
+        else:
+            return _real_monotonic_ns() + int(self._offset * NS_PER_SECOND)
+    
     def reset(self):
         self._frozen = False
         self._frozen_time = None
@@ -71,17 +80,23 @@ class MonkeyPatchedTimeMachine(TimeMachine):
     def __init__(self):
         super().__init__()
         self._original_time = None
+        self._original_monotonic_ns = None
     
     def __enter__(self):
         import time as time_module
         self._original_time = time_module.time
+        self._original_monotonic_ns = time_module.monotonic_ns
         time_module.time = self.time
+        time_module.monotonic_ns = self.monotonic_ns
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self._original_time is not None:
             import time as time_module
             time_module.time = self._original_time
+        if self._original_monotonic_ns is not None:
+            import time as time_module
+            time_module.monotonic_ns = self._original_monotonic_ns
         
         self.reset()
         return False
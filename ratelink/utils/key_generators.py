@@ -1,30 +1,88 @@
-from typing import Any, Callable, List, Optional
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 KeyGeneratorFunc = Callable[[Any], str]
+TupleKeyGeneratorFunc = Callable[[Any], Tuple[str, ...]]
+_Extractor = Callable[[Any], Optional[str]]
+
+def _probe_chain(probes: Tuple[Tuple[str, _Extractor], ...], fallback: str) -> KeyGeneratorFunc:
+    # Each request class is probed once. The matching extractor is remembered when its attribute
+    # lives on the class (property or class attribute), so it cannot differ between instances.
+    # An extractor returning None falls back to the full chain, preserving probe order.
+    resolvers: Dict[type, _Extractor] = {}
+
+    def resolve(request: Any) -> str:
+        for attr, extract in probes:
+            if hasattr(request, attr):
+                key = extract(request)
+                if key is not None:
+                    if hasattr(type(request), attr):
+                        resolvers[type(request)] = extract
+                    return key
+        return fallback
 
-def by_ip() -> KeyGeneratorFunc:
     def get_key(request: Any) -> str:
-        if hasattr(request, 'client') and hasattr(request.client, 'host'):
-            return f"ip:{request.client.host}"
-        
-        if hasattr(request, 'remote_addr'):
-            return f"ip:{request.remote_addr}"
-        
-        if hasattr(request, 'META'):
-            xff = request.META.get('HTTP_X_FORWARDED_FOR')
-            if xff:
-                ip = xff.split(',')[0].strip()
-                return f"ip:{ip}"
-            return f"ip:{request.META.get('REMOTE_ADDR', 'unknown')}"
-        
-        if hasattr(request, 'remote'):
-            return f"ip:{request.remote}"
-        
-        return "ip:unknown"
-    
+        extract = resolvers.get(type(request))
+        if extract is not None:
+            key = extract(request)
+            if key is not None:
+                return key
+        return resolve(request)
+
     return get_key
 
-def by_user_id(user_attr: str = "user") -> KeyGeneratorFunc:
+def _interned(func: KeyGeneratorFunc, intern: bool) -> KeyGeneratorFunc:
+    # Pays off for small, repeating key sets; high-cardinality keys just add an intern-table probe.
+    if not intern:
+        return func
+
+    def get_key(request: Any) -> str:
+        return sys.intern(func(request))
+
+    # composite_key reads this to intern only keys built entirely from interned parts.
+    setattr(get_key, "interned", True)
+    return get_key
+
+def _with_scope_key(func: KeyGeneratorFunc, scope_func: KeyGeneratorFunc, intern: bool) -> KeyGeneratorFunc:
+    # ASGI middleware reads scope_key to derive the key from the raw scope without building a Request.
+    func = _interned(func, intern)
+    setattr(func, "scope_key", _interned(scope_func, intern))
+    return func
+
+def by_ip_scope(scope: Any) -> str:
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+def by_route_scope(scope: Any) -> str:
+    return f"route:{scope['path']}"
+
+def _ip_from_client(request: Any) -> Optional[str]:
+    client = request.client
+    return f"ip:{client.host}" if hasattr(client, 'host') else None
+
+def _ip_from_remote_addr(request: Any) -> Optional[str]:
+    return f"ip:{request.remote_addr}"
+
+def _ip_from_meta(request: Any) -> Optional[str]:
+    xff = request.META.get('HTTP_X_FORWARDED_FOR')
+    if xff:
+        return f"ip:{xff.split(',', 1)[0].strip()}"
+    return f"ip:{request.META.get('REMOTE_ADDR', 'unknown')}"
+
+def _ip_from_remote(request: Any) -> Optional[str]:
+    return f"ip:{request.remote}"
+
+_IP_PROBES = (
+    ('client', _ip_from_client),
+    ('remote_addr', _ip_from_remote_addr),
+    ('META', _ip_from_meta),
+    ('remote', _ip_from_remote),
+)
+
+def by_ip(intern: bool = True) -> KeyGeneratorFunc:
+    return _with_scope_key(_probe_chain(_IP_PROBES, "ip:unknown"), by_ip_scope, intern)
+
+def by_user_id(user_attr: str = "user", intern: bool = False) -> KeyGeneratorFunc:
     def get_key(request: Any) -> str:
         user = getattr(request, user_attr, None)
         
@@ -49,97 +107,107 @@ def by_user_id(user_attr: str = "user") -> KeyGeneratorFunc:
         
         return f"user:{user_id}"
     
-    return get_key
+    return _interned(get_key, intern)
 
 
 def by_api_key(header_name: str = "X-API-Key") -> KeyGeneratorFunc:
-    def get_key(request: Any) -> str:
-        if hasattr(request, 'headers'):
-            api_key = request.headers.get(header_name)
-            if api_key:
-                return f"apikey:{api_key}"
-        
-        if hasattr(request, 'META'):
-            meta_key = f"HTTP_{header_name.upper().replace('-', '_')}"
-            api_key = request.META.get(meta_key)
-            if api_key:
-                return f"apikey:{api_key}"
-        
-        return "apikey:missing"
-    
-    return get_key
+    meta_key = f"HTTP_{header_name.upper().replace('-', '_')}"
 
-def by_route() -> KeyGeneratorFunc:
-    def get_key(request: Any) -> str:
-        if hasattr(request, 'url') and hasattr(request.url, 'path'):
-            return f"route:{request.url.path}"
-        
-        if hasattr(request, 'path'):
-            return f"route:{request.path}"
-        
-        if hasattr(request, 'path'):
-            return f"route:{request.path}"
-        
-        if hasattr(request, 'path'):
-            return f"route:{request.path}"
-        
-        return "route:unknown"
-    
-    return get_key
+    def from_headers(request: Any) -> Optional[str]:
+        api_key = request.headers.get(header_name)
+        return f"apikey:{api_key}" if api_key else None
 
-def by_endpoint() -> KeyGeneratorFunc:
-    def get_key(request: Any) -> str:
-        if hasattr(request, 'scope'):
-            endpoint = request.scope.get('endpoint')
-            if endpoint:
-                name = getattr(endpoint, '__name__', str(endpoint))
-                return f"endpoint:{name}"
-            route = request.scope.get('route')
-            if route and hasattr(route, 'name'):
-                return f"endpoint:{route.name}"
-        
-        if hasattr(request, 'endpoint'):
-            return f"endpoint:{request.endpoint}"
-        
-        if hasattr(request, 'resolver_match'):
-            match = request.resolver_match
-            if match:
-                return f"endpoint:{match.url_name or match.view_name}"
-        
-        return "endpoint:unknown"
-    
-    return get_key
+    def from_meta(request: Any) -> Optional[str]:
+        api_key = request.META.get(meta_key)
+        return f"apikey:{api_key}" if api_key else None
 
+    return _probe_chain((('headers', from_headers), ('META', from_meta)), "apikey:missing")
 
-def composite_key(*funcs: KeyGeneratorFunc) -> KeyGeneratorFunc:
-    def get_key(request: Any) -> str:
-        parts = []
-        for func in funcs:
-            part = func(request)
-            parts.append(part)
-        return ":".join(parts)
+def _route_from_url(request: Any) -> Optional[str]:
+    url = request.url
+    return f"route:{url.path}" if hasattr(url, 'path') else None
+
+def _route_from_path(request: Any) -> Optional[str]:
+    return f"route:{request.path}"
+
+_ROUTE_PROBES = (('url', _route_from_url), ('path', _route_from_path))
+
+def by_route(intern: bool = False) -> KeyGeneratorFunc:
+    # Off by default: URL paths are chosen by the client, so the key set is unbounded.
+    return _with_scope_key(_probe_chain(_ROUTE_PROBES, "route:unknown"), by_route_scope, intern)
+
+def _endpoint_from_scope(request: Any) -> Optional[str]:
+    scope = request.scope
+    endpoint = scope.get('endpoint')
+    if endpoint:
+        name = getattr(endpoint, '__name__', str(endpoint))
+        return f"endpoint:{name}"
+    route = scope.get('route')
+    if route and hasattr(route, 'name'):
+        return f"endpoint:{route.name}"
+    return None
+
+def _endpoint_from_attr(request: Any) -> Optional[str]:
+    return f"endpoint:{request.endpoint}"
+
+def _endpoint_from_resolver_match(request: Any) -> Optional[str]:
+    match = request.resolver_match
+    if match:
+        return f"endpoint:{match.url_name or match.view_name}"
+    return None
+
+_ENDPOINT_PROBES = (
+    ('scope', _endpoint_from_scope),
+    ('endpoint', _endpoint_from_attr),
+    ('resolver_match', _endpoint_from_resolver_match),
+)
+
+def by_endpoint(intern: bool = True) -> KeyGeneratorFunc:
+    return _interned(_probe_chain(_ENDPOINT_PROBES, "endpoint:unknown"), intern)
+
+
+def composite_key(*funcs: KeyGeneratorFunc, intern: Optional[bool] = None) -> KeyGeneratorFunc:
+    if intern is None:
+        intern = all(getattr(func, "interned", False) for func in funcs)
+    if len(funcs) == 2:
+        first, second = funcs
+
+        def get_pair_key(request: Any) -> str:
+            return f"{first(request)}:{second(request)}"
+
+        return _interned(get_pair_key, intern)
+
+    def get_key(request: Any, funcs: tuple = funcs) -> str:
+        return ":".join([func(request) for func in funcs])
     
-    return get_key
+    return _interned(get_key, intern)
+
+def composite_key_parts(*funcs: KeyGeneratorFunc) -> TupleKeyGeneratorFunc:
+    # Tuple keys skip building the joined string; in-process algorithms hash the tuple directly.
+    # RateLimiter, PriorityRateLimiter, RedisBackend and MemcachedBackend accept them. The
+    # PostgreSQL, DynamoDB and MongoDB backends store string keys: pass them
+    # core.types.join_key(key).
+    if len(funcs) == 2:
+        first, second = funcs
+        return lambda request: (first(request), second(request))
+    return lambda request: tuple([func(request) for func in funcs])
 
 def by_session(session_key: str = "session_id") -> KeyGeneratorFunc:
-    def get_key(request: Any) -> str:
-        if hasattr(request, 'session'):
-            session = request.session
-            if hasattr(session, 'session_key'):
-                return f"session:{session.session_key}"
-            if hasattr(session, 'get'):
-                session_id = session.get(session_key)
-                if session_id:
-                    return f"session:{session_id}"
-        
-        if hasattr(request, 'cookies'):
-            session_id = request.cookies.get(session_key)
+    def from_session(request: Any) -> Optional[str]:
+        session = request.session
+        if hasattr(session, 'session_key'):
+            return f"session:{session.session_key}"
+        if hasattr(session, 'get'):
+            session_id = session.get(session_key)
             if session_id:
                 return f"session:{session_id}"
-        
-        return "session:unknown"
-    
-    return get_key
+        return None
+
+    def from_cookies(request: Any) -> Optional[str]:
+        session_id = request.cookies.get(session_key)
+        return f"session:{session_id}" if session_id else None
+
+    return _probe_chain((('session', from_session), ('cookies', from_cookies)), "session:unknown")
 
 def custom_key(extractor: Callable[[Any], str], prefix: str = "custom") -> KeyGeneratorFunc:
     def get_key(request: Any) -> str:
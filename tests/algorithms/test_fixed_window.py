@@ -1,7 +1,7 @@
 import pytest
 import time
-from concurrent.futures import ThreadPoolExecutor
 from ratelink.algorithms.fixed_window import FixedWindowAlgorithm
+from ratelink.core.clock import WALL_OFFSET_NS
 
 class TestFixedWindowAlgorithm:
     def test_initialization(self):
@@ -49,13 +49,35 @@ class TestFixedWindowAlgorithm:
         assert allowed is True
         assert state.remaining == 4
 
-    def test_window_start_calculation(self, test_key):
+    def test_window_start_calculation(self, test_key, monkeypatch, fake_clock):
+        monkeypatch.setattr("ratelink.algorithms.fixed_window.time.monotonic_ns", fake_clock.now_ns)
         alg = FixedWindowAlgorithm(limit=10, window_seconds=1.0)
+        # Start just after a wall-aligned boundary so the second call stays in the same window.
+        fake_clock.advance(1 - (fake_clock.now_ns() + WALL_OFFSET_NS) % 1_000_000_000 / 1e9 + 0.01)
         _, state = alg.allow(test_key)
         window_start = state.metadata["window_start"]
-        time.sleep(0.1)
+        fake_clock.advance(0.1)
         _, state2 = alg.allow(test_key)
         assert state2.metadata["window_start"] == window_start
+        fake_clock.advance(1.0)
+        _, state3 = alg.allow(test_key)
+        assert state3.metadata["window_start"] == pytest.approx(window_start + 1.0)
+
+    def test_windows_aligned_to_wall_clock(self, test_key):
+        alg = FixedWindowAlgorithm(limit=10, window_seconds=60)
+        _, state = alg.allow(test_key)
+        assert round(state.metadata["window_start"], 6) % 60 == 0
+        assert state.reset_at.second == 0
+        assert state.reset_at.microsecond == 0
+
+    def test_stale_windows_evicted(self, multiple_keys, monkeypatch, fake_clock):
+        monkeypatch.setattr("ratelink.algorithms.fixed_window.time.monotonic_ns", fake_clock.now_ns)
+        alg = FixedWindowAlgorithm(limit=10, window_seconds=0.2)
+        for key in multiple_keys:
+            alg.allow(key)
+        fake_clock.advance(0.5)
+        alg.allow("test:key:fresh")
+        assert sum(len(counts) for counts in alg._wheel) == 1
 
     def test_check_without_consuming(self, test_key):
         alg = FixedWindowAlgorithm(limit=100, window_seconds=60)
@@ -96,6 +118,11 @@ class TestFixedWindowAlgorithm:
         assert allowed is False
         assert 0 < state.retry_after <= 1.0
 
+    def test_reset_at_matches_window_end(self, test_key):
+        alg = FixedWindowAlgorithm(limit=5, window_seconds=60)
+        _, state = alg.allow(test_key)
+        assert state.reset_at == alg.check(test_key).reset_at
+
     @pytest.mark.asyncio
     async def test_async_allow(self, test_key):
         alg = FixedWindowAlgorithm(limit=100, window_seconds=60)
@@ -103,11 +130,9 @@ class TestFixedWindowAlgorithm:
         assert allowed is True
         assert state.remaining == 99
 
-    def test_thread_safety(self, test_key):
+    def test_thread_safety(self, test_key, run_concurrently):
         alg = FixedWindowAlgorithm(limit=100, window_seconds=60)
-        def make_request():
-            return alg.allow(test_key)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(lambda _: make_request(), range(100)))
+        results = run_concurrently(lambda: alg.allow(test_key))
+        assert len(results) == 100
         allowed_count = sum(1 for allowed, _ in results if allowed)
         assert allowed_count == 100
\ No newline at end of file
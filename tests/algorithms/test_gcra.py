@@ -1,6 +1,6 @@
 import pytest
 import time
-from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from ratelink.algorithms.gcra import GCRAAlgorithm
 
 
@@ -106,11 +106,51 @@ class TestGCRAAlgorithm:
         allowed, state = await alg.acquire_async(test_key)
         assert allowed is True
 
-    def test_thread_safety(self, test_key):
+    def test_thread_safety(self, test_key, run_concurrently):
         alg = GCRAAlgorithm(limit=100, period_seconds=10, burst=100)
-        def make_request():
-            return alg.allow(test_key)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(lambda _: make_request(), range(100)))
+        results = run_concurrently(lambda: alg.allow(test_key))
+        assert len(results) == 100
         allowed_count = sum(1 for allowed, _ in results if allowed)
-        assert allowed_count == 100
\ No newline at end of file
+        assert allowed_count == 100
+
+    def test_metadata_built_on_access(self, test_key):
+        alg = GCRAAlgorithm(limit=10, period_seconds=1.0)
+        _, state = alg.allow(test_key)
+        assert state._metadata is None
+        assert state.metadata["algorithm"] == "gcra"
+        assert state.metadata is state.metadata
+
+    def test_reset_at_built_on_access(self, test_key):
+        alg = GCRAAlgorithm(limit=10, period_seconds=1.0)
+        _, state = alg.allow(test_key)
+        assert state._reset_at is None
+        epoch = state.reset_epoch
+        assert state._reset_at is None
+        assert isinstance(state.reset_at, datetime)
+        assert state.reset_at is state.reset_at
+        assert state.reset_at == alg.check(test_key).reset_at
+        assert epoch == state.reset_epoch
+
+    def test_sharded_state(self, test_key):
+        alg = GCRAAlgorithm(limit=8, period_seconds=60, shards=4)
+        allowed, state = alg.allow(test_key)
+        assert allowed is True
+        assert state.remaining == 7
+        for _ in range(7):
+            assert alg.allow(test_key)[0] is True
+        allowed, state = alg.allow(test_key)
+        assert allowed is False
+        assert state.retry_after > 0
+        assert alg.check(test_key).remaining == 0
+        alg.reset(test_key)
+        assert alg.check(test_key).remaining == 8
+
+    def test_sharded_uneven_burst(self, test_key):
+        alg = GCRAAlgorithm(limit=10, period_seconds=60.0, burst=10, shards=4)
+        assert alg.check(test_key).remaining == 10
+        allowed = sum(alg.allow(test_key)[0] for _ in range(15))
+        assert allowed == 10
+
+    def test_invalid_shards(self):
+        with pytest.raises(ValueError):
+            GCRAAlgorithm(limit=10, period_seconds=1.0, burst=4, shards=5)
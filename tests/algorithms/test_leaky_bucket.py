@@ -1,6 +1,5 @@
 import pytest
 import time
-from concurrent.futures import ThreadPoolExecutor
 from ratelink.algorithms.leaky_bucket import LeakyBucketAlgorithm
 
 class TestLeakyBucketAlgorithm:
@@ -57,6 +56,16 @@ class TestLeakyBucketAlgorithm:
         state = alg.check(test_key)
         assert state.remaining >= 59
 
+    def test_frequent_polling_still_drains(self, test_key, monkeypatch, fake_clock):
+        monkeypatch.setattr("ratelink.algorithms.leaky_bucket.time.monotonic_ns", fake_clock.now_ns)
+        alg = LeakyBucketAlgorithm(capacity=5, leak_rate=10)
+        for _ in range(5):
+            alg.allow(test_key)
+        for _ in range(40):
+            fake_clock.advance(0.05)
+            alg.check(test_key)
+        assert alg.check(test_key).remaining == 5
+
     def test_check_without_adding(self, test_key):
         alg = LeakyBucketAlgorithm(capacity=50, leak_rate=10)
         state1 = alg.check(test_key)
@@ -104,11 +113,9 @@ class TestLeakyBucketAlgorithm:
         assert allowed is True
         assert state.remaining == 49
 
-    def test_thread_safety(self, test_key):
+    def test_thread_safety(self, test_key, run_concurrently):
         alg = LeakyBucketAlgorithm(capacity=100, leak_rate=50)
-        def make_request():
-            return alg.allow(test_key)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(lambda _: make_request(), range(100)))
+        results = run_concurrently(lambda: alg.allow(test_key))
+        assert len(results) == 100
         allowed_count = sum(1 for allowed, _ in results if allowed)
         assert allowed_count == 100
\ No newline at end of file
@@ -1,8 +1,7 @@
 import pytest
 import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
-from ratelink.algorithms.sliding_window import SlidingWindowAlgorithm
+from ratelink.algorithms.sliding_window import SlidingWindowAlgorithm, SlidingWindowCounterAlgorithm
 
 class TestSlidingWindowAlgorithm:
     def test_initialization(self):
@@ -23,6 +22,15 @@ class TestSlidingWindowAlgorithm:
         assert state.remaining == 99
         assert state.violated is False
 
+    def test_reset_at_follows_oldest_entry(self, test_key):
+        alg = SlidingWindowAlgorithm(limit=2, window_seconds=60)
+        _, first = alg.allow(test_key)
+        alg.allow(test_key)
+        allowed, denied = alg.allow(test_key)
+        assert allowed is False
+        assert abs((denied.reset_at - first.reset_at).total_seconds()) < 0.01
+        assert denied.reset_epoch >= int(first.reset_at.timestamp())
+
     def test_request_tracking(self, test_key):
         alg = SlidingWindowAlgorithm(limit=10, window_seconds=60)
         for i in range(10):
@@ -117,12 +125,10 @@ class TestSlidingWindowAlgorithm:
         assert allowed is True
         assert state.remaining == 99
 
-    def test_thread_safety(self, test_key):
+    def test_thread_safety(self, test_key, run_concurrently):
         alg = SlidingWindowAlgorithm(limit=100, window_seconds=60)
-        def make_request():
-            return alg.allow(test_key)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(lambda _: make_request(), range(100)))
+        results = run_concurrently(lambda: alg.allow(test_key))
+        assert len(results) == 100
         allowed_count = sum(1 for allowed, _ in results if allowed)
         assert allowed_count == 100
 
@@ -139,4 +145,70 @@ class TestSlidingWindowAlgorithm:
     def test_zero_weight_invalid(self, test_key):
         alg = SlidingWindowAlgorithm(limit=100, window_seconds=60)
         with pytest.raises(ValueError):
-            alg.allow(test_key, weight=0)
\ No newline at end of file
+            alg.allow(test_key, weight=0)
+
+
+class TestSlidingWindowCounterAlgorithm:
+    @pytest.fixture
+    def clock(self, monkeypatch, fake_clock):
+        monkeypatch.setattr("ratelink.algorithms.sliding_window.time.monotonic_ns", fake_clock.now_ns)
+        return fake_clock
+
+    def test_reset_at_matches_check(self, test_key, clock):
+        alg = SlidingWindowCounterAlgorithm(limit=5, window_seconds=1.0)
+        _, state = alg.allow(test_key)
+        assert state.reset_at == alg.check(test_key).reset_at
+
+    def test_limit_within_window(self, test_key, clock):
+        alg = SlidingWindowCounterAlgorithm(limit=5, window_seconds=1.0)
+        for i in range(5):
+            allowed, state = alg.allow(test_key)
+            assert allowed is True
+            assert state.remaining == 4 - i
+        allowed, state = alg.allow(test_key)
+        assert allowed is False
+        assert 0 < state.retry_after <= 1.0
+
+    def test_previous_window_is_weighted(self, test_key, clock):
+        alg = SlidingWindowCounterAlgorithm(limit=10, window_seconds=1.0)
+        alg.allow(test_key, weight=10)
+        clock.advance(1.5)
+        state = alg.check(test_key)
+        assert state.remaining == 5
+        allowed, _ = alg.allow(test_key, weight=5)
+        assert allowed is True
+        allowed, _ = alg.allow(test_key)
+        assert allowed is False
+
+    def test_idle_key_fully_recovers(self, test_key, clock):
+        alg = SlidingWindowCounterAlgorithm(limit=10, window_seconds=1.0)
+        alg.allow(test_key, weight=10)
+        clock.advance(2.0)
+        allowed, state = alg.allow(test_key)
+        assert allowed is True
+        assert state.remaining == 9
+
+    def test_retry_after_matches_decay(self, test_key, clock):
+        alg = SlidingWindowCounterAlgorithm(limit=10, window_seconds=1.0)
+        alg.allow(test_key, weight=10)
+        clock.advance(1.2)
+        allowed, state = alg.allow(test_key, weight=5)
+        assert allowed is False
+        clock.advance(state.retry_after + 1e-9)
+        allowed, _ = alg.allow(test_key, weight=5)
+        assert allowed is True
+
+    def test_reset(self, multiple_keys):
+        alg = SlidingWindowCounterAlgorithm(limit=10, window_seconds=60)
+        for key in multiple_keys:
+            alg.allow(key, weight=5)
+        alg.reset(multiple_keys[0])
+        assert alg.check(multiple_keys[0]).remaining == 10
+        assert alg.check(multiple_keys[1]).remaining == 5
+        alg.reset()
+        assert alg.check(multiple_keys[1]).remaining == 10
+
+    def test_thread_safety(self, test_key, run_concurrently):
+        alg = SlidingWindowCounterAlgorithm(limit=50, window_seconds=60)
+        results = run_concurrently(lambda: alg.allow(test_key))
+        assert sum(1 for allowed, _ in results if allowed) == 50
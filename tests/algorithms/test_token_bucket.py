@@ -1,7 +1,6 @@
 import pytest
 import time
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 from ratelink.algorithms.token_bucket import TokenBucketAlgorithm
 
 class TestTokenBucketAlgorithm:
@@ -112,6 +111,16 @@ class TestTokenBucketAlgorithm:
         assert state.retry_after > 0
         assert state.retry_after <= 0.1
 
+    def test_fast_deny(self, test_key):
+        alg = TokenBucketAlgorithm(capacity=5, refill_rate=1, refill_period=60.0)
+        assert alg.fast_deny(test_key) is None
+        for _ in range(5):
+            alg.allow(test_key)
+        state = alg.fast_deny(test_key)
+        assert state is not None
+        assert state.violated is True
+        assert state.retry_after > 0
+
     @pytest.mark.asyncio
     async def test_async_allow(self, test_key):
         alg = TokenBucketAlgorithm(capacity=100, refill_rate=10)
@@ -119,12 +128,10 @@ class TestTokenBucketAlgorithm:
         assert allowed is True
         assert state.remaining == 99
 
-    def test_thread_safety(self, test_key):
+    def test_thread_safety(self, test_key, run_concurrently):
         alg = TokenBucketAlgorithm(capacity=100, refill_rate=50)
-        def make_request():
-            return alg.allow(test_key)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            results = list(executor.map(lambda _: make_request(), range(100)))
+        results = run_concurrently(lambda: alg.allow(test_key))
+        assert len(results) == 100
         allowed_count = sum(1 for allowed, _ in results if allowed)
         assert allowed_count == 100
 
@@ -136,4 +143,35 @@ class TestTokenBucketAlgorithm:
     def test_zero_weight_invalid(self, test_key):
         alg = TokenBucketAlgorithm(capacity=100, refill_rate=10)
         with pytest.raises(ValueError):
-            alg.allow(test_key, weight=0)
\ No newline at end of file
+            alg.allow(test_key, weight=0)
+
+    def test_allow_batch(self, test_key):
+        alg = TokenBucketAlgorithm(capacity=10, refill_rate=0.001)
+        assert alg.allow_batch(test_key, 4) == 4
+        assert alg.allow_batch(test_key, 10) == 6
+        assert alg.allow_batch(test_key, 1) == 0
+
+    def test_allow_many(self, multiple_keys):
+        alg = TokenBucketAlgorithm(capacity=3, refill_rate=0.001)
+        key_a, key_b = multiple_keys[0], multiple_keys[1]
+        results = alg.allow_many([(key_a, 2), (key_b, 1), (key_a, 2)])
+        assert [allowed for allowed, _ in results] == [True, True, False]
+        assert results[0][1].remaining == 1
+        assert results[2][1].violated is True
+
+    def test_thread_safety_multiple_keys(self, multiple_keys, shared_executor):
+        alg = TokenBucketAlgorithm(capacity=20, refill_rate=0.001)
+        def drain(key):
+            return sum(1 for _ in range(30) if alg.allow(key)[0])
+        granted = list(shared_executor.map(drain, multiple_keys))
+        assert granted == [20] * len(multiple_keys)
+
+    @pytest.mark.bench
+    def test_allow_stays_off_event_loop(self, test_key, monkeypatch, shared_executor):
+        def fail(*args, **kwargs):
+            raise AssertionError("allow() must not enter asyncio")
+        monkeypatch.setattr(asyncio, "get_running_loop", fail)
+        monkeypatch.setattr(asyncio, "get_event_loop", fail)
+        alg = TokenBucketAlgorithm(capacity=100, refill_rate=50)
+        results = list(shared_executor.map(lambda _: alg.allow(test_key), range(100)))
+        assert all(allowed for allowed, _ in results)
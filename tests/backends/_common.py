@@ -0,0 +1,74 @@
+import pytest
+import uuid
+from datetime import datetime
+
+class BackendContract:
+    backend_name = None
+
+    # Subclasses provide a class-scoped delete_by_prefix fixture returning a callable that
+    # removes every stored key starting with the given prefix.
+    @pytest.fixture(scope="class")
+    def key_namespace(self, delete_by_prefix):
+        prefix = f"test:{uuid.uuid4().hex}:"
+        yield prefix
+        delete_by_prefix(prefix)
+
+    @pytest.fixture(autouse=True)
+    def _key_prefix(self, key_namespace):
+        self.key_prefix = f"{key_namespace}{uuid.uuid4().hex[:8]}:"
+
+    def key(self, name):
+        return self.key_prefix + name
+
+    def test_check_nonexistent_key(self):
+        state = self.backend.check(self.key("nonexistent"))
+        assert state.limit == 0
+        assert state.remaining == 0
+
+    def test_consume_tokens(self):
+        key = self.key("consume")
+        state1 = self.backend.consume(key, weight=10)
+        assert state1.remaining >= 0
+        state2 = self.backend.consume(key, weight=5)
+        assert state2.remaining < state1.remaining
+
+    def test_reset_at_in_future(self):
+        key = self.key("ttl")
+        state = self.backend.consume(key, weight=1)
+        assert state.reset_at > datetime.now()
+
+    def test_peek_doesnt_modify(self):
+        key = self.key("peek")
+        self.backend.consume(key, weight=10)
+        state1 = self.backend.peek(key)
+        state2 = self.backend.peek(key)
+        assert state1.remaining == state2.remaining
+
+    def test_reset_specific_key(self):
+        key = self.key("reset")
+        self.backend.consume(key, weight=10)
+        self.backend.reset(key)
+        state = self.backend.check(key)
+        assert state.limit == 0
+
+    def test_reset_all(self, dedicated_backend):
+        # A full reset() wipes the whole table, so it runs on a table no other test shares.
+        keys = [self.key("reset1"), self.key("reset2"), self.key("reset3")]
+        for key in keys:
+            dedicated_backend.consume(key, weight=1)
+        dedicated_backend.reset()
+        for key in keys:
+            state = dedicated_backend.check(key)
+            assert state.limit == 0
+
+    @pytest.mark.asyncio
+    async def test_async_operations(self):
+        key = self.key("async")
+        state = await self.backend.consume_async(key, weight=1)
+        assert state is not None
+
+    def test_metadata_storage(self):
+        key = self.key("metadata")
+        state = self.backend.consume(key, weight=1)
+        assert "backend" in state.metadata
+        assert state.metadata["backend"] == self.backend_name
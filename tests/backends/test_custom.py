@@ -1,12 +1,15 @@
 # File: tests/backends/test_custom.py
 import pytest
+import time
 from datetime import datetime, timedelta
 from ratelink.backends.custom import CustomBackendInterface
 from ratelink.core.types import RateLimitState
+from ratelink.core.clock import NS_PER_SECOND, monotonic_to_datetime
 
 class MockCustomBackend(CustomBackendInterface):
     def __init__(self):
         self.store = {}
+        self.reset_ns = {}
 
     def check(self, key: str) -> RateLimitState:
         if key not in self.store:
@@ -24,39 +27,30 @@ class MockCustomBackend(CustomBackendInterface):
         if weight <= 0:
             raise ValueError("weight must be positive")
 
-        if key not in self.store:
-            state = RateLimitState(
+        now_ns = time.monotonic_ns()
+        state = self.store.get(key)
+        if state is None:
+            reset_ns = self.reset_ns[key] = now_ns + 3600 * NS_PER_SECOND
+            state = self.store[key] = RateLimitState(
                 limit=1000,
                 remaining=1000 - weight,
-                reset_at=datetime.now() + timedelta(seconds=3600),
+                reset_at=monotonic_to_datetime(reset_ns),
                 retry_after=0.0,
                 violated=False,
                 metadata={},
             )
-            self.store[key] = state
             return state
-        state = self.store[key]
         new_remaining = state.remaining - weight
 
         if new_remaining < 0:
-            return RateLimitState(
-                limit=state.limit,
-                remaining=state.remaining,
-                reset_at=state.reset_at,
-                retry_after=(state.reset_at - datetime.now()).total_seconds(),
-                violated=True,
-                metadata=state.metadata,
-            )
-        new_state = RateLimitState(
-            limit=state.limit,
-            remaining=new_remaining,
-            reset_at=state.reset_at,
-            retry_after=0.0,
-            violated=False,
-            metadata=state.metadata,
-        )
-        self.store[key] = new_state
-        return new_state
+            state.retry_after = max(0.0, (self.reset_ns[key] - now_ns) / NS_PER_SECOND)
+            state.violated = True
+            return state
+        if state.violated:
+            state.retry_after = 0.0
+            state.violated = False
+        state.remaining = new_remaining
+        return state
 
     def peek(self, key: str) -> RateLimitState:
         return self.check(key)
@@ -64,8 +58,10 @@ class MockCustomBackend(CustomBackendInterface):
     def reset(self, key: str = None) -> None:
         if key is None:
             self.store.clear()
+            self.reset_ns.clear()
         else:
             self.store.pop(key, None)
+            self.reset_ns.pop(key, None)
 
     async def check_async(self, key: str) -> RateLimitState:
         return self.check(key)
@@ -113,4 +109,20 @@ class TestCustomBackendInterface:
     async def test_async_methods(self):
         backend = MockCustomBackend()
         state = await backend.consume_async("test:async", weight=5)
-        assert state.remaining == 995
\ No newline at end of file
+        assert state.remaining == 995
+
+    def test_consume_rejection(self):
+        backend = MockCustomBackend()
+        backend.consume("test:key", weight=1000)
+        state = backend.consume("test:key", weight=1)
+        assert state.violated is True
+        assert 0 < state.retry_after <= 3600
+
+    def test_consume_after_rejection(self):
+        backend = MockCustomBackend()
+        backend.consume("test:key", weight=990)
+        assert backend.consume("test:key", weight=20).violated is True
+        state = backend.consume("test:key", weight=5)
+        assert state.violated is False
+        assert state.retry_after == 0.0
+        assert state.remaining == 5
@@ -1,7 +1,5 @@
 import pytest
 import time
-from datetime import datetime, timedelta
-from concurrent.futures import ThreadPoolExecutor
 from ratelink.backends.memory import MemoryBackend
 
 class TestMemoryBackend:
@@ -21,9 +19,8 @@ class TestMemoryBackend:
         assert state.limit == 0
         assert state.remaining == 0
 
-    def test_set_and_check(self, test_key):
+    def test_set_and_check(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
         backend.set_state(
             test_key, limit=100, remaining=99, reset_at=reset_at, retry_after=0.0
         )
@@ -31,9 +28,8 @@ class TestMemoryBackend:
         assert state.limit == 100
         assert state.remaining == 99
 
-    def test_consume(self, test_key):
+    def test_consume(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
         backend.set_state(
             test_key, limit=100, remaining=100, reset_at=reset_at
         )
@@ -42,9 +38,8 @@ class TestMemoryBackend:
         state = backend.consume(test_key, weight=25)
         assert state.remaining == 50
 
-    def test_peek_doesnt_modify(self, test_key):
+    def test_peek_doesnt_modify(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
         backend.set_state(
             test_key, limit=100, remaining=50, reset_at=reset_at
         )
@@ -52,9 +47,8 @@ class TestMemoryBackend:
         state2 = backend.peek(test_key)
         assert state1.remaining == state2.remaining == 50
 
-    def test_reset_specific_key(self, test_key):
+    def test_reset_specific_key(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
         backend.set_state(
             test_key, limit=100, remaining=50, reset_at=reset_at
         )
@@ -63,45 +57,53 @@ class TestMemoryBackend:
         state = backend.check(test_key)
         assert state.limit == 0
 
-    def test_reset_all(self, multiple_keys):
+    @pytest.mark.parametrize("key_count", [10, 100, 1000])
+    def test_reset_all(self, key_count, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
-        for key in multiple_keys:
-            backend.set_state(
-                key, limit=100, remaining=50, reset_at=reset_at
-            )
+        keys = [f"test:key:{i}" for i in range(key_count)]
+        backend.set_state_many(
+            {key: {"limit": 100, "remaining": 50, "reset_at": reset_at} for key in keys}
+        )
+        assert backend.get_stats()["keys_count"] == key_count
         backend.reset()
-        for key in multiple_keys:
+        for key in keys:
             state = backend.check(key)
             assert state.limit == 0
 
-    def test_ttl_expiration(self, test_key):
-        backend = MemoryBackend(ttl_seconds=0.5, cleanup_interval=0.1)
-        reset_at = datetime.now() + timedelta(seconds=60)
+    def test_ttl_expiration(self, test_key, fake_clock, reset_at):
+        backend = MemoryBackend(ttl_seconds=0.5, cleanup_interval=0.1, time_source=fake_clock.now)
         backend.set_state(
             test_key, limit=100, remaining=50, reset_at=reset_at
         )
         state = backend.check(test_key)
         assert state.remaining == 50
+        fake_clock.advance(0.6)
+        state = backend.check(test_key)
+        assert state.limit == 0
+
+    @pytest.mark.slow
+    def test_ttl_expiration_real_clock(self, test_key, far_future_reset_at):
+        backend = MemoryBackend(ttl_seconds=0.5, cleanup_interval=0.1)
+        backend.set_state(
+            test_key, limit=100, remaining=50, reset_at=far_future_reset_at
+        )
         time.sleep(0.6)
         state = backend.check(test_key)
         assert state.limit == 0
 
-    def test_automatic_cleanup(self, multiple_keys):
-        backend = MemoryBackend(ttl_seconds=0.3, cleanup_interval=0.2)
-        reset_at = datetime.now() + timedelta(seconds=60)
-        for key in multiple_keys:
-            backend.set_state(
-                key, limit=100, remaining=50, reset_at=reset_at
-            )
-        time.sleep(0.4)
+    @pytest.mark.parametrize("key_count", [10, 100, 1000])
+    def test_automatic_cleanup(self, key_count, fake_clock, reset_at):
+        backend = MemoryBackend(ttl_seconds=0.3, cleanup_interval=0.2, time_source=fake_clock.now)
+        backend.set_state_many(
+            {f"test:key:{i}": {"limit": 100, "remaining": 50, "reset_at": reset_at} for i in range(key_count)}
+        )
+        fake_clock.advance(0.4)
         backend.check("trigger_cleanup")
         stats = backend.get_stats()
         assert stats["keys_count"] <= 1
 
-    def test_metadata_storage(self, test_key):
+    def test_metadata_storage(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
         metadata = {"algorithm": "token_bucket", "rate": 10}
         backend.set_state(
             test_key,
@@ -122,9 +124,8 @@ class TestMemoryBackend:
         assert stats["ttl_seconds"] == 300
 
     @pytest.mark.asyncio
-    async def test_async_check(self, test_key):
+    async def test_async_check(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
         backend.set_state(
             test_key, limit=100, remaining=50, reset_at=reset_at
         )
@@ -132,9 +133,8 @@ class TestMemoryBackend:
         assert state.remaining == 50
 
     @pytest.mark.asyncio
-    async def test_async_consume(self, test_key):
+    async def test_async_consume(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
         backend.set_state(
             test_key, limit=100, remaining=100, reset_at=reset_at
         )
@@ -142,10 +142,8 @@ class TestMemoryBackend:
         assert state.remaining == 75
 
     @pytest.mark.asyncio
-    async def test_async_reset(self, test_key):
+    async def test_async_reset(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
-
         backend.set_state(
             test_key, limit=100, remaining=50, reset_at=reset_at
         )
@@ -154,22 +152,20 @@ class TestMemoryBackend:
         state = backend.check(test_key)
         assert state.limit == 0
 
-    def test_thread_safety(self, test_key):
+    @pytest.mark.parametrize("n_threads,n_ops", [(1, 1000), (10, 100), (50, 20)])
+    @pytest.mark.parametrize("weight", [1, 2])
+    def test_thread_safety(self, test_key, run_concurrently, reset_at, n_threads, n_ops, weight):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
+        limit = 2 * n_threads * n_ops
         backend.set_state(
-            test_key, limit=1000, remaining=1000, reset_at=reset_at
+            test_key, limit=limit, remaining=limit, reset_at=reset_at
         )
-        def consume():
-            backend.consume(test_key, weight=1)
-        with ThreadPoolExecutor(max_workers=10) as executor:
-            list(executor.map(lambda _: consume(), range(100)))
+        run_concurrently(lambda: backend.consume(test_key, weight=weight), threads=n_threads, calls=n_ops)
         state = backend.check(test_key)
-        assert state.remaining == 900
+        assert state.remaining == limit - weight * n_threads * n_ops
 
-    def test_invalid_weight(self, test_key):
+    def test_invalid_weight(self, test_key, reset_at):
         backend = MemoryBackend()
-        reset_at = datetime.now() + timedelta(seconds=60)
         backend.set_state(
             test_key, limit=100, remaining=100, reset_at=reset_at
         )
@@ -1,5 +1,8 @@
+import os
 import pytest
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 @pytest.fixture
@@ -14,16 +17,164 @@ def future_time():
 def past_time():
     return time.time() - 10
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_key():
     return "test:key:123"
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_keys():
     return ["test:key:1", "test:key:2", "test:key:3"]
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def wait_for_refill():
     def _wait(seconds: float) -> None:
         time.sleep(seconds)
-    return _wait
\ No newline at end of file
+    return _wait
+
+@pytest.fixture(scope="module")
+def reset_at():
+    return datetime.now() + timedelta(seconds=60)
+
+@pytest.fixture(scope="module")
+def far_future_reset_at():
+    return datetime.now() + timedelta(hours=1)
+
+class FakeClock:
+    def __init__(self, start: float = 1000.0) -> None:
+        self.current = start
+
+    def now(self) -> float:
+        return self.current
+
+    def now_ns(self) -> int:
+        return round(self.current * 1_000_000_000)
+
+    def advance(self, seconds: float) -> None:
+        self.current += seconds
+
+@pytest.fixture
+def fake_clock():
+    return FakeClock()
+
+@pytest.fixture(scope="session")
+def shared_executor():
+    executor = ThreadPoolExecutor(max_workers=32)
+    yield executor
+    executor.shutdown()
+
+@pytest.fixture
+def run_concurrently():
+    def _run(func, threads: int = 10, calls: int = 10) -> list:
+        barrier = threading.Barrier(threads)
+        results = []
+        def worker():
+            barrier.wait()
+            local = [func() for _ in range(calls)]
+            results.extend(local)
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        return results
+    return _run
+
+
+# Each pytest-xdist worker gets its own database/table so parallel runs never share state.
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+
+# The *_factory fixtures build a backend on a fresh per-worker table (or database) named after
+# their argument and drop everything they created at session end. Tests that need a full reset()
+# take their own instance from the factory instead of wiping the shared one.
+
+@pytest.fixture(scope="session")
+def dynamodb_factory():
+    created = []
+
+    def make(name):
+        from ratelink.backends.dynamodb import DynamoDBBackend
+        backend = DynamoDBBackend(
+            region="us-east-1",
+            table_name=f"{name}_{XDIST_WORKER}",
+            endpoint_url="http://localhost:8000",
+            aws_access_key_id="test",
+            aws_secret_access_key="test",
+        )
+        created.append(backend)
+        backend.reset()
+        return backend
+
+    yield make
+    for backend in created:
+        backend.table.delete()
+
+@pytest.fixture(scope="session")
+def dynamodb_backend(dynamodb_factory):
+    try:
+        return dynamodb_factory("test_rate_limits")
+    except Exception:
+        pytest.skip("DynamoDB not available (local or AWS)")
+
+@pytest.fixture(scope="session")
+def mongodb_factory():
+    created = []
+
+    def make(name):
+        from ratelink.backends.mongodb import MongoDBBackend
+        backend = MongoDBBackend(
+            connection_string="mongodb://localhost:27017/",
+            database=f"{name}_{XDIST_WORKER}",
+            collection="test_limits",
+        )
+        created.append(backend)
+        backend.reset()
+        return backend
+
+    yield make
+    for backend in created:
+        backend.client.drop_database(backend.db.name)
+        backend.close()
+
+@pytest.fixture(scope="session")
+def mongodb_backend(mongodb_factory):
+    try:
+        return mongodb_factory("test_rate_limits")
+    except Exception:
+        pytest.skip("MongoDB server not available")
+
+@pytest.fixture(scope="session")
+def postgres_factory():
+    created = []
+
+    def make(name):
+        from ratelink.backends.postgresql import PostgreSQLBackend
+        backend = PostgreSQLBackend(
+            host="localhost",
+            port=5432,
+            user="postgres",
+            password="postgres",
+            database="test_rate_limits",
+            table_name=f"{name}_{XDIST_WORKER}",
+            pool_size=5,
+            connect_timeout=5,
+        )
+        created.append(backend)
+        backend.reset()
+        return backend
+
+    yield make
+    for backend in created:
+        conn = backend.pool.getconn()
+        try:
+            conn.cursor().execute(f"DROP TABLE IF EXISTS {backend.table_name}")
+            conn.commit()
+        finally:
+            backend.pool.putconn(conn)
+        backend.close()
+
+@pytest.fixture(scope="session")
+def postgres_backend(postgres_factory):
+    try:
+        return postgres_factory("test_limits")
+    except Exception:
+        pytest.skip("PostgreSQL server not available")
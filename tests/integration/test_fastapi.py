@@ -1,25 +1,47 @@
 import pytest
 
-try:
-    from fastapi import FastAPI, Request
-    from fastapi.testclient import TestClient
-    FASTAPI_AVAILABLE = True
-except ImportError:
-    FASTAPI_AVAILABLE = False
+pytest.importorskip("fastapi", reason="FastAPI not installed")
 
-if FASTAPI_AVAILABLE:
-    from ratelink.integrations.fastapi import (
-        FastAPIRateLimitMiddleware,
-        rate_limit,
-    )
-    from ratelink.utils.key_generators import by_ip, by_route, composite_key
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.testclient import TestClient
+from ratelink.integrations.fastapi import (
+    FastAPIRateLimitMiddleware,
+    rate_limit,
+)
+from ratelink.utils.key_generators import by_ip, by_route, composite_key
 
 from mock_limiter import MockRateLimiter
 
-@pytest.mark.skipif(not FASTAPI_AVAILABLE, reason="FastAPI not installed")
+def ok_response():
+    # Middleware-only tests skip FastAPI's response serialisation entirely.
+    return Response(b'{"status":"ok"}', media_type="application/json")
+
+async def ok_endpoint():
+    return ok_response()
+
+# Shared "/test" endpoint for middleware tests that only need a plain 200.
+ok_router = APIRouter()
+ok_router.add_api_route("/test", ok_endpoint, methods=["GET"])
+
+@pytest.fixture
+def app():
+    return FastAPI()
+
+@pytest.fixture
+def make_client():
+    # Entered clients keep one portal open for every request a test makes.
+    clients = []
+    def _make(app):
+        client = TestClient(app)
+        client.__enter__()
+        clients.append(client)
+        return client
+    yield _make
+    for client in clients:
+        client.__exit__(None, None, None)
+
 class TestFastAPIMiddleware:    
-    def test_middleware_allows_request(self):
-        app = FastAPI()
+    def test_middleware_allows_request(self, app, make_client):
         limiter = MockRateLimiter(should_allow=True)
         
         app.add_middleware(
@@ -28,20 +50,18 @@ class TestFastAPIMiddleware:
             key_generator=by_ip()
         )
         
-        @app.get("/test")
-        async def test_endpoint():
-            return {"status": "ok"}
+        app.include_router(ok_router)
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
         assert "X-RateLimit-Limit" in response.headers
         assert "X-RateLimit-Remaining" in response.headers
+        assert "Retry-After" not in response.headers
     
-    def test_middleware_blocks_request(self):
-        app = FastAPI()
+    def test_middleware_blocks_request(self, app, make_client):
         limiter = MockRateLimiter(should_allow=False)
         
         app.add_middleware(
@@ -50,11 +70,9 @@ class TestFastAPIMiddleware:
             key_generator=by_ip()
         )
         
-        @app.get("/test")
-        async def test_endpoint():
-            return {"status": "ok"}
+        app.include_router(ok_router)
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code == 429
@@ -62,8 +80,7 @@ class TestFastAPIMiddleware:
         assert response.json()["error"] == "Rate limit exceeded"
         assert "Retry-After" in response.headers
     
-    def test_middleware_skip_paths(self):
-        app = FastAPI()
+    def test_middleware_skip_paths(self, app, make_client):
         limiter = MockRateLimiter(should_allow=False)
         
         app.add_middleware(
@@ -80,7 +97,7 @@ class TestFastAPIMiddleware:
         async def api():
             return {"data": []}
         
-        client = TestClient(app)
+        client = make_client(app)
         
         response = client.get("/health")
         assert response.status_code == 200
@@ -88,8 +105,19 @@ class TestFastAPIMiddleware:
         response = client.get("/api")
         assert response.status_code == 429
     
-    def test_middleware_custom_key_generator(self):
-        app = FastAPI()
+    def test_middleware_default_key(self, app, make_client):
+        limiter = MockRateLimiter(should_allow=True)
+        
+        app.add_middleware(FastAPIRateLimitMiddleware, limiter=limiter)
+        
+        app.include_router(ok_router)
+        
+        client = make_client(app)
+        client.get("/test")
+        
+        assert limiter.check_calls[0][0] == "ip:testclient"
+    
+    def test_middleware_custom_key_generator(self, app, make_client):
         limiter = MockRateLimiter(should_allow=True)
         
         app.add_middleware(
@@ -106,20 +134,18 @@ class TestFastAPIMiddleware:
         async def endpoint2():
             return {"n": 2}
         
-        client = TestClient(app)
+        client = make_client(app)
         client.get("/endpoint1")
         client.get("/endpoint2")
         
         assert len(limiter.check_calls) == 2
         key1, key2 = limiter.check_calls[0][0], limiter.check_calls[1][0]
         assert key1 != key2
-        assert "route" in key1
-        assert "route" in key2
+        assert key1 == "route:/endpoint1"
+        assert key2 == "route:/endpoint2"
 
-@pytest.mark.skipif(not FASTAPI_AVAILABLE, reason="FastAPI not installed")
 class TestFastAPIDecorator:    
-    def test_decorator_allows_request(self):
-        app = FastAPI()
+    def test_decorator_allows_request(self, app, make_client):
         limiter = MockRateLimiter(should_allow=True)
         
         @app.get("/test")
@@ -127,14 +153,13 @@ class TestFastAPIDecorator:
         async def test_endpoint(request: Request):
             return {"status": "ok"}
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
     
-    def test_decorator_blocks_request(self):
-        app = FastAPI()
+    def test_decorator_blocks_request(self, app, make_client):
         limiter = MockRateLimiter(should_allow=False)
         
         @app.get("/test")
@@ -142,14 +167,13 @@ class TestFastAPIDecorator:
         async def test_endpoint(request: Request):
             return {"status": "ok"}
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code == 429
         assert "error" in response.json()
     
-    def test_decorator_per_endpoint_limits(self):
-        app = FastAPI()
+    def test_decorator_per_endpoint_limits(self, app, make_client):
         limiter_strict = MockRateLimiter(should_allow=False)
         limiter_lenient = MockRateLimiter(should_allow=True)
         
@@ -163,7 +187,7 @@ class TestFastAPIDecorator:
         async def lenient_endpoint(request: Request):
             return {"endpoint": "lenient"}
         
-        client = TestClient(app)
+        client = make_client(app)
         
         response = client.get("/strict")
         assert response.status_code == 429
@@ -171,8 +195,7 @@ class TestFastAPIDecorator:
         response = client.get("/lenient")
         assert response.status_code == 200
     
-    def test_decorator_composite_key(self):
-        app = FastAPI()
+    def test_decorator_composite_key(self, app, make_client):
         limiter = MockRateLimiter(should_allow=True)
         
         @app.get("/test")
@@ -180,17 +203,15 @@ class TestFastAPIDecorator:
         async def test_endpoint(request: Request):
             return {"status": "ok"}
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code == 200
         assert len(limiter.check_calls) == 1
         key = limiter.check_calls[0][0]
-        assert "ip:" in key
-        assert "route:" in key
+        assert key == "ip:testclient:route:/test"
     
-    def test_decorator_without_request(self):
-        app = FastAPI()
+    def test_decorator_without_request(self, app, make_client):
         limiter = MockRateLimiter(should_allow=True)
         
         @app.get("/test")
@@ -198,13 +219,12 @@ class TestFastAPIDecorator:
         async def test_endpoint():
             return {"status": "ok"}
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code in [200, 429]
     
-    def test_response_headers_on_success(self):
-        app = FastAPI()
+    def test_response_headers_on_success(self, app, make_client):
         limiter = MockRateLimiter(should_allow=True, state={
             'allowed': True,
             'remaining': 75,
@@ -218,19 +238,41 @@ class TestFastAPIDecorator:
             limiter=limiter
         )
         
-        @app.get("/test")
-        async def test_endpoint():
-            return {"status": "ok"}
+        app.include_router(ok_router)
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code == 200
         assert response.headers["X-RateLimit-Limit"] == "100"
         assert response.headers["X-RateLimit-Remaining"] == "75"
     
-    def test_retry_after_header_format(self):
-        app = FastAPI()
+    def test_middleware_and_decorator_headers_not_duplicated(self, app, make_client):
+        middleware_limiter = MockRateLimiter(should_allow=True, state={
+            'allowed': True,
+            'remaining': 75,
+            'limit': 100,
+            'retry_after': 0,
+        })
+        
+        app.add_middleware(
+            FastAPIRateLimitMiddleware,
+            limiter=middleware_limiter
+        )
+        
+        @app.get("/test")
+        @rate_limit(MockRateLimiter(should_allow=False), key_generator=by_ip())
+        async def test_endpoint(request: Request):
+            return {"status": "ok"}
+        
+        client = make_client(app)
+        response = client.get("/test")
+        
+        assert response.status_code == 429
+        assert response.headers.get_list("X-RateLimit-Limit") == ["100"]
+        assert response.headers.get_list("X-RateLimit-Remaining") == ["75"]
+    
+    def test_retry_after_header_format(self, app, make_client):
         limiter = MockRateLimiter(should_allow=False, state={
             'allowed': False,
             'remaining': 0,
@@ -243,11 +285,9 @@ class TestFastAPIDecorator:
             limiter=limiter
         )
         
-        @app.get("/test")
-        async def test_endpoint():
-            return {"status": "ok"}
+        app.include_router(ok_router)
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code == 429
@@ -255,10 +295,8 @@ class TestFastAPIDecorator:
         assert response.json()["retry_after"] == 45.7
 
 
-@pytest.mark.skipif(not FASTAPI_AVAILABLE, reason="FastAPI not installed")
 class TestFastAPIAsync:    
-    def test_async_endpoint_with_decorator(self):
-        app = FastAPI()
+    def test_async_endpoint_with_decorator(self, app, make_client):
         limiter = MockRateLimiter(should_allow=True)
         
         @app.get("/async")
@@ -266,14 +304,13 @@ class TestFastAPIAsync:
         async def async_endpoint(request: Request):
             return {"async": True}
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/async")
         
         assert response.status_code == 200
         assert response.json() == {"async": True}
     
-    def test_middleware_doesnt_block_async(self):
-        app = FastAPI()
+    def test_middleware_doesnt_block_async(self, app, make_client):
         limiter = MockRateLimiter(should_allow=True)
         
         app.add_middleware(
@@ -286,9 +323,9 @@ class TestFastAPIAsync:
         @app.get("/test")
         async def test_endpoint():
             call_order.append("endpoint")
-            return {"status": "ok"}
+            return ok_response()
         
-        client = TestClient(app)
+        client = make_client(app)
         response = client.get("/test")
         
         assert response.status_code == 200
@@ -1,21 +1,28 @@
+import functools
 import pytest
 
-try:
-    from flask import Flask
-    FLASK_AVAILABLE = True
-except ImportError:
-    FLASK_AVAILABLE = False
+pytest.importorskip("flask", reason="Flask not installed")
 
-if FLASK_AVAILABLE:
-    from ratelink.integrations.flask import (
-        FlaskRateLimiter,
-        flask_rate_limit,
-        parse_rate_limit_string,
-    )
-    from ratelink.utils.key_generators import by_ip, by_route
+from flask import Flask
+from ratelink.integrations.flask import (
+    FlaskRateLimiter,
+    flask_rate_limit,
+    parse_rate_limit_string,
+)
+from ratelink.utils.key_generators import by_ip, by_route
 
 from mock_limiter import MockRateLimiter
 
+@pytest.fixture
+def app():
+    return Flask(__name__)
+
+@pytest.fixture
+def client(app):
+    # Routes and hooks can still be registered until the first request is served.
+    with app.test_client() as test_client:
+        yield test_client
+
 
 class TestParseRateLimitString:
     def test_parse_per_minute(self):
@@ -52,18 +59,15 @@ class TestParseRateLimitString:
             parse_rate_limit_string("100 per week")
 
 
-@pytest.mark.skipif(not FLASK_AVAILABLE, reason="Flask not installed")
 class TestFlaskRateLimiter:    
-    def test_extension_initialization(self):
-        app = Flask(__name__)
+    def test_extension_initialization(self, app):
         limiter = MockRateLimiter(should_allow=True)
         flask_limiter = FlaskRateLimiter(app, limiter)
         
         assert flask_limiter.limiter == limiter
         assert flask_limiter.app == app
     
-    def test_limit_decorator_allows_request(self):
-        app = Flask(__name__)
+    def test_limit_decorator_allows_request(self, app, client):
         limiter = MockRateLimiter(should_allow=True)
         flask_limiter = FlaskRateLimiter(app, limiter)
         
@@ -72,12 +76,10 @@ class TestFlaskRateLimiter:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/test")
-            assert response.status_code == 200
+        response = client.get("/test")
+        assert response.status_code == 200
     
-    def test_limit_decorator_blocks_request(self):
-        app = Flask(__name__)
+    def test_limit_decorator_blocks_request(self, app, client):
         limiter = MockRateLimiter(should_allow=False)
         flask_limiter = FlaskRateLimiter(app, limiter)
         
@@ -86,13 +88,25 @@ class TestFlaskRateLimiter:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/test")
-            assert response.status_code == 429
-            assert b"Rate limit exceeded" in response.data
+        response = client.get("/test")
+        assert response.status_code == 429
+        assert b"Rate limit exceeded" in response.data
+    
+    def test_limit_decorator_sets_headers(self, app, client):
+        limiter = MockRateLimiter(should_allow=True)
+        flask_limiter = FlaskRateLimiter(app, limiter)
+        
+        @app.route("/test")
+        @flask_limiter.limit("100 per minute")
+        def test_route():
+            return {"status": "ok"}
+        
+        response = client.get("/test")
+        assert response.headers["X-RateLimit-Limit"] == "100"
+        assert response.headers["X-RateLimit-Remaining"] == "50"
+        assert "Retry-After" not in response.headers
     
-    def test_custom_key_function(self):
-        app = Flask(__name__)
+    def test_custom_key_function(self, app, client):
         limiter = MockRateLimiter(should_allow=True)
         flask_limiter = FlaskRateLimiter(app, limiter)
         
@@ -101,14 +115,12 @@ class TestFlaskRateLimiter:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/test")
-            assert response.status_code == 200
-            assert len(limiter.check_calls) > 0
-            assert "route:" in limiter.check_calls[0][0]
+        response = client.get("/test")
+        assert response.status_code == 200
+        assert len(limiter.check_calls) > 0
+        assert limiter.check_calls[0][0] == "route:/test"
     
-    def test_per_method_limiting(self):
-        app = Flask(__name__)
+    def test_per_method_limiting(self, app, client):
         limiter = MockRateLimiter(should_allow=True)
         flask_limiter = FlaskRateLimiter(app, limiter)
         
@@ -117,21 +129,19 @@ class TestFlaskRateLimiter:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            limiter.reset()
-            client.get("/test")
-            get_key = limiter.check_calls[0][0]
+        limiter.reset()
+        client.get("/test")
+        get_key = limiter.check_calls[0][0]
             
-            limiter.reset()
-            client.post("/test")
-            post_key = limiter.check_calls[0][0]
+        limiter.reset()
+        client.post("/test")
+        post_key = limiter.check_calls[0][0]
             
-            assert get_key != post_key
-            assert ":GET" in get_key or "GET" in get_key
-            assert ":POST" in post_key or "POST" in post_key
+        assert get_key != post_key
+        assert get_key.endswith(":GET")
+        assert post_key.endswith(":POST")
     
-    def test_exempt_decorator(self):
-        app = Flask(__name__)
+    def test_exempt_decorator(self, app, client):
         limiter = MockRateLimiter(should_allow=False)
         flask_limiter = FlaskRateLimiter(app, limiter)
         
@@ -145,15 +155,77 @@ class TestFlaskRateLimiter:
         def exempt_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/limited")
-            assert response.status_code == 429
+        response = client.get("/limited")
+        assert response.status_code == 429
             
-            response = client.get("/exempt")
-            assert response.status_code == 200
+        response = client.get("/exempt")
+        assert response.status_code == 200
+    
+    def test_exempt_skips_default_limits(self, app, client):
+        limiter = MockRateLimiter(should_allow=False)
+        flask_limiter = FlaskRateLimiter(app, limiter, default_limits=["100 per minute"])
+        
+        @app.route("/limited")
+        def limited_route():
+            return {"status": "ok"}
+        
+        @app.route("/exempt")
+        @flask_limiter.exempt
+        def exempt_route():
+            return {"status": "ok"}
+        
+        assert client.get("/limited").status_code == 429
+        assert client.get("/exempt").status_code == 200
+    
+    def test_limit_survives_outer_decorator(self, app, client):
+        limiter = MockRateLimiter(should_allow=False)
+        flask_limiter = FlaskRateLimiter(app, limiter)
+        
+        def passthrough(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+            return wrapper
+        
+        @app.route("/wrapped")
+        @passthrough
+        @flask_limiter.limit("100 per minute")
+        def wrapped_route():
+            return {"status": "ok"}
+        
+        assert client.get("/wrapped").status_code == 429
+        assert len(limiter.check_calls) == 1
+    
+    def test_limit_before_init_app(self, app, client):
+        limiter = MockRateLimiter(should_allow=False)
+        flask_limiter = FlaskRateLimiter(limiter=limiter)
+        
+        @app.route("/early")
+        @flask_limiter.limit("100 per minute")
+        def early_route():
+            return {"status": "ok"}
+        
+        other_app = Flask(__name__)
+        other_app.add_url_rule("/early", view_func=early_route)
+        flask_limiter.init_app(app)
+        
+        assert client.get("/early").status_code == 429
+        assert len(limiter.check_calls) == 1
+        assert other_app.test_client().get("/early").status_code == 429
+        assert len(limiter.check_calls) == 2
+    
+    def test_default_limits_checked_once(self, app, client):
+        limiter = MockRateLimiter(should_allow=True)
+        FlaskRateLimiter(app, limiter, default_limits=["100 per minute", "1000 per hour"])
+        
+        @app.route("/open")
+        def open_route():
+            return {"status": "ok"}
+        
+        assert client.get("/open").status_code == 200
+        assert len(limiter.check_calls) == 1
     
-    def test_retry_after_header(self):
-        app = Flask(__name__)
+    def test_retry_after_header(self, app, client):
         limiter = MockRateLimiter(should_allow=False, state={
             'allowed': False,
             'remaining': 0,
@@ -167,14 +239,12 @@ class TestFlaskRateLimiter:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/test")
-            assert response.status_code == 429
-            assert "Retry-After" in response.headers
-            assert response.headers["Retry-After"] == "30"
+        response = client.get("/test")
+        assert response.status_code == 429
+        assert "Retry-After" in response.headers
+        assert response.headers["Retry-After"] == "30"
     
-    def test_rate_limit_headers(self):
-        app = Flask(__name__)
+    def test_rate_limit_headers(self, app, client):
         limiter = MockRateLimiter(should_allow=False, state={
             'allowed': False,
             'remaining': 0,
@@ -188,18 +258,15 @@ class TestFlaskRateLimiter:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/test")
-            assert "X-RateLimit-Limit" in response.headers
-            assert "X-RateLimit-Remaining" in response.headers
-            assert response.headers["X-RateLimit-Limit"] == "100"
-            assert response.headers["X-RateLimit-Remaining"] == "0"
+        response = client.get("/test")
+        assert "X-RateLimit-Limit" in response.headers
+        assert "X-RateLimit-Remaining" in response.headers
+        assert response.headers["X-RateLimit-Limit"] == "100"
+        assert response.headers["X-RateLimit-Remaining"] == "0"
 
 
-@pytest.mark.skipif(not FLASK_AVAILABLE, reason="Flask not installed")
 class TestFlaskStandaloneDecorator:
-    def test_standalone_decorator_allows(self):
-        app = Flask(__name__)
+    def test_standalone_decorator_allows(self, app, client):
         limiter = MockRateLimiter(should_allow=True)
         
         @app.route("/test")
@@ -207,12 +274,10 @@ class TestFlaskStandaloneDecorator:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/test")
-            assert response.status_code == 200
+        response = client.get("/test")
+        assert response.status_code == 200
     
-    def test_standalone_decorator_blocks(self):
-        app = Flask(__name__)
+    def test_standalone_decorator_blocks(self, app, client):
         limiter = MockRateLimiter(should_allow=False)
         
         @app.route("/test")
@@ -220,12 +285,10 @@ class TestFlaskStandaloneDecorator:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/test")
-            assert response.status_code == 429
+        response = client.get("/test")
+        assert response.status_code == 429
     
-    def test_standalone_with_custom_key(self):
-        app = Flask(__name__)
+    def test_standalone_with_custom_key(self, app, client):
         limiter = MockRateLimiter(should_allow=True)
         
         @app.route("/test")
@@ -233,7 +296,6 @@ class TestFlaskStandaloneDecorator:
         def test_route():
             return {"status": "ok"}
         
-        with app.test_client() as client:
-            response = client.get("/test")
-            assert response.status_code == 200
-            assert len(limiter.check_calls) > 0
\ No newline at end of file
+        response = client.get("/test")
+        assert response.status_code == 200
+        assert len(limiter.check_calls) > 0
\ No newline at end of file
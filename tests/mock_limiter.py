@@ -1,3 +1,4 @@
+from collections import deque
 from datetime import datetime, timedelta
 from ratelink.core.types import RateLimitState
 
@@ -5,7 +6,17 @@ from ratelink.core.types import RateLimitState
 class MockRateLimiter:    
     def __init__(self, should_allow=True, state=None):
         self.should_allow = should_allow
-        if state is not None:
+        if isinstance(state, dict):
+            # Legacy dict states are normalised to the slotted RateLimitState the integrations read.
+            allowed = state.get('allowed', should_allow)
+            self._state = RateLimitState(
+                limit=state['limit'],
+                remaining=state['remaining'],
+                reset_at=datetime.now() + timedelta(seconds=state.get('reset_after', 60)),
+                retry_after=state.get('retry_after', 0.0),
+                violated=not allowed,
+            )
+        elif state is not None:
             self._state = state
         else:
             self._state = RateLimitState(
@@ -15,15 +26,18 @@ class MockRateLimiter:
                 retry_after=0.0 if should_allow else 30.0,
                 violated=not should_allow,
             )
-        self.check_calls = []
+        self.check_calls = deque(maxlen=4096)
     
     def check(self, key, weight=1):
         self.check_calls.append((key, weight))
         return self._state
     
+    def fast_deny(self, key, weight=1):
+        return None if self.should_allow else self._state
+    
     def allow(self, key, weight=1):
         self.check_calls.append((key, weight))
         return self.should_allow
     
     def reset(self):
-        self.check_calls = []
\ No newline at end of file
+        self.check_calls.clear()
\ No newline at end of file
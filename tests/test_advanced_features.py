@@ -1,8 +1,9 @@
 import pytest
+import threading
 import time
 from ratelink.priority_limiter import PriorityRateLimiter
 from ratelink.quota_pool import QuotaPool, SharedQuotaManager
-from ratelink.adaptive_limiter import AdaptiveRateLimiter
+from ratelink.adaptive_limiter import AdaptiveRateLimiter, _ADJUSTER
 from ratelink.algorithms.hierarchical import (
     HierarchicalTokenBucket,
     FairQueueingAlgorithm
@@ -51,6 +52,30 @@ class TestPriorityRateLimiter:
         for _ in range(1000):
             assert limiter.allow("user:bob", tier="enterprise")
 
+    def test_tuple_key_shares_usage_with_joined_key(self):
+        limiter = PriorityRateLimiter(
+            tiers={"free": {"requests_per_minute": 2}},
+            backend="memory"
+        )
+        assert limiter.allow(("ip:10.0.0.1", "route:/api"), tier="free")
+        assert limiter.allow("ip:10.0.0.1:route:/api", tier="free")
+        assert not limiter.allow(("ip:10.0.0.1", "route:/api"), tier="free")
+        assert limiter.check(("ip:10.0.0.1", "route:/api"), tier="free").remaining == 0
+
+    def test_tier_limiter_changes_apply(self):
+        limiter = PriorityRateLimiter(
+            tiers={"free": {"requests_per_minute": 5}},
+            backend="memory"
+        )
+        limiter._limiters["free"].reconfigure(limit=1)
+        allowed = []
+        limiter._limiters["free"].register_hook(
+            "on_allow", lambda key, weight, state: allowed.append(key)
+        )
+        assert limiter.allow("user:ivy", tier="free")
+        assert not limiter.allow("user:ivy", tier="free")
+        assert allowed == ["free:user:ivy"]
+
     def test_different_tier_algorithms(self):
         limiter = PriorityRateLimiter(
             tiers={
@@ -84,6 +109,22 @@ class TestPriorityRateLimiter:
         state = limiter.check(user, tier="pro")
         assert state.remaining > 900
 
+    def test_tier_upgrade_preserves_usage(self):
+        limiter = PriorityRateLimiter(
+            tiers={
+                "free": {"requests_per_hour": 100},
+                "pro": {"requests_per_hour": 1000},
+                "enterprise": {"requests_per_hour": None},
+            },
+            backend="memory"
+        )
+        user = "user:zoe"
+        limiter.allow(user, tier="free", weight=10)
+        limiter.upgrade_tier(user, "free", "pro", preserve_state=True)
+        assert limiter.check(user, tier="pro").remaining == 900
+        assert limiter.check(user, tier="free").remaining == 100
+        assert limiter.check(user, tier="enterprise").metadata["unlimited"]
+
     def test_tier_check(self):
         limiter = PriorityRateLimiter(
             tiers={
@@ -192,6 +233,66 @@ class TestQuotaPool:
         assert pool.get_member_usage("alice") == 10
         assert pool.get_member_usage("bob") == 20
 
+    def test_concurrent_members_share_pool_total(self, run_concurrently):
+        pool = QuotaPool(
+            pool_id="team:busy",
+            total_quota=100,
+            window=3600,
+            backend="memory",
+            fair_share=False,
+            max_per_member=15
+        )
+
+        def consume():
+            return pool.consume(f"user:{threading.get_ident()}")
+
+        results = run_concurrently(consume, threads=8, calls=20)
+        assert sum(results) == 100
+        assert pool._member_count() == len(pool.list_members())
+        assert sum(pool.get_stats()["member_usage"].values()) == 100
+        assert all(pool.get_member_usage(m) <= 15 for m in pool.list_members())
+
+    @pytest.mark.parametrize("fair_share,max_per_member", [(False, 35), (True, None)])
+    def test_consume_batch_matches_sequential(self, fair_share, max_per_member):
+        def make_pool(pool_id):
+            return QuotaPool(
+                pool_id=pool_id,
+                total_quota=100,
+                window=3600,
+                backend="memory",
+                fair_share=fair_share,
+                max_per_member=max_per_member
+            )
+
+        sequential = make_pool("team:seq")
+        batched = make_pool("team:batch")
+        for member in ("alice", "bob", "carol"):
+            expected = sum(sequential.consume(member, weight=10) for _ in range(5))
+            assert batched.consume_batch(member, weight=10, count=5) == expected
+        assert batched.get_stats()["member_usage"] == sequential.get_stats()["member_usage"]
+
+    def test_remove_member_keeps_other_usage(self):
+        pool = QuotaPool(
+            pool_id="team:churn",
+            total_quota=1000,
+            window=60,
+            backend="memory",
+            fair_share=False
+        )
+        for i in range(20):
+            assert pool.consume(f"user:{i}", weight=i + 1)
+        pool.remove_member("user:3")
+        pool.remove_member("user:19")
+        assert "user:3" not in pool.list_members()
+        assert pool.get_member_usage("user:3") == 0
+        assert pool.get_stats()["member_usage"] == {
+            f"user:{i}": i + 1 for i in range(19) if i != 3
+        }
+        pool.remove_member("user:3")
+        assert pool._member_count() == 18
+        pool.reset()
+        assert pool._member_count() == 0
+
     def test_pool_reset(self):
         pool = QuotaPool(
             pool_id="team:reset",
@@ -225,6 +326,27 @@ class TestSharedQuotaManager:
         assert manager.consume("team:test", "alice", weight=10)
         assert manager.consume("team:test", "bob", weight=20)
 
+    def test_consume_by_handle(self):
+        manager = SharedQuotaManager(backend="memory")
+        handle = manager.register_pool("team:fast", total_quota=100, window=60, fair_share=False)
+        assert manager.get_handle("team:fast") == handle
+        assert manager.consume_by_handle(handle, "alice", weight=60)
+        assert not manager.consume_by_handle(handle, "bob", weight=60)
+        manager.delete_pool("team:fast")
+        with pytest.raises(ConfigError):
+            manager.consume_by_handle(handle, "alice")
+
+    def test_deleted_slots_are_reused(self):
+        manager = SharedQuotaManager(backend="memory")
+        stale = manager.register_pool("team:a", total_quota=10, window=60)
+        manager.delete_pool("team:a")
+        handle = manager.register_pool("team:b", total_quota=10, window=60)
+        assert len(manager._pool_array) == 1
+        assert handle != stale
+        assert manager.consume_by_handle(handle, "alice")
+        with pytest.raises(ConfigError):
+            manager.consume_by_handle(stale, "alice")
+
     def test_get_pool(self):
         manager = SharedQuotaManager(backend="memory")
         manager.create_pool("team:dev", total_quota=100, window=60)
@@ -263,6 +385,50 @@ class TestAdaptiveRateLimiter:
         limiter.allow("user:test2")
         metrics = limiter.get_metrics()
 
+    def test_background_adjustment(self):
+        limiter = AdaptiveRateLimiter(
+            base_limit=1000,
+            window=60,
+            backend="memory",
+            error_threshold=0.2,
+            check_interval=0.05
+        )
+        with limiter:
+            for _ in range(20):
+                limiter.record_error()
+            deadline = time.time() + 2
+            while limiter.current_limit == 1000 and time.time() < deadline:
+                time.sleep(0.01)
+            assert limiter.current_limit < 1000
+            assert limiter.get_metrics()["total_errors"] == 20
+        assert limiter not in _ADJUSTER._limiters
+
+    def test_instances_share_one_adjuster_thread(self):
+        before = {t for t in threading.enumerate() if t.name == "ratelink-adaptive"}
+        limiters = [
+            AdaptiveRateLimiter(base_limit=100, window=60, backend="memory")
+            for _ in range(20)
+        ]
+        try:
+            running = {t for t in threading.enumerate() if t.name == "ratelink-adaptive"}
+            assert len(running - before) <= 1
+        finally:
+            for limiter in limiters:
+                limiter.close()
+
+    def test_counters_fold_finished_threads(self):
+        with AdaptiveRateLimiter(base_limit=100, window=60, backend="memory") as limiter:
+            workers = [
+                threading.Thread(target=lambda: [limiter.allow("user:t") for _ in range(5)])
+                for _ in range(8)
+            ]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            assert limiter.get_metrics()["total_requests"] == 40
+            assert limiter._total_requests._cells == []
+
     def test_success_tracking(self):
         limiter = AdaptiveRateLimiter(
             base_limit=100,
@@ -287,6 +453,24 @@ class TestAdaptiveRateLimiter:
         metrics = limiter.get_metrics()
         assert metrics["avg_latency"] > 0
 
+    def test_latency_average_is_bounded_ewma(self):
+        limiter = AdaptiveRateLimiter(
+            base_limit=100,
+            window=60,
+            backend="memory",
+            window_size=10
+        )
+        try:
+            for _ in range(1000):
+                limiter.record_success(latency=0.25)
+            assert limiter.get_metrics()["avg_latency"] == 0.25
+            limiter.record_success(latency=1.35)
+            assert limiter.get_metrics()["avg_latency"] == pytest.approx(0.45, abs=1e-4)
+            limiter.reset()
+            assert limiter.get_metrics()["avg_latency"] == 0.0
+        finally:
+            limiter.close()
+
     def test_threshold_updates(self):
         limiter = AdaptiveRateLimiter(
             base_limit=100,
@@ -374,6 +558,62 @@ class TestHierarchicalTokenBucket:
         assert "tenant_remaining" in state.metadata
         assert "user_remaining" in state.metadata
 
+    def test_integer_refill_is_exact(self, monkeypatch, fake_clock):
+        monkeypatch.setattr("ratelink.algorithms.hierarchical.time.monotonic_ns", fake_clock.now_ns)
+        htb = HierarchicalTokenBucket(
+            global_limit=1000,
+            tenant_limit=100,
+            user_limit=10,
+            refill_rate=5
+        )
+
+        assert htb.allow("user:exact", weight=10)[0]
+        fake_clock.advance(0.199999999)
+        assert not htb.allow("user:exact")[0]
+        fake_clock.advance(0.000000001)
+        allowed, state = htb.allow("user:exact")
+        assert allowed
+        assert state.remaining == 0
+        assert htb._user_buckets["user:exact"][0] == 0
+        assert state.metadata["user_remaining"] == 0
+        assert state.metadata["global_remaining"] == 990
+
+    def test_fractional_refill_is_exact(self, monkeypatch, fake_clock):
+        monkeypatch.setattr("ratelink.algorithms.hierarchical.time.monotonic_ns", fake_clock.now_ns)
+        htb = HierarchicalTokenBucket(
+            global_limit=1000,
+            tenant_limit=100,
+            user_limit=10,
+            refill_rate=2.5
+        )
+
+        assert htb.allow("user:exact", weight=10)[0]
+        fake_clock.advance(0.399999999)
+        assert not htb.allow("user:exact")[0]
+        fake_clock.advance(0.000000001)
+        allowed, state = htb.allow("user:exact")
+        assert allowed
+        assert state.remaining == 0
+        assert htb._user_buckets["user:exact"] == (0, fake_clock.now_ns())
+        assert isinstance(htb._user_buckets["user:exact"][0], int)
+
+    def test_denial_level_reported(self):
+        htb = HierarchicalTokenBucket(
+            global_limit=1000,
+            tenant_limit=3,
+            user_limit=100,
+            refill_rate=0.001
+        )
+
+        for i in range(3):
+            allowed, _ = htb.allow(f"user:{i}", tenant="acme")
+            assert allowed
+
+        allowed, state = htb.allow("user:3", tenant="acme")
+        assert not allowed
+        assert state.metadata["denied_at_level"] == "tenant:acme"
+        assert htb.check("user:3").metadata["global_remaining"] == 997
+
 
 class TestFairQueueingAlgorithm:
     def test_fair_queuing_creation(self):
@@ -418,6 +658,33 @@ class TestFairQueueingAlgorithm:
             if allowed:
                 allowed_regular += 1
 
+    def test_weight_class_resolution(self):
+        fq = FairQueueingAlgorithm(
+            global_limit=10,
+            window_seconds=60,
+            weights={"default": 0.5, "premium": 2.0}
+        )
+
+        _, state = fq.allow("user:a")
+        assert state.limit == 5
+        _, state = fq.allow("user:b", weight_class="premium")
+        assert state.limit == 20
+        _, state = fq.allow("user:c", weight_class="unknown")
+        assert state.limit == 5
+
+    def test_window_expiry_and_key_reset(self, monkeypatch, fake_clock):
+        monkeypatch.setattr("ratelink.algorithms.hierarchical.time.monotonic_ns", fake_clock.now_ns)
+        fq = FairQueueingAlgorithm(global_limit=4, window_seconds=10)
+
+        assert [fq.allow("user:a")[0] for _ in range(5)] == [True] * 4 + [False]
+        fq.reset("user:a")
+        assert fq.allow("user:b")[0]
+
+        fake_clock.advance(11)
+        state = fq.check("user:b")
+        assert state.limit == 4
+        assert state.remaining == 4
+
     def test_max_per_key_enforcement(self):
         fq = FairQueueingAlgorithm(
             global_limit=1000,
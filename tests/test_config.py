@@ -1,3 +1,4 @@
+import io
 import pytest
 import tempfile
 import os
@@ -59,15 +60,16 @@ rate_limiting:
   }
 }"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write(json_content)
-            temp_path = f.name
-        
-        try:
-            config = loader.load(temp_path)
-            assert config["rate_limiting"]["default"]["algorithm"] == "sliding_window"
-        finally:
-            os.unlink(temp_path)
+        config = loader.loads(json_content, fmt="json")
+        assert config["rate_limiting"]["default"]["algorithm"] == "sliding_window"
+
+    def test_load_from_file_object(self):
+        loader = ConfigLoader()
+        stream = io.BytesIO(b"rate_limiting:\n  default:\n    limit: 250\n    window: hour\n")
+        stream.name = "limits.yml"
+
+        config = loader.load(stream)
+        assert config["rate_limiting"]["default"]["limit"] == 250
 
     def test_load_from_env(self):
         loader = ConfigLoader()
@@ -86,6 +88,48 @@ rate_limiting:
             for key in ["RATELINK_ALGORITHM", "RATELINK_BACKEND", "RATELINK_LIMIT", "RATELINK_WINDOW"]:
                 os.environ.pop(key, None)
 
+    def test_load_from_env_backend_options(self, monkeypatch):
+        monkeypatch.setenv("APP_LIMIT", "50")
+        monkeypatch.setenv("APP_BACKEND", "redis")
+        monkeypatch.setenv("APP_BACKEND_HOST", "cache.local")
+        monkeypatch.setenv("APP_UNKNOWN", "ignored")
+
+        default = ConfigLoader().load_from_env(prefix="APP_")["rate_limiting"]["default"]
+        assert default["limit"] == 50
+        assert default["backend"] == "redis"
+        assert default["backend_options"] == {"host": "cache.local"}
+
+    def test_load_from_env_cache_invalidated_on_change(self, monkeypatch):
+        monkeypatch.setenv("ENVCACHE_LIMIT", "50")
+        loader = ConfigLoader()
+        config = loader.load_from_env(prefix="ENVCACHE_")
+        config["rate_limiting"]["default"]["limit"] = 1
+        assert loader.load_from_env(prefix="ENVCACHE_")["rate_limiting"]["default"]["limit"] == 50
+
+        monkeypatch.setenv("ENVCACHE_LIMIT", "75")
+        assert loader.load_from_env(prefix="ENVCACHE_")["rate_limiting"]["default"]["limit"] == 75
+
+    def test_file_cache_invalidated_on_change(self):
+        loader = ConfigLoader()
+        content = "rate_limiting:\n  default:\n    limit: {}\n    window: hour\n"
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write(content.format(1000))
+            temp_path = f.name
+
+        try:
+            config = loader.load(temp_path)
+            config["rate_limiting"]["default"]["limit"] = 1
+            assert ConfigLoader().load(temp_path)["rate_limiting"]["default"]["limit"] == 1000
+
+            mtime_ns = os.stat(temp_path).st_mtime_ns
+            with open(temp_path, 'w') as f:
+                f.write(content.format(2000))
+            os.utime(temp_path, ns=(mtime_ns + 1_000_000, mtime_ns + 1_000_000))
+            assert loader.load(temp_path)["rate_limiting"]["default"]["limit"] == 2000
+        finally:
+            os.unlink(temp_path)
+
     def test_invalid_yaml(self):
         loader = ConfigLoader()
         
@@ -96,14 +140,8 @@ rate_limiting:
     - yaml: structure
 """
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(invalid_yaml)
-            temp_path = f.name
-        try:
-            with pytest.raises(ConfigError):
-                loader.load(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ConfigError):
+            loader.loads(invalid_yaml, fmt="yaml")
 
     def test_file_not_found(self):
         loader = ConfigLoader()
@@ -112,14 +150,10 @@ rate_limiting:
 
     def test_unsupported_format(self):
         loader = ConfigLoader()
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write("some content")
-            temp_path = f.name
-        try:
-            with pytest.raises(ConfigError):
-                loader.load(temp_path)
-        finally:
-            os.unlink(temp_path)
+        with pytest.raises(ConfigError):
+            loader.loads("some content", fmt="txt")
+        with pytest.raises(ConfigError):
+            loader.load(io.StringIO("some content"))
 
 
 class TestRateLimiterFromConfig:
@@ -186,6 +220,12 @@ rate_limiting:
         }
         limiter = RateLimiter.from_config(config)
         assert limiter._full_config["rate_limiting"]["endpoints"]["/api/search"]["limit"] == 100
+        with pytest.raises(TypeError):
+            limiter._full_config["rate_limiting"]["endpoints"]["/api/search"]["limit"] = 1
+        engine = RuleEngine(limiter._full_config)
+        assert engine.get_limit_for_endpoint("/api/search", 1000, "hour") == (100, "minute")
+        assert limiter._rules.resolve_endpoint("/api/search").window_seconds == 60
+        assert limiter._rules.resolve_endpoint("/api/other").limit == 1000
 
     def test_from_config_with_users(self):
         config = {
@@ -211,6 +251,34 @@ rate_limiting:
         limiter = RateLimiter.from_config(config)
         assert limiter._full_config["rate_limiting"]["users"]["free"]["limit"] == 100
 
+    def test_identical_dict_configs_share_validation(self):
+        config = {"rate_limiting": {"default": {"algorithm": "fixed_window", "limit": 1, "window": 60}}}
+        first = RateLimiter.from_config(config)
+        second = RateLimiter.from_config({"rate_limiting": {"default": dict(config["rate_limiting"]["default"])}})
+        assert first._full_config is second._full_config
+        assert first.allow("k")
+        assert second.allow("k")
+
+        config["rate_limiting"]["default"]["limit"] = 5
+        assert RateLimiter.from_config(config).limit == 5
+
+    def test_reload_swaps_config_snapshot(self, tmp_path):
+        path = tmp_path / "limits.json"
+        path.write_text('{"rate_limiting": {"default": {"limit": 10, "window": 60},'
+                        ' "endpoints": {"/a": {"limit": 5, "window": "minute"}}}}')
+        limiter = RateLimiter.from_config(str(path), watch=False)
+        version, old_config, old_rules = limiter._config_ref
+        assert old_rules.get_limit_for_endpoint("/a", 10, 60) == (5, "minute")
+
+        path.write_text('{"rate_limiting": {"default": {"limit": 20, "window": 60},'
+                        ' "endpoints": {"/a": {"limit": 7, "window": "minute"}}}}')
+        os.utime(path, ns=(0, 10**9))
+        limiter._reload_config(str(path))
+        assert limiter._config_ref[0] == version + 1
+        assert limiter._rules.get_limit_for_endpoint("/a", 20, 60) == (7, "minute")
+        assert old_config["rate_limiting"]["default"]["limit"] == 10
+        assert limiter.limit == 20
+
 
 class TestRuleEngine:
     def test_get_limit_for_endpoint(self):
@@ -272,6 +340,20 @@ class TestRuleEngine:
         assert limit is None
         assert window == "hour"
 
+    def test_compiled_rules(self):
+        config = {
+            "rate_limiting": {
+                "endpoints": {"/api/search": {"limit": 50, "window": "minute"}},
+                "users": {"free": {"limit": 100}, "pro": {"window": 30}},
+            }
+        }
+        engine = RuleEngine(config)
+        rule = engine.get_rule("endpoint:/api/search")
+        assert (rule.limit, rule.window_seconds) == (50, 60)
+        assert engine.get_rule("endpoint:/api/other") is None
+        assert engine.get_limit_for_user("free", 1000, "day") == (100, "day")
+        assert engine.get_limit_for_user("pro", 1000, "day") == (1000, 30)
+
     def test_get_limit_for_time(self):
         from datetime import time as datetime_time
         config = {
@@ -307,6 +389,9 @@ class TestRuleEngine:
         assert result is not None
         limit, window = result
         assert limit == 500
+        assert engine.get_limit_for_time("/api/data", datetime_time(17, 0)) == (100, "minute")
+        assert engine.get_limit_for_time("/api/data", datetime_time(17, 0, 1)) == (500, "hour")
+        assert engine.get_limit_for_time("/api/missing", datetime_time(10, 0)) is None
 
     def test_time_range_crossing_midnight(self):
         from datetime import time as datetime_time
@@ -367,5 +452,8 @@ class TestConfigValidation:
                     limit=100,
                     window="hour"
                 )
+            for bad in ("12:60", "1200", "noon"):
+                with pytest.raises(ValidationError):
+                    TimeRangeConfig(start=bad, end="17:00", limit=100, window="hour")
         except ImportError:
             pytest.skip("Pydantic not installed")
\ No newline at end of file
@@ -122,6 +122,33 @@ class TestRateLimiterBasic:
         allowed = await limiter.acquire("test:async")
         assert allowed is True
 
+    @pytest.mark.asyncio
+    async def test_acquire_awaits_native_async_algorithm(self):
+        from ratelink.algorithms.token_bucket import TokenBucketAlgorithm
+
+        class AsyncBucket(TokenBucketAlgorithm):
+            awaited = 0
+
+            async def acquire_async(self, key, weight=1):
+                self.awaited += 1
+                return self.allow(key, weight)
+
+        algorithm = AsyncBucket(capacity=10, refill_rate=1)
+        limiter = RateLimiter(algorithm=algorithm, backend="memory", limit=10, window=10)
+        assert await limiter.acquire("test:native") is True
+        assert algorithm.awaited == 1
+        assert not AsyncBucket.acquire_is_allow
+
+        class SyncBucket(TokenBucketAlgorithm):
+            def allow(self, key, weight=1):
+                return super().allow(key, weight)
+
+        assert SyncBucket.acquire_is_allow
+
+        fast = RateLimiter(algorithm="token_bucket", backend="memory", limit=10, window=10)
+        assert await fast.acquire("test:native") is True
+        assert fast.check("test:native").remaining == 9
+
     @pytest.mark.asyncio
     async def test_async_check(self):
         limiter = RateLimiter(
@@ -267,6 +294,23 @@ class TestRateLimiterHooks:
         limiter.allow("test:before", weight=5)
         assert ("test:before", 5) in checks
 
+    def test_failing_hook_does_not_stop_others(self):
+        limiter = RateLimiter(
+            algorithm="token_bucket",
+            backend="memory",
+            limit=100,
+            window=60
+        )
+        calls = []
+        def failing(key, weight, state):
+            calls.append("failing")
+            raise RuntimeError("boom")
+        limiter.register_hook("after_check", failing)
+        assert limiter.allow("test:hooks")
+        limiter.register_hook("after_check", lambda key, weight, state: calls.append("second"))
+        assert limiter.allow("test:hooks")
+        assert calls == ["failing", "failing", "second"]
+
     def test_invalid_hook_event(self):
         limiter = RateLimiter(
             algorithm="token_bucket",
@@ -323,6 +367,62 @@ class TestRateLimiterConfiguration:
         limiter.reconfigure(raise_on_limit=True)
         assert limiter.raise_on_limit is True
 
+    def test_reconfigure_rebinds_allow(self):
+        limiter = RateLimiter(
+            algorithm="fixed_window",
+            backend="memory",
+            limit=1,
+            window=60
+        )
+        assert limiter.allow("test:rebind")
+        assert not limiter.allow("test:rebind")
+        limiter.reconfigure(limit=2)
+        assert limiter.allow("test:rebind")
+        limiter.reconfigure(raise_on_limit=True)
+        limiter.allow("test:rebind")
+        with pytest.raises(LimitExceeded):
+            limiter.allow("test:rebind")
+
+    def test_held_allow_sees_reconfigure_and_hooks(self):
+        limiter = RateLimiter(
+            algorithm="fixed_window",
+            backend="memory",
+            limit=5,
+            window=60
+        )
+        allow = limiter.allow
+        limiter.reconfigure(limit=1)
+        assert allow("test:held")
+        assert not allow("test:held")
+        denied = []
+        limiter.register_hook("on_deny", lambda key, weight, state: denied.append(key))
+        allow("test:held")
+        assert denied == ["test:held"]
+
+
+class TestRateLimiterBatch:
+    @pytest.mark.parametrize("algorithm", ["token_bucket", "fixed_window"])
+    def test_allow_many_matches_sequential(self, algorithm):
+        keys = ["a", "b", "a", "a", "b", "c"]
+        weights = [2, 1, 2, 2, 3, 1]
+        batched = RateLimiter(algorithm=algorithm, backend="memory", limit=5, window=3600)
+        sequential = RateLimiter(algorithm=algorithm, backend="memory", limit=5, window=3600)
+        assert batched.allow_many(keys, weights) == [
+            sequential.allow(key, weight) for key, weight in zip(keys, weights)
+        ]
+
+    def test_allow_many_runs_hooks(self):
+        limiter = RateLimiter(algorithm="token_bucket", backend="memory", limit=2, window=3600)
+        denied = []
+        limiter.register_hook("on_deny", lambda key, weight, state: denied.append(key))
+        assert limiter.allow_many(["k", "k", "k"]) == [True, True, False]
+        assert denied == ["k"]
+
+    def test_allow_many_length_mismatch(self):
+        limiter = RateLimiter(algorithm="token_bucket", backend="memory", limit=2, window=60)
+        with pytest.raises(ValueError):
+            limiter.allow_many(["a", "b"], [1])
+
 
 class TestRateLimiterWeight:
     def test_weighted_requests(self):
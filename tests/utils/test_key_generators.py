@@ -8,6 +8,7 @@ from ratelink.utils.key_generators import (
     by_session,
     by_user_id,
     composite_key,
+    composite_key_parts,
     custom_key,
 )
 
@@ -75,6 +76,44 @@ class TestByIP:
         key_gen = by_ip()
         
         assert key_gen(request) == "ip:unknown"
+    
+    def test_interned_key(self):
+        key_gen = by_ip()
+        first = key_gen(FakeRequest(client=FakeClient("192.168.1.1")))
+        second = key_gen(FakeRequest(client=FakeClient("192.168.1.1")))
+        
+        assert first == "ip:192.168.1.1"
+        assert first is second
+    
+    def test_intern_opt_out(self):
+        key_gen = by_ip(intern=False)
+        first = key_gen(FakeRequest(client=FakeClient("192.168.1.1")))
+        second = key_gen(FakeRequest(client=FakeClient("192.168.1.1")))
+        
+        assert first == second
+        assert first is not second
+    
+    def test_request_class_resolution(self):
+        class FrameworkRequest:
+            def __init__(self, client):
+                self._client = client
+
+            @property
+            def client(self):
+                return self._client
+
+        key_gen = by_ip()
+        assert key_gen(FrameworkRequest(FakeClient("10.0.0.1"))) == "ip:10.0.0.1"
+        assert key_gen(FrameworkRequest(FakeClient("10.0.0.2"))) == "ip:10.0.0.2"
+        assert key_gen(FrameworkRequest(None)) == "ip:unknown"
+        assert key_gen(FakeRequest(client=FakeClient("10.0.0.3"))) == "ip:10.0.0.3"
+        assert key_gen(FakeRequest(remote_addr="10.0.0.4")) == "ip:10.0.0.4"
+
+    def test_scope_key(self):
+        key_gen = by_ip()
+
+        assert key_gen.scope_key({"client": ("10.0.0.1", 5000)}) == "ip:10.0.0.1"
+        assert key_gen.scope_key({"client": None}) == "ip:unknown"
 
 
 class TestByUserID:
@@ -152,6 +191,19 @@ class TestByRoute:
         key_gen = by_route()
         
         assert key_gen(request) == "route:/admin/users/"
+    
+    def test_scope_key(self):
+        key_gen = by_route()
+        
+        assert key_gen.scope_key({"path": "/api/users"}) == "route:/api/users"
+
+    def test_route_not_interned_by_default(self):
+        key_gen = by_route()
+        first = key_gen(FakeRequest(path="/api/" + "x" * 3))
+        second = key_gen(FakeRequest(path="/api/" + "x" * 3))
+
+        assert first == second
+        assert first is not second
 
 
 class TestByEndpoint:
@@ -193,6 +245,46 @@ class TestCompositeKey:
         assert "route:/api/search" in result
         assert "apikey:abc" in result
 
+    def test_interned_only_when_all_parts_interned(self):
+        request = FakeRequest(
+            client=FakeClient("192.168.1.1"),
+            user=FakeUser(id=123),
+            path="/api/data"
+        )
+        interned = composite_key(by_ip(), by_route(intern=True))
+        assert interned(request) is interned(request)
+
+        mixed = composite_key(by_user_id(), by_route())
+        assert mixed(request) == "user:123:route:/api/data"
+        assert mixed(request) is not mixed(request)
+
+        forced = composite_key(by_user_id(), by_route(), intern=True)
+        assert forced(request) is forced(request)
+
+    def test_tuple_key(self):
+        from ratelink import RateLimiter
+        request = FakeRequest(
+            client=FakeClient("192.168.1.1"),
+            url=FakeURL("/api/data")
+        )
+        key_gen = composite_key_parts(by_ip(), by_route())
+
+        key = key_gen(request)
+        assert key == ("ip:192.168.1.1", "route:/api/data")
+        limiter = RateLimiter(algorithm="fixed_window", backend="memory", limit=1, window=60)
+        assert limiter.allow(key)
+        assert not limiter.allow(key_gen(request))
+
+    def test_tuple_key_joins_like_composite_key(self):
+        from ratelink.core.types import join_key
+        request = FakeRequest(
+            client=FakeClient("192.168.1.1"),
+            url=FakeURL("/api/data")
+        )
+        joined = composite_key(by_ip(), by_route())(request)
+        assert join_key(composite_key_parts(by_ip(), by_route())(request)) == joined
+        assert join_key(joined) is joined
+
 
 class TestBySession:
     